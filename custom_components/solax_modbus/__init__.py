@@ -3,13 +3,17 @@
 import asyncio
 
 # import importlib.util, sys
+import hashlib
 import importlib
 import json
 import logging
 import struct
 import time as _mtime
+from collections.abc import Awaitable, Coroutine, Iterable, Mapping, MutableMapping
+from contextlib import nullcontext
 from dataclasses import dataclass, replace
-from datetime import timedelta
+from datetime import datetime
+from itertools import pairwise
 from types import ModuleType, SimpleNamespace
 from typing import Any, cast
 
@@ -22,25 +26,23 @@ from homeassistant.const import (
     CONF_PORT,
     CONF_SCAN_INTERVAL,
     EVENT_HOMEASSISTANT_STOP,
-    PERCENTAGE,
     Platform,
-    UnitOfElectricCurrent,
-    UnitOfElectricPotential,
     UnitOfEnergy,
     UnitOfFrequency,
-    UnitOfPower,
     UnitOfTemperature,
     UnitOfTime,
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_call_at
 from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ConnectionException, ModbusException, ModbusIOException
 from pymodbus.framer import FramerType
 
+from .block_planner import MODBUS_MAX_READ_REGISTERS, BlockCostModel, BlockLimits, plan_blocks, readable_runs, replay_layout, transport_cost_model
+from .bus_scheduler import BUS_PRIORITY_BACKGROUND, BUS_PRIORITY_WRITE, PriorityBusLock, background_context, bus_priority
+from .computed_graph import ComputedNode, order_computed_sensors, trace_dependencies
 from .connection import (
     describe_modbus_connection,
     format_config_entry_names,
@@ -62,6 +64,7 @@ from .const import (
     CONF_MODBUS_ADDR,
     CONF_PLUGIN,
     CONF_SERIAL_PORT,
+    CONF_TCP_MAX_INFLIGHT,
     CONF_TCP_TYPE,
     CONF_TIME_OUT,
     DEFAULT_BAUDRATE,
@@ -69,6 +72,7 @@ from .const import (
     DEFAULT_MODBUS_ADDR,
     DEFAULT_PORT,
     DEFAULT_SERIAL_PORT,
+    DEFAULT_TCP_MAX_INFLIGHT,
     DEFAULT_TCP_TYPE,
     DEFAULT_TIME_OUT,
     DOMAIN,
@@ -82,15 +86,12 @@ from .const import (
     REGISTER_S32,
     REGISTER_STR,
     REGISTER_TYPE_WORDS,
-    REGISTER_U8H,
-    REGISTER_U8L,
     REGISTER_U16,
     REGISTER_U32,
     REGISTER_ULSB16MSB16,
     REGISTER_WORDS,
     SCAN_GROUP_AUTO,
     SCAN_GROUP_DEFAULT,
-    SLEEPMODE_LASTAWAKE,
     WRITE_MULTI_MODBUS,
     WRITE_SINGLE_MODBUS,
     PollOutcome,
@@ -128,19 +129,28 @@ from .const import (
 from .const import (
     WRITE_MULTISINGLE_MODBUS as WRITE_MULTISINGLE_MODBUS,
 )
+from .decode_plan import BlockDecodePlan, DecodePlan, compile_block_decode_plan, compile_decode_plan
+from .learned_store import LearnedDeviceStore
 from .modbus_transport import CoreModbusTransport, ModbusTransport, NativeModbusTransport, UnavailableModbusTransport
-from .pymodbus_compat import DataType, convert_from_registers, convert_to_registers, pymodbus_version_info
+from .pipelined_tcp import AsyncPipelinedTcpClient
+from .poll_scheduler import next_deadline, phase_offsets
+from .poll_snapshot import MISSING, PollSnapshot
+from .pymodbus_compat import DataType, convert_to_registers, pymodbus_version_info
+from .registry_cache import EntityRegistryCache
 from .sensor import SolaXModbusSensor
 from .serial_modbus import AsyncSerialModbusClient, SerialModbusError
 
 RETRIES = 1  # was 6 then 0, which worked also, but 1 is probably the safe choice
-INVALID_START = 99999
 VERBOSE_CYCLES = 20
 COMM_HISTORY_LIMIT = 100
 COMM_BLOCK_FAILURE_THRESHOLD = 3
 COMM_BLOCK_FAILURE_WINDOW = 600
 COMM_RECOVERY_INTERVAL = 300
+MODBUS_ILLEGAL_DATA_ADDRESS = 0x02  # exception code of a definitive "no such register" answer; isolated without waiting for repeats
+DISCOVERY_GAP_SPLIT_DEPTH = 3  # an unreadable gap is narrowed down to 1/8 of its width, the rest is marked as hole
+DISCOVERY_PROBE_ATTEMPTS = 2  # a failed discovery probe is repeated before the range counts as unreadable
 INFLIGHT_CANCEL_TIMEOUT = 2.0
+FULL_PUBLISH_INTERVAL = 300  # seconds; a device group publishes all its entities at least this often, changed or not
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -167,10 +177,10 @@ CONFIG_SCHEMA = vol.Schema(
 def empty_hub_interval_group_lambda() -> SimpleNamespace:
     return SimpleNamespace(
         interval=0,
-        unsub_interval_method=None,
         device_groups={},
-        poll_lock=asyncio.Lock(),
-        pending_rerun=False,
+        deadline=None,  # loop time of the next tick, maintained by the hub poll scheduler
+        poll_task=None,  # running poll of this group; ticks are skipped while it is active
+        missed_ticks=0,  # ticks skipped because the previous poll was still running
     )
 
 
@@ -182,6 +192,8 @@ def empty_hub_device_group_lambda() -> SimpleNamespace:
         readPreparation=None,  # function to call before read group
         readFollowUp=None,  # function to call after read group
         publish_updates=False,
+        changed_keys=None,  # data keys changed by the last committed poll, None publishes all entities
+        last_full_publish=None,  # monotonic time all entities of the group were last published
     )
 
 
@@ -195,21 +207,17 @@ def should_register_be_loaded(hass: HomeAssistant, hub: Any, descriptor: Any) ->
     unique_id = f"{hub._name}_{descriptor.key}"
     unique_id_alt = f"{hub._name}.{descriptor.key}"  # dont knnow why
     platforms = (Platform.SENSOR, Platform.SELECT, Platform.NUMBER, Platform.SWITCH, Platform.BUTTON, Platform.TIME)
-    registry = er.async_get(hass)
+    registry_cache = getattr(hub, "_registry_cache", None) or EntityRegistryCache()
     entity_found = False
     # First, check if there is an existing enabled entity in the registry for this unique_id.
     for platform in platforms:
-        entity_id = registry.async_get_entity_id(platform, DOMAIN, unique_id)
-        if entity_id:
-            _LOGGER.debug(f"{hub.name}: should be loaded: entity_id for {unique_id} on platform {platform} is now {entity_id}")
-        else:
-            entity_id = registry.async_get_entity_id(platform, DOMAIN, unique_id_alt)
-            _LOGGER.debug(f"{hub.name}: should be loaded: entity_id for alt {unique_id_alt} on platform {platform} is now {entity_id}")
-        if entity_id:
+        enabled = registry_cache.enabled(hass, platform, unique_id)
+        if enabled is None:
+            enabled = registry_cache.enabled(hass, platform, unique_id_alt)
+        if enabled is not None:
             entity_found = True
-            entity_entry = registry.async_get(entity_id)
-            if entity_entry and not entity_entry.disabled:
-                _LOGGER.debug(f"{hub.name}: should be loaded: Entity {entity_id} is enabled, returning True.")
+            if enabled:
+                _LOGGER.debug(f"{hub.name}: should be loaded: entity {unique_id} on platform {platform} is enabled, returning True.")
                 return True  # Found an enabled entity, no need to check further
     # If we get here, no enabled entity was found across all platforms.
     if entity_found:
@@ -306,8 +314,25 @@ async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
         if rec:
             domain_data.pop(name, None)
 
+    async def _svc_discover_block_limits(call: Any) -> None:
+        """Probe a hub's device for its read limits and rebuild the blocks with them."""
+        name = call.data.get("name")
+        if not name:
+            _LOGGER.warning("discover_block_limits service – missing 'name'")
+            return
+        rec = hass.data.get(DOMAIN, {}).get(name)
+        hub = rec.get("hub") if rec else None
+        if not hub:
+            _LOGGER.warning(f"{name}: discover_block_limits service – hub not found")
+            return
+        try:
+            await hub.async_discover_block_limits()
+        except Exception as ex:
+            _LOGGER.warning(f"{name}: discover_block_limits service – discovery failed: {ex}")
+
     hass.services.async_register(DOMAIN, "stop_all", _svc_stop_all)
     hass.services.async_register(DOMAIN, "stop_hub", _svc_stop_hub)
+    hass.services.async_register(DOMAIN, "discover_block_limits", _svc_discover_block_limits)
     # _LOGGER.debug("solax data %d", hass.data)
     return True
 
@@ -465,6 +490,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete what the hub of a removed entry learned about its device."""
+    try:
+        await LearnedDeviceStore(hass, entry.entry_id).async_remove()
+    except Exception as ex:
+        _LOGGER.warning(f"{entry.title}: cannot remove the learned device state: {ex}")
+
+
 def defaultIsAwake(datadict: dict[str, Any]) -> bool:
     return True
 
@@ -483,6 +516,7 @@ class block:
     # order32: int = None # word endian for 32bit registers
     descriptions: Any = None
     regs: Any = None  # sorted list of registers used in this block
+    decode_plan: Any = None  # BlockDecodePlan when the whole block can be decoded in one pass
 
 
 @dataclass(frozen=True)
@@ -536,6 +570,7 @@ class SolaXModbusHub:
         serial_port = config.get(CONF_SERIAL_PORT, DEFAULT_SERIAL_PORT)
         baudrate = int(config.get(CONF_BAUDRATE, DEFAULT_BAUDRATE))
         time_out = int(config.get(CONF_TIME_OUT, DEFAULT_TIME_OUT))
+        tcp_max_inflight = int(config.get(CONF_TCP_MAX_INFLIGHT, DEFAULT_TCP_MAX_INFLIGHT))
         _LOGGER.debug(f"Setup {DOMAIN}.{name}")
         _LOGGER.debug(f"solax serial port {serial_port} interface {interface}")
 
@@ -545,6 +580,7 @@ class SolaXModbusHub:
         # explicit init for stop flag
         self._stopping = False
         self._transport: ModbusTransport
+        self._pipelined_reads = False  # reads bypass self._lock and may be in flight concurrently
         if interface == "serial":
             self._transport = NativeModbusTransport(
                 AsyncSerialModbusClient(
@@ -562,6 +598,9 @@ class SolaXModbusHub:
                 client = AsyncModbusTcpClient(host=host, port=port, timeout=time_out, framer=FramerType.RTU, retries=RETRIES)
             elif tcp_type == "ascii":
                 client = AsyncModbusTcpClient(host=host, port=port, timeout=time_out, framer=FramerType.ASCII, retries=RETRIES)
+            elif tcp_max_inflight > 1:
+                client = AsyncPipelinedTcpClient(host=host, port=port, timeout=time_out, max_inflight=tcp_max_inflight)
+                self._pipelined_reads = True
             else:
                 client = AsyncModbusTcpClient(host=host, port=port, timeout=time_out, retries=RETRIES)
             self._transport = NativeModbusTransport(client)
@@ -573,8 +612,9 @@ class SolaXModbusHub:
             )
         else:
             self._transport = UnavailableModbusTransport(interface)
-        self._lock = asyncio.Lock()
-        self._poll_data_lock = asyncio.Lock()
+        self._lock = PriorityBusLock()  # one request at a time, most urgent waiter first
+        self._poll_data_lock = PriorityBusLock()
+        self._poll_side_effect_lock = PriorityBusLock()  # hub-wide steps of a poll (local data, queued writes, autorepeat), once at a time
         self._name: str = name
         # following call will modify and extend client in case old modbus API needs to be used
         _LOGGER.debug(f"{name}: using pymodbus version {pymodbus_version_info()}")
@@ -587,6 +627,7 @@ class SolaXModbusHub:
         self.read_serial_port = serial_port
         self._baudrate = int(baudrate)
         self._time_out = int(time_out)
+        self.block_cost_model: BlockCostModel = transport_cost_model(interface, tcp_type, self._baudrate)
         self.groups: dict[Any, Any] = {}  # group info, below
         self.data: dict[str, Any] = {"_repeatUntil": {}}  # _repeatuntil contains button autorepeat expiry times
         self.tmpdata: dict[Any, Any] = {}  # for WRITE_DATA_LOCAL entities with corresponding prevent_update number/sensor
@@ -623,7 +664,12 @@ class SolaXModbusHub:
         self.inverter_model: str | None = None
         self._has_local_inverter_model: bool = False
         self.blocks_changed: bool = False
+        self._register_index: dict[tuple[str, int], Any] = {}  # (register type, address): description(s), see rebuild_blocks
+        self._stale_block_groups: set[tuple[Any, Any]] | None = set()  # (interval, device name) groups to rebuild; None: all
         self.initial_groups: dict[Any, Any] = {}  # as returned by the sensor setup - holdingRegs and inputRegs should not change
+        self._decode_plans: dict[int, DecodePlan] = {}  # id(descr) -> plan, compiled when blocks are built
+        self._computed_order: tuple[Any, tuple[ComputedNode, ...]] | None = None  # (signature, order) of computedSensors
+        self._computed_memo: dict[str, tuple[tuple[Any, ...], Any]] = {}  # key: (inputs, value) of memoized computed sensors
 
         # Track in-flight I/O tasks for fast cancellation on stop
         self._inflight_tasks: set[Any] = set()
@@ -632,9 +678,18 @@ class SolaXModbusHub:
         # entity base-addresses that are excluded from normal polling.
         self.bad_regs: dict[str, set[int]] = {"holding": set(), "input": set()}
         self.bisect_max_depth = 10  # safety cap to avoid pathological recursion
+        self.block_limits: dict[str, BlockLimits] = {}  # per register type, learned by async_discover_block_limits
         self._runtime_bisect_tasks: dict[str, asyncio.Task[Any]] = {}
         self._quarantine_recheck_task: asyncio.Task[Any] | None = None
+        self._learned_store: LearnedDeviceStore | None = None  # created once the device serial number is known
+        self._restored_bad_regs: dict[str, set[int]] = {"holding": set(), "input": set()}  # quarantined in an earlier run
+        self._restored_firmware: str | None = None  # firmware of the device when the restored state was saved
+        self._block_layouts: dict[str, list[list[int]]] = {}  # entity bases of each block, per _layout_key
+        self._restored_block_layouts: dict[str, list[list[int]]] = {}  # block layouts of an earlier run, reused while they fit
+        self._restored_block_limits: dict[str, BlockLimits] = {}  # block limits discovered in an earlier run
+        self._detection: dict[str, Any] | None = None  # inverter detection result, saved for the next start
         self._comm_block_failures: dict[str, list[float]] = {}
+        self._comm_block_successes: dict[str, tuple[str, float, list[int]]] = {}  # block key: (typ, time, entity bases)
         self._comm_last_block_success_time: float | None = None
         self._comm_last_block_failure_time: float | None = None
         self._comm_recent_outcomes: list[PollOutcome] = []
@@ -654,6 +709,12 @@ class SolaXModbusHub:
         self._initial_refresh_active: bool = False
         self._initial_refresh_done: bool = False
 
+        # One timer for all interval groups, armed at the earliest group deadline
+        self._poll_anchor: float | None = None  # loop time the phase grid of the interval groups starts at
+        self._unsub_poll_timer: Any = None
+
+        self._registry_cache = EntityRegistryCache()  # entity enablement lookups, cleared on entity registry changes
+
         # Deferred setup state
         self._platforms_forwarded = False
         self._deferred_setup_task: Any = None
@@ -678,12 +739,14 @@ class SolaXModbusHub:
         # Exit early if teardown requested
         if getattr(self, "_stopping", False):
             return
+        self._registry_cache.listen(self._hass)
 
         # Try to detect inverter type, but do not block setup indefinitely.
         # We allow up to ~15s for initial detection; afterwards we proceed with a generic setup
         # so that the integration is usable even with no device connected.
         deadline = _t.monotonic() + 15.0
         attempts = 0
+        await self._async_restore_detection()
         while self._invertertype in (None, 0) and not getattr(self, "_stopping", False):
             try:
                 await self.async_connect()
@@ -694,6 +757,7 @@ class SolaXModbusHub:
                 self._invertertype = await self.plugin.async_determineInverterType(self, self.config)
                 attempts += 1
                 if self._invertertype not in (None, 0):
+                    self._remember_detection()
                     break
             except Exception as ex:
                 _LOGGER.debug(f"{self._name}: inverter type detect attempt failed: {ex}")
@@ -735,6 +799,7 @@ class SolaXModbusHub:
         if getattr(self, "_stopping", False):
             _LOGGER.info(f"{self._name}: init aborted – stopping during init")
             return
+        await self._async_restore_learned_state()  # before the sensor platform builds the first blocks
 
         # Forward platforms for this config entry
         # Platforms should be unloaded before reload, so this should always succeed
@@ -756,6 +821,125 @@ class SolaXModbusHub:
 
         self._init_task = None
 
+    def _learned_device_store(self) -> LearnedDeviceStore:
+        if getattr(self, "_learned_store", None) is None:
+            self._learned_store = LearnedDeviceStore(self._hass, self.entry.entry_id)
+        return cast(LearnedDeviceStore, self._learned_store)
+
+    def _config_fingerprint(self) -> str:
+        """Hash of the config entry options; the detected inverter type depends on some of them (e.g. read_eps)."""
+        return hashlib.sha1(json.dumps(dict(self.config), sort_keys=True, default=str).encode()).hexdigest()
+
+    def _remember_detection(self) -> None:
+        self._detection = {
+            "plugin": self.config.get(CONF_PLUGIN),
+            "config": self._config_fingerprint(),
+            "invertertype": self._invertertype,
+            "inverter_model": self._get_inverter_model(),
+            "local_model": self._has_local_inverter_model,
+            "serial_address": getattr(self.plugin, "serial_address", None),
+        }
+
+    async def _async_restore_detection(self) -> bool:
+        """Take the inverter type detected in an earlier run if the plugin confirms the same inverter is connected."""
+        try:
+            detection = await self._learned_device_store().async_load_detection()
+            if detection is None or detection.get("plugin") != self.config.get(CONF_PLUGIN) or detection.get("config") != self._config_fingerprint():
+                return False
+            await self.async_connect()
+            await self._check_connection()
+            if not await self.plugin.async_confirmInverterType(
+                self, self.config, detection["invertertype"], detection["serial"], detection.get("serial_address")
+            ):
+                _LOGGER.info(f"{self._name}: inverter detected in an earlier run not confirmed; detecting the inverter type again")
+                return False
+        except Exception as ex:
+            _LOGGER.debug(f"{self._name}: cannot use the inverter detected in an earlier run: {ex}")
+            return False
+        self.seriesnumber = detection["serial"]
+        self._invertertype = detection["invertertype"]
+        self.plugin.inverter_model = detection.get("inverter_model")
+        self.plugin.serial_address = detection.get("serial_address")
+        if detection.get("local_model"):
+            self.inverter_model = detection.get("inverter_model")
+            self._has_local_inverter_model = True
+        self._remember_detection()
+        _LOGGER.info(f"{self._name}: confirmed inverter {self.seriesnumber} detected in an earlier run (type={self._invertertype})")
+        return True
+
+    async def _async_restore_learned_state(self) -> None:
+        """Take the quarantined registers, block layouts and block limits learned in earlier runs on this device, so they are not rediscovered."""
+        try:
+            stored = await self._learned_device_store().async_load(self.seriesnumber)
+        except Exception as ex:
+            _LOGGER.warning(f"{self._name}: cannot load learned device state: {ex}")
+            return
+        if stored is None:
+            return
+        for typ in ("holding", "input"):
+            restored = {int(addr) for addr in stored.get("bad_regs", {}).get(typ, [])} - self.bad_regs[typ]
+            self._restored_bad_regs[typ] = restored
+            self.bad_regs[typ] |= restored
+        self._restored_firmware = stored.get("firmware")
+        block_plans = stored.get("block_plans") or {}
+        if block_plans.get("plugin") == self.config.get(CONF_PLUGIN) and block_plans.get("invertertype") == self._invertertype:
+            self._restored_block_layouts = dict(block_plans.get("layouts", {}))
+            _LOGGER.debug(f"{self._name}: restored {len(self._restored_block_layouts)} block layout(s)")
+            for typ, limits in (block_plans.get("limits") or {}).items():
+                if typ not in self.block_limits:  # limits discovered in this run take precedence
+                    self._restored_block_limits[typ] = self.block_limits[typ] = BlockLimits(
+                        int(limits["max_registers"]), tuple(limits.get("holes", ()))
+                    )
+                    _LOGGER.debug(f"{self._name}: restored {typ} block limits: max {limits['max_registers']} registers")
+        if any(self._restored_bad_regs.values()):
+            labels = ", ".join(f"{typ} 0x{addr:x}" for typ, regs in self._restored_bad_regs.items() for addr in sorted(regs))
+            _LOGGER.info(f"{self._name}: restored quarantined Modbus register(s) of firmware {self._restored_firmware}: {labels}")
+            self._ensure_quarantine_recheck_task()
+
+    def _learned_state(self) -> dict[str, Any]:
+        return {
+            "serial": self.seriesnumber,
+            "firmware": self.plugin.getSoftwareVersion(self.data),
+            "bad_regs": {typ: sorted(regs) for typ, regs in self.bad_regs.items()},
+            "block_plans": {
+                "plugin": self.config.get(CONF_PLUGIN),
+                "invertertype": self._invertertype,
+                "layouts": dict(getattr(self, "_block_layouts", {})),
+                "limits": {
+                    typ: {"max_registers": limits.max_registers, "holes": list(limits.holes)}
+                    for typ, limits in getattr(self, "block_limits", {}).items()
+                },
+            },
+            "detection": getattr(self, "_detection", None),
+        }
+
+    def _save_learned_state(self) -> None:
+        store = getattr(self, "_learned_store", None)
+        if store is not None:
+            store.schedule_save(self._learned_state)
+
+    def _confirm_learned_state(self) -> None:
+        """Save what was learned once the initial refresh read the device; first drop the restored state if the firmware changed."""
+        if getattr(self, "_learned_store", None) is None:
+            return
+        restored_firmware = self._restored_firmware
+        firmware = self.plugin.getSoftwareVersion(self.data)
+        self._restored_firmware = None
+        if restored_firmware is not None and firmware is not None and firmware != restored_firmware:
+            _LOGGER.info(
+                f"{self._name}: firmware changed from {restored_firmware} to {firmware}; dropping the restored quarantine, block layouts and limits"
+            )
+            self._restored_block_layouts = {}
+            for typ, limits in self._restored_block_limits.items():
+                if self.block_limits.get(typ) is limits:  # not rediscovered since
+                    del self.block_limits[typ]
+            self._restored_block_limits = {}
+            for typ, restored in self._restored_bad_regs.items():
+                self.bad_regs[typ] -= restored
+                restored.clear()
+            self._invalidate_blocks()
+        self._save_learned_state()
+
     def _get_inverter_model(self) -> str | None:
         if self._has_local_inverter_model:
             return self.inverter_model
@@ -774,6 +958,7 @@ class SolaXModbusHub:
                 inv = await self.plugin.async_determineInverterType(self, self.config)
                 if inv not in (None, 0):
                     self._invertertype = inv
+                    self._remember_detection()
                     _LOGGER.debug(f"{self._name}: inverter detected during deferred setup (type={inv}) – forwarding platforms")
                     # Prepare/refresh device_info in case it wasn't set
                     device_name = self._name
@@ -790,6 +975,7 @@ class SolaXModbusHub:
                     )
                     if getattr(self, "_stopping", False):
                         return
+                    await self._async_restore_learned_state()
                     await self._hass.config_entries.async_forward_entry_setups(self.entry, PLATFORMS)
                     self._platforms_forwarded = True
                     self._start_initial_refresh_if_needed()
@@ -977,57 +1163,8 @@ class SolaXModbusHub:
         if not interval_group.device_groups:
             interval_group.interval = interval
 
-            async def _refresh(_now: Any = None) -> None:
-                secs = interval_group.interval
-                self._warn_duplicate_inverter_configuration(secs)
-                self.cyclecount += 1
-                cycle_id = self.cyclecount
-                _LOGGER.debug(f"{self._name}: [{secs}s] poll started – cycle #{cycle_id}")
-                # If a previous cycle is still running, mark a catch-up and return quickly.
-                if interval_group.poll_lock.locked():
-                    interval_group.pending_rerun = True
-                    _LOGGER.debug(f"{self._name}: [{secs}s] overrun – previous poll still running; scheduling immediate catch-up after it finishes")
-                    return
-
-                # Run cycles back-to-back if a tick was missed while running (catch-up mode)
-                while True:
-                    start = _mtime.monotonic()
-                    async with interval_group.poll_lock:
-                        outcome, updated_sensors = await self.async_refresh_modbus_data(interval_group, _now, cycle_id=cycle_id)
-                    elapsed = _mtime.monotonic() - start
-                    _LOGGER.debug(
-                        f"{self._name}: [{secs}s] poll finished – cycle #{cycle_id}, "
-                        f"duration={int(elapsed * 1000)} ms, outcome={outcome.value}, "
-                        f"sensors={updated_sensors}, slowdown={self.slowdown}"
-                    )
-                    self._record_poll_cycle(outcome, elapsed, interval_group.interval or secs)
-
-                    # If the configured interval is shorter than the actual run time, inform once per cycle
-                    if elapsed >= (interval_group.interval or 0):
-                        _LOGGER.debug(
-                            f"{self._name}: [{secs}s] interval too short – cycle took {elapsed:.3f}s ≥ interval {interval_group.interval}s; running at max possible speed"
-                        )
-
-                    # Immediate catch-up if a tick arrived during our run.
-                    # Only perform catch-up when the previous poll succeeded and did not consume
-                    # the complete interval; otherwise this creates an endless backlog.
-                    if getattr(interval_group, "pending_rerun", False):
-                        interval_group.pending_rerun = False
-                        if outcome.communication_succeeded and elapsed < (interval_group.interval or 0):
-                            # Loop again immediately (no sleep) to catch up once
-                            continue
-                        if outcome.communication_succeeded:
-                            _LOGGER.debug(f"{self._name}: dropping pending catch-up because the previous poll already consumed the interval")
-                        elif outcome is PollOutcome.SKIPPED:
-                            _LOGGER.debug(f"{self._name}: dropping pending catch-up because polling was skipped")
-                        else:
-                            _LOGGER.debug(f"{self._name}: dropping pending catch-up due to failed poll (slowdown={self.slowdown})")
-                        # Exit the loop; next attempt will occur per normal schedule/slowdown policy
-                        break
-                    break
-
-            _LOGGER.debug(f"{self._name}: starting timer loop for interval group: {interval}")
-            interval_group.unsub_interval_method = async_track_time_interval(self._hass, _refresh, timedelta(seconds=interval))
+            _LOGGER.debug(f"{self._name}: adding interval group {interval}s to the poll scheduler")
+            self._reschedule_interval_groups()
 
         # Defensive check: Skip sensors with no device_info (shouldn't happen normally)
         if sensor.device_info is None:
@@ -1042,7 +1179,7 @@ class SolaXModbusHub:
         grp = interval_group.device_groups.setdefault(device_key, empty_hub_device_group_lambda())
         _LOGGER.debug(f"{self._name}: adding sensor {sensor.entity_description.key} available: {sensor._attr_available} ")
         grp.sensors.append(sensor)
-        self.blocks_changed = True  # will force rebuild_blocks to be called
+        self._invalidate_blocks([(interval, device_key)])  # will force rebuild_blocks to be called for this group
 
     @callback
     async def async_remove_solax_modbus_sensor(self, sensor: Any) -> None:
@@ -1072,15 +1209,86 @@ class SolaXModbusHub:
             if not interval_group.device_groups:
                 # stop the interval timer upon removal of last device group from interval group
                 _LOGGER.debug(f"removing interval group {interval}")
-                interval_group.unsub_interval_method()
-                interval_group.unsub_interval_method = None
                 self.groups.pop(interval)
+                self._reschedule_interval_groups()
 
                 if not self.groups:
                     await self.async_close()
-        self.blocks_changed = True  # will force rebuild_blocks to be called
+        self._invalidate_blocks([(interval, device_key)])  # will force rebuild_blocks to be called for this group
+
+    def _reschedule_interval_groups(self) -> None:
+        """Align the deadlines of all interval groups to their phase after a group was added or removed."""
+        now = self._hass.loop.time()
+        if self._poll_anchor is None:
+            self._poll_anchor = now
+        offsets = phase_offsets(self.groups.keys())
+        for interval, interval_group in self.groups.items():
+            interval_group.deadline = next_deadline(self._poll_anchor, offsets[interval], interval, now)
+            _LOGGER.debug(f"{self._name}: [{interval}s] scheduled with phase offset {offsets[interval]:.2f}s")
+        self._arm_poll_timer()
+
+    def _arm_poll_timer(self) -> None:
+        """Arm the single hub timer for the earliest interval group deadline."""
+        if self._unsub_poll_timer is not None:
+            self._unsub_poll_timer()
+            self._unsub_poll_timer = None
+        deadlines = [interval_group.deadline for interval_group in self.groups.values() if interval_group.deadline is not None]
+        if deadlines and not getattr(self, "_stopping", False):
+            self._unsub_poll_timer = async_call_at(self._hass, self._on_poll_timer, min(deadlines))
 
-    async def async_refresh_modbus_data(self, interval_group: Any, _now: int | None = None, cycle_id: int | None = None) -> tuple[PollOutcome, int]:
+    @callback
+    def _on_poll_timer(self, _now: datetime) -> None:
+        """Start the polls of all interval groups that are due and re-arm the timer."""
+        self._unsub_poll_timer = None
+        now = self._hass.loop.time()
+        for interval_group in list(self.groups.values()):
+            if interval_group.deadline is not None and interval_group.deadline <= now:
+                self._start_interval_group_poll(interval_group, _now, now)
+        self._arm_poll_timer()
+
+    def _start_interval_group_poll(self, interval_group: Any, _now: datetime, now: float) -> None:
+        """Start the poll of a due interval group unless its previous poll overran, and advance its deadline."""
+        secs = interval_group.interval
+        running = interval_group.poll_task
+        if running is not None and not running.done():
+            interval_group.missed_ticks += 1
+            _LOGGER.debug(
+                f"{self._name}: [{secs}s] overrun – previous poll still running; skipping this tick ({interval_group.missed_ticks} skipped so far)"
+            )
+        else:
+            interval_group.poll_task = self._hass.loop.create_task(self._poll_interval_group(interval_group, _now))
+        # Deadlines stay on the phase grid; ticks that already passed are skipped, not caught up in a burst.
+        deadline = next_deadline(interval_group.deadline, 0.0, secs, now)
+        late_ticks = round((deadline - interval_group.deadline) / secs) - 1
+        if late_ticks > 0:
+            interval_group.missed_ticks += late_ticks
+            _LOGGER.debug(f"{self._name}: [{secs}s] scheduler ran late – skipping {late_ticks} missed tick(s)")
+        interval_group.deadline = deadline
+
+    async def _poll_interval_group(self, interval_group: Any, _now: datetime | None = None) -> None:
+        """Run one scheduled poll of an interval group."""
+        secs = interval_group.interval
+        self._warn_duplicate_inverter_configuration(secs)
+        self.cyclecount += 1
+        cycle_id = self.cyclecount
+        _LOGGER.debug(f"{self._name}: [{secs}s] poll started – cycle #{cycle_id}")
+        start = _mtime.monotonic()
+        outcome, updated_sensors = await self.async_refresh_modbus_data(interval_group, _now, cycle_id=cycle_id)
+        elapsed = _mtime.monotonic() - start
+        _LOGGER.debug(
+            f"{self._name}: [{secs}s] poll finished – cycle #{cycle_id}, "
+            f"duration={int(elapsed * 1000)} ms, outcome={outcome.value}, "
+            f"sensors={updated_sensors}, slowdown={self.slowdown}"
+        )
+        self._record_poll_cycle(outcome, elapsed, secs)
+        if elapsed >= secs:
+            _LOGGER.debug(
+                f"{self._name}: [{secs}s] interval too short – cycle took {elapsed:.3f}s ≥ interval {secs}s; ticks are skipped until it finishes"
+            )
+
+    async def async_refresh_modbus_data(
+        self, interval_group: Any, _now: datetime | None = None, cycle_id: int | None = None
+    ) -> tuple[PollOutcome, int]:
         """Time to update."""
         _LOGGER.debug(f"{self._name}: scan_group timer initiated refresh_modbus_data call - interval {interval_group.interval}")
         # self.cyclecount = self.cyclecount + 1  # Now incremented in _refresh
@@ -1101,19 +1309,21 @@ class SolaXModbusHub:
         if not interval_group.device_groups:
             return PollOutcome.SKIPPED, 0
         if self.blocks_changed:
-            self.rebuild_blocks(self.initial_groups)
+            self.rebuild_blocks(self.initial_groups, getattr(self, "_stale_block_groups", None))
         if not bypass_slowdown and (self.cyclecount % self.slowdown) != 0:
             return PollOutcome.SKIPPED, 0
 
         outcomes: list[PollOutcome] = []
         updated_sensors = 0
         for group in list(interval_group.device_groups.values()):
-            group_outcome = await self.async_read_modbus_data(group)
+            with bus_priority(interval_group.interval):  # faster interval groups get the bus first
+                group_outcome = await self.async_read_modbus_data(group)
             outcomes.append(group_outcome)
             if group_outcome.communication_succeeded and getattr(group, "publish_updates", True):
-                for sensor in group.sensors:
+                sensors = self._sensors_to_publish(group)
+                for sensor in sensors:
                     sensor.modbus_data_updated()
-                updated_sensors += len(group.sensors)
+                updated_sensors += len(sensors)
             _LOGGER.debug(f"{self._name}: device group read done with outcome={group_outcome.value}")
 
         if PollOutcome.FAILED in outcomes:
@@ -1142,6 +1352,34 @@ class SolaXModbusHub:
 
         return outcome, updated_sensors
 
+    def _sensors_to_publish(self, group: Any) -> list[Any]:
+        """Return the entities of a device group whose value changed in the last poll, or all of them when a full publish is due.
+
+        prevent_update numbers show the written value until their tmpdata expires, so they are published once more after
+        the expiry even when the register value did not change (e.g. the inverter rejected the write). Likewise a sensor
+        that held a value back by its deadband is published when its max_silence has passed, changed or not.
+        """
+        changed = getattr(group, "changed_keys", None)
+        now = _mtime.monotonic()
+        last_full_publish = getattr(group, "last_full_publish", None)
+        if changed is None or last_full_publish is None or now - last_full_publish >= FULL_PUBLISH_INTERVAL:
+            group.last_full_publish = now
+            return list(group.sensors)
+        wall_time = _mtime.time()
+        expired = {key for key, expiry in getattr(self, "tmpdata_expiry", {}).items() if 0 < expiry <= wall_time}
+        sensors = []
+        for sensor in group.sensors:
+            key = sensor.entity_description.key
+            held_back_until = getattr(sensor, "held_back_until", None)
+            if (
+                key in changed
+                or key in expired
+                or getattr(sensor, "publish_every_poll", False)
+                or (held_back_until is not None and held_back_until <= now)
+            ):
+                sensors.append(sensor)
+        return sensors
+
     async def _run_initial_refresh_when_ready(self) -> None:
         """Do a one-time initial refresh of all scan groups after startup probe has completed."""
         await self._probe_ready.wait()
@@ -1156,10 +1394,13 @@ class SolaXModbusHub:
                 if interval_group is None or not interval_group.device_groups:
                     continue
                 _LOGGER.debug(f"{self._name}: initial refresh for interval {interval}s")
-                async with interval_group.poll_lock:
-                    outcome, updated_sensors = await self._refresh_interval_group_once(interval_group, bypass_slowdown=True)
+                running = interval_group.poll_task
+                if running is not None and not running.done():
+                    await asyncio.wait({running})  # never overlap a scheduled poll of the same group
+                outcome, updated_sensors = await self._refresh_interval_group_once(interval_group, bypass_slowdown=True)
                 await self._maybe_refresh_energy_dashboard_on_primary_update()
                 _LOGGER.debug(f"{self._name}: initial refresh for interval {interval}s finished (outcome={outcome.value}, sensors={updated_sensors})")
+            self._confirm_learned_state()
         finally:
             self._initial_refresh_active = False
             self._initial_refresh_done = True
@@ -1202,15 +1443,24 @@ class SolaXModbusHub:
     async def async_stop(self) -> None:
         """Stop polling/timers and close transport deterministically."""
         self._stopping = True
-        # 1) stop interval timers
+        # 1) stop the poll scheduler and the polls it started
+        unsub = getattr(self, "_unsub_poll_timer", None)
+        if unsub:
+            try:
+                unsub()
+            except Exception:
+                pass
+            self._unsub_poll_timer = None
+        registry_cache = getattr(self, "_registry_cache", None)
+        if registry_cache is not None:
+            registry_cache.stop()
         for interval_group in list(self.groups.values()):
-            unsub = getattr(interval_group, "unsub_interval_method", None)
-            if unsub:
+            task = getattr(interval_group, "poll_task", None)
+            if task and not task.done():
                 try:
-                    unsub()
+                    task.cancel()
                 except Exception:
                     pass
-                interval_group.unsub_interval_method = None
         self.groups.clear()
         # 2) stop any running tasks
         for tname in ("_initial_refresh_task", "_quarantine_recheck_task"):
@@ -1343,7 +1593,8 @@ class SolaXModbusHub:
 
     async def _async_read_registers(self, register_type: str, unit: int, address: int, count: int) -> Any:
         """Read registers through the configured transport."""
-        async with self._lock:
+        # a pipelining transport limits and matches its outstanding requests itself
+        async with nullcontext() if getattr(self, "_pipelined_reads", False) else self._lock:
             if getattr(self, "_stopping", False):
                 return None
             if not await self._check_connection():
@@ -1468,14 +1719,15 @@ class SolaXModbusHub:
         """Write encoded registers through the configured transport."""
         if getattr(self, "_stopping", False):
             raise HomeAssistantError(f"{self._name}: integration is stopping")
-        async with self._lock:
-            if not await self._check_connection():
-                raise HomeAssistantError(f"{self._name}: inverter is not connected")
-            try:
-                response = await self._track_task(self._transport.write(unit, address, values, multiple=multiple))
-            except (ModbusException, SerialModbusError, AttributeError, TypeError) as ex:
-                await self._handle_transport_exception(ex, operation)
-                raise HomeAssistantError(f"{self._name}: {operation} failed: {ex}") from ex
+        with bus_priority(BUS_PRIORITY_WRITE):
+            async with self._lock:
+                if not await self._check_connection():
+                    raise HomeAssistantError(f"{self._name}: inverter is not connected")
+                try:
+                    response = await self._track_task(self._transport.write(unit, address, values, multiple=multiple))
+                except (ModbusException, SerialModbusError, AttributeError, TypeError) as ex:
+                    await self._handle_transport_exception(ex, operation)
+                    raise HomeAssistantError(f"{self._name}: {operation} failed: {ex}") from ex
         return self._validate_write_response(
             response,
             unit=unit,
@@ -1594,7 +1846,10 @@ class SolaXModbusHub:
     async def async_read_modbus_data(self, group: Any) -> PollOutcome:
         group.publish_updates = False
         try:
-            async with self._poll_data_lock:
+            if group.readPreparation is None:
+                # plain groups interleave block by block, each poll writes only to its own snapshot until the commit
+                return await self.async_read_modbus_registers_all(group)
+            async with self._poll_data_lock:  # readPreparation selects data behind shared addresses for the whole group
                 return await self.async_read_modbus_registers_all(group)
         except ConnectionException as ex:
             _LOGGER.error(f"Reading data failed! Inverter is offline. {ex}")
@@ -1604,9 +1859,26 @@ class SolaXModbusHub:
             _LOGGER.exception(f"Something went wrong reading from modbus: {ex}")
         return PollOutcome.FAILED
 
+    def _decode_plan(self, descr: Any) -> DecodePlan:
+        """Return the compiled plan for descr, compiling it on first use."""
+        plan = self._decode_plans.get(id(descr))
+        if plan is None or plan.descr is not descr:  # ids can be reused once a replaced description is freed
+            plan = compile_decode_plan(self._name, descr, self.plugin.order32, self.inverterPowerKw)
+            self._decode_plans[id(descr)] = plan
+        return plan
+
+    def _compile_decode_plans(self, blocks: list[Any]) -> None:
+        """Compile the decode plans of all descriptions used by blocks."""
+        for blk in blocks:
+            for reg in blk.regs:
+                descr = blk.descriptions[reg]
+                for d in descr.values() if isinstance(descr, dict) else (descr,):
+                    self._decode_plan(d)
+            blk.decode_plan = compile_block_decode_plan(blk, self._decode_plan) if self.plugin.batch_decode else None
+
     def treat_address(
         self,
-        data: dict[str, Any],
+        data: MutableMapping[str, Any],
         regs: list[int],
         idx: int,
         descr: Any,
@@ -1614,63 +1886,13 @@ class SolaXModbusHub:
         advance: bool = True,
         fresh_keys: set[str] | None = None,
     ) -> int:
-        return_value: int | None = None
-        read_scale = descr.read_scale  # read scale might still be wrong the first polling cycle
-        order32 = getattr(descr, "order32", None) or self.plugin.order32
+        plan = self._decode_plan(descr)
         val = None
         if self.cyclecount < VERBOSE_CYCLES:
             _LOGGER.debug(f"{self._name}: treating register 0x{descr.register:02x} : {descr.key}")
         words_used = 0
         try:
-            if descr.register_data_type == REGISTER_U16:
-                val = convert_from_registers(regs[idx : idx + 1], DataType.UINT16, self.plugin.order32)  # type: ignore[attr-defined]
-                words_used = 1
-            elif descr.register_data_type == REGISTER_S16:
-                val = convert_from_registers(regs[idx : idx + 1], DataType.INT16, self.plugin.order32)  # type: ignore[attr-defined]
-                words_used = 1
-            elif descr.register_data_type == REGISTER_U32:
-                val = convert_from_registers(regs[idx : idx + 2], DataType.UINT32, order32)  # type: ignore[attr-defined]
-                words_used = 2
-            elif descr.register_data_type == REGISTER_F32:
-                val = convert_from_registers(regs[idx : idx + 2], DataType.FLOAT32, order32)  # type: ignore[attr-defined]
-                words_used = 2
-            elif descr.register_data_type == REGISTER_S32:
-                val = convert_from_registers(regs[idx : idx + 2], DataType.INT32, order32)  # type: ignore[attr-defined]
-                words_used = 2
-            elif descr.register_data_type == REGISTER_STR:
-                wc = descr.wordcount or 0
-                raw = convert_from_registers(regs[idx : idx + wc], DataType.STRING, order32)  # type: ignore[attr-defined]
-                words_used = wc
-                val = raw.decode("ascii", errors="ignore") if isinstance(raw, (bytes, bytearray)) else str(raw)
-            elif descr.register_data_type == REGISTER_WORDS:
-                wc = descr.wordcount or 0
-                val = [convert_from_registers(regs[idx + i : idx + i + 1], DataType.UINT16, self.plugin.order32) for i in range(wc)]  # type: ignore[attr-defined]
-                words_used = wc
-            elif descr.register_data_type == REGISTER_ULSB16MSB16:
-                lo = convert_from_registers(regs[idx : idx + 1], DataType.UINT16, order32)  # type: ignore[attr-defined]
-                hi = convert_from_registers(regs[idx + 1 : idx + 2], DataType.UINT16, order32)  # type: ignore[attr-defined]
-                val = (hi + lo * 65536) if order32 == "big" else (lo + hi * 65536)
-                words_used = 2
-            elif descr.register_data_type == REGISTER_U8L:
-                if advance:
-                    base = convert_from_registers(regs[idx : idx + 1], DataType.UINT16, self.plugin.order32)  # type: ignore[attr-defined]
-                    words_used = 1
-                    val = base % 256
-                else:
-                    val = initval % 256
-                    words_used = 0
-            elif descr.register_data_type == REGISTER_U8H:
-                if advance:
-                    base = convert_from_registers(regs[idx : idx + 1], DataType.UINT16, self.plugin.order32)  # type: ignore[attr-defined]
-                    words_used = 1
-                    val = base >> 8
-                else:
-                    val = initval >> 8
-                    words_used = 0
-            else:
-                _LOGGER.warning(f"{self._name}: undefinded unit for entity {descr.key} - setting value to zero")
-                val = 0
-                words_used = 0
+            val, words_used = plan.decode(regs, idx, initval, advance)
         except Exception:
             if self.cyclecount < VERBOSE_CYCLES:
                 _LOGGER.warning(
@@ -1679,97 +1901,66 @@ class SolaXModbusHub:
                 )
             else:
                 _LOGGER.warning(f"{self._name}: read failed at 0x{descr.register:02x}: {descr.key} ")
-        """ TO BE REMOVED
-        if descr.prevent_update:
-            if  (self.tmpdata_expiry.get(descr.key, 0) > _mtime.time()):
-                val = self.tmpdata.get(descr.key, None)
-                if val is None:
-                    LOGGER.warning(f"cannot find tmpdata for {descr.key} - setting value to zero")
-                    val = 0
-            else: # expired
-                if self.tmpdata_expiry.get(descr.key, 0) > 0: self.localsUpdated = True
-                self.tmpdata_expiry[descr.key] = 0 # update locals only once
-        """
 
+        self._store_decoded(data, descr, plan, val, fresh_keys)
+        return idx + (words_used if advance else 0)
+
+    def _store_decoded(self, data: MutableMapping[str, Any], descr: Any, plan: DecodePlan, val: Any, fresh_keys: set[str] | None) -> None:
         # Plugin-level validation hook
         if self._validate_register_func is not None:
             val = self._validate_register_func(descr, val, data)
 
-        if isinstance(val, list) and descr.register_data_type != REGISTER_WORDS:
+        if isinstance(val, list) and not plan.is_words:
             if self.cyclecount < VERBOSE_CYCLES:
                 _LOGGER.warning(f"{self._name}: invalid list value for numeric entity {descr.key}: {val} - setting value to None")
             val = None
 
-        if val is None:  # E.g. if errors have occurred during readout
-            # _LOGGER.warning(f"****tmp*** treating {descr.key} failed")
-            return_value = None
-        elif type(descr.scale) is dict:  # translate int to string
-            return_value = descr.scale.get(val, "Unknown")
-        elif callable(descr.scale):  # function to call ?
-            return_value = descr.scale(val, descr, data)
-        else:  # apply simple numeric scaling and rounding if not a list of words
-            try:
-                return_value = round(val * descr.scale * read_scale, descr.rounding)
-            except Exception:
-                return_value = val  # probably a REGISTER_WORDS instance
-            native_unit = getattr(descr, "native_unit_of_measurement", None)
-            if native_unit == UnitOfFrequency.HERTZ:
-                min_val = getattr(descr, "min_value", 20)
-                max_val = getattr(descr, "max_value", 80)
-            if native_unit == PERCENTAGE:
-                min_val = getattr(descr, "min_value", 0)
-                max_val = getattr(descr, "max_value", 100)
-            elif native_unit == UnitOfTemperature.CELSIUS:
-                min_val = getattr(descr, "min_value", -100)
-                max_val = getattr(descr, "max_value", 200)
-            elif native_unit == UnitOfPower.KILO_WATT:
-                min_val = getattr(descr, "min_value", -self.inverterPowerKw * 2)
-                max_val = getattr(descr, "max_value", +self.inverterPowerKw * 2)
-            elif native_unit == UnitOfElectricCurrent.AMPERE:
-                min_val = getattr(descr, "min_value", -self.inverterPowerKw * 2)
-                max_val = getattr(descr, "max_value", +self.inverterPowerKw * 2)
-            elif native_unit == UnitOfElectricPotential.VOLT:
-                min_val = getattr(descr, "min_value", 0)
-                max_val = getattr(descr, "max_value", 2000)
-            else:
-                min_val = getattr(descr, "min_value", None)
-                max_val = getattr(descr, "max_value", None)
-
-            if min_val is not None and return_value < min_val:
-                raise ModbusIOException(f"Value {return_value} of '{descr.key}' lower than {min_val}")  # type: ignore[no-untyped-call]
-            if max_val is not None and return_value > max_val:
-                raise ModbusIOException(f"Value {return_value} of '{descr.key}' greater than {max_val}")  # type: ignore[no-untyped-call]
-        # if (descr.sleepmode != SLEEPMODE_LASTAWAKE) or self.awakeplugin(self.data): self.data[descr.key] = return_value
+        # E.g. if errors have occurred during readout
+        return_value = None if val is None else plan.finish(val, data)
         if (
-            (self.tmpdata_expiry.get(descr.key, 0) == 0)
-            and ((descr.sleepmode != SLEEPMODE_LASTAWAKE) or self.plugin.isAwake(data))
-            and (self.localsLoaded or not descr.read_scale_exceptions)  # ignore as long as read scale is not adapted; may delay real startup a bit
+            (self.tmpdata_expiry.get(plan.key, 0) == 0)
+            and (not plan.lastawake or self.plugin.isAwake(data))
+            and (self.localsLoaded or not plan.needs_locals)  # ignore as long as read scale is not adapted; may delay real startup a bit
         ):
-            data[descr.key] = return_value  # case prevent_update number
+            data[plan.key] = return_value  # case prevent_update number
             if fresh_keys is not None:
-                fresh_keys.add(descr.key)
-        return idx + (words_used if advance else 0)
+                fresh_keys.add(plan.key)
+
+    def _treat_block(self, data: MutableMapping[str, Any], regs: list[int], batch: BlockDecodePlan, fresh_keys: set[str]) -> None:
+        """Decode a whole block with its batch plan; same results as treat_address per register."""
+        values = batch.unpack(regs)
+        for value_idx, descr, plan, byte_entity in batch.entries:
+            val = values[value_idx]
+            if byte_entity:
+                val = plan.decode(regs, 0, val, False)[0]
+            self._store_decoded(data, descr, plan, val, fresh_keys)
+
+    def _read_block_registers(self, block: Any, typ: str) -> Coroutine[Any, Any, Any]:
+        if typ == "input":
+            return self.async_read_input_registers(
+                unit=self._modbus_addr,
+                address=block.start,
+                count=block.end - block.start,
+            )
+        return self.async_read_holding_registers(
+            unit=self._modbus_addr,
+            address=block.start,
+            count=block.end - block.start,
+        )
 
-    async def async_read_modbus_block(self, data: dict[str, Any], block: Any, typ: str) -> BlockReadResult:
+    async def async_read_modbus_block(
+        self, data: MutableMapping[str, Any], block: Any, typ: str, pending: Awaitable[Any] | None = None
+    ) -> BlockReadResult:
+        """Read and decode one block; pending is the response of a read that was already sent."""
         errmsg = None
+        exception_code: int | None = None
         communication_succeeded = False
         if self.cyclecount < VERBOSE_CYCLES:
             _LOGGER.debug(
                 f"{self._name}: modbus {typ} block start: 0x{block.start:x} end: 0x{block.end:x}  len: {block.end - block.start} regs: {block.regs}"
             )
         try:
-            if typ == "input":
-                realtime_data = await self.async_read_input_registers(
-                    unit=self._modbus_addr,
-                    address=block.start,
-                    count=block.end - block.start,
-                )
-            else:
-                realtime_data = await self.async_read_holding_registers(
-                    unit=self._modbus_addr,
-                    address=block.start,
-                    count=block.end - block.start,
-                )
+            realtime_data = await (pending if pending is not None else self._read_block_registers(block, typ))
         except Exception as ex:
             errmsg = f"exception {str(ex)} "
             _LOGGER.debug(f"{self._name}: exception reading {typ} {block.start} {errmsg}")
@@ -1780,11 +1971,18 @@ class SolaXModbusHub:
                 communication_succeeded = True
                 if realtime_data.isError():
                     errmsg = "read_error "
+                    exception_code = getattr(realtime_data, "exception_code", None)
         if errmsg is None:
             regs = realtime_data.registers
             idx = 0
             fresh_keys: set[str] = set()
-            for reg in block.regs:
+            batch = getattr(block, "decode_plan", None)
+            if batch is not None and self.cyclecount >= VERBOSE_CYCLES and len(regs) >= batch.count:
+                self._treat_block(data, regs, batch, fresh_keys)
+                block_regs = []  # everything decoded in one pass
+            else:
+                block_regs = block.regs
+            for reg in block_regs:
                 expected_idx = reg - block.start
                 if idx < expected_idx:
                     if self.cyclecount < 5 and expected_idx > idx:
@@ -1794,7 +1992,7 @@ class SolaXModbusHub:
                 descr = block.descriptions[reg]
 
                 if isinstance(descr, dict):
-                    base16 = convert_from_registers(regs[idx : idx + 1], DataType.UINT16, self.plugin.order32)  # type: ignore[attr-defined]
+                    base16 = regs[idx]
                     for k in descr:
                         self.treat_address(data, regs, idx, descr[k], initval=base16, advance=False, fresh_keys=fresh_keys)
                     idx += 1
@@ -1807,7 +2005,7 @@ class SolaXModbusHub:
                 fresh_keys=frozenset(fresh_keys),
             )
         else:  # block read failure
-            self._record_block_result(block, typ, False, errmsg)
+            self._record_block_result(block, typ, False, errmsg, exception_code)
             # Check only the first item in the block for ignore_readerror behavior.
             firstdescr_raw = block.descriptions.get(block.start) or block.descriptions[block.regs[0]]
             firstdescr = next(iter(firstdescr_raw.values())) if isinstance(firstdescr_raw, dict) else firstdescr_raw
@@ -1846,22 +2044,26 @@ class SolaXModbusHub:
                 tolerated=tolerated,
             )
 
-    def _commit_poll_snapshot(self, previous_data: dict[str, Any], new_data: dict[str, Any]) -> None:
-        """Commit polling changes without replacing the shared data dictionary."""
-        missing = object()
-
-        for key in previous_data.keys() - new_data.keys():
-            if self.data.get(key, missing) == previous_data[key]:
-                self.data.pop(key, None)
+    def _commit_poll_snapshot(self, snapshot: PollSnapshot) -> set[str]:
+        """Merge the keys written by a poll into the shared data dictionary, return the keys that changed.
 
-        for key, value in new_data.items():
-            previous_value = previous_data.get(key, missing)
-            if previous_value is not missing and value == previous_value:
+        A key that was changed concurrently (e.g. by a local control) since the poll first touched it keeps its new value.
+        """
+        changed: set[str] = set()
+        for key, previous_value in snapshot.previous.items():
+            current_value = self.data.get(key, MISSING)
+            if snapshot.removed(key):
+                if previous_value is not MISSING and current_value == previous_value:
+                    self.data.pop(key, None)
+                    changed.add(key)
                 continue
-
-            current_value = self.data.get(key, missing)
-            if current_value is missing or current_value == previous_value:
+            value = snapshot.written[key]
+            if previous_value is not MISSING and value == previous_value:
+                continue
+            if current_value is MISSING or current_value == previous_value:
                 self.data[key] = value
+                changed.add(key)
+        return changed
 
     def _active_computed_dependencies(self, descr: Any) -> set[str] | None:
         """Return declared dependencies that are available for this inverter."""
@@ -1872,38 +2074,52 @@ class SolaXModbusHub:
             dependencies = [dependencies]
         return {dependency for dependency in dependencies if dependency in self.sensorDescriptions}
 
-    def _compute_poll_sensors(self, data: dict[str, Any], fresh_keys: set[str]) -> set[str]:
-        """Compute sensors whose active, explicitly declared dependencies are fresh."""
-        computed_fresh_keys: set[str] = set()
-        pending = list(self.computedSensors.items())
-
-        while pending:
-            remaining: list[tuple[str, Any]] = []
-            made_progress = False
+    def _computed_sensor_order(self, data: Mapping[str, Any] | None = None) -> tuple[ComputedNode, ...]:
+        """Return the computed sensors in dependency order, rebuilt only when computed or registered sensors change.
 
-            for key, descr in pending:
-                dependencies = self._active_computed_dependencies(descr)
-                if dependencies is not None and not dependencies.issubset(fresh_keys):
-                    remaining.append((key, descr))
-                    continue
-
-                try:
-                    data[key] = descr.value_function(0, descr, data)
-                except Exception as ex:
-                    _LOGGER.debug(f"{self._name}: cannot compute value for {key}: {ex}")
-                    continue
-
-                fresh_keys.add(key)
-                computed_fresh_keys.add(key)
-                made_progress = True
-
-            if not made_progress:
-                for key, descr in remaining:
-                    dependencies = self._active_computed_dependencies(descr)
-                    missing = set(dependencies or []) - fresh_keys
-                    _LOGGER.debug(f"{self._name}: keeping previous value for {key}; dependencies not fresh: {sorted(missing)}")
-                break
-            pending = remaining
+        On a rebuild the value functions are traced against data, so that sensors reading other computed sensors
+        without declaring them are still ordered after them.
+        """
+        signature = (tuple(self.computedSensors.items()), len(self.sensorDescriptions))
+        cached = getattr(self, "_computed_order", None)
+        if cached is None or cached[0] != signature:
+            samples = [] if data is None else [data]
+            order = order_computed_sensors(self.computedSensors, self._active_computed_dependencies, lambda descr: trace_dependencies(descr, samples))
+            for node in order:
+                if getattr(node.descr, "memoize", False) and node.dependencies is None:
+                    _LOGGER.warning(f"{self._name}: computed sensor {node.key} sets memoize without depends_on; it is computed on every poll")
+            cached = (signature, order)
+            self._computed_order = cached
+        return cached[1]
+
+    def _memoized_value(self, node: ComputedNode, data: MutableMapping[str, Any]) -> Any:
+        """Return the value of a memoized computed sensor, calling its value_function only when its declared dependencies changed."""
+        inputs = tuple((key, data.get(key)) for key in sorted(node.dependencies or ()))
+        memo = self._computed_memo.get(node.key)
+        if memo is not None and memo[0] == inputs:
+            return memo[1]
+        value = node.descr.value_function(0, node.descr, data)
+        self._computed_memo[node.key] = (inputs, value)
+        return value
+
+    def _compute_poll_sensors(self, data: MutableMapping[str, Any], fresh_keys: set[str]) -> set[str]:
+        """Compute sensors whose active, explicitly declared dependencies are fresh, in a single pass in dependency order."""
+        computed_fresh_keys: set[str] = set()
+        for node in self._computed_sensor_order(data):
+            if node.dependencies is not None and not node.dependencies.issubset(fresh_keys):
+                missing = node.dependencies - fresh_keys
+                _LOGGER.debug(f"{self._name}: keeping previous value for {node.key}; dependencies not fresh: {sorted(missing)}")
+                continue
+            try:
+                if getattr(node.descr, "memoize", False) and node.dependencies is not None:  # traced reads may miss branches
+                    data[node.key] = self._memoized_value(node, data)
+                else:
+                    data[node.key] = node.descr.value_function(0, node.descr, data)
+            except Exception as ex:
+                _LOGGER.debug(f"{self._name}: cannot compute value for {node.key}: {ex}")
+                continue
+            fresh_keys.add(node.key)
+            computed_fresh_keys.add(node.key)
 
         return computed_fresh_keys
 
@@ -1916,28 +2132,31 @@ class SolaXModbusHub:
         else:
             _LOGGER.debug(f"{self._name}: device group inverter")
 
-        previous_data = self.data.copy()
-        data = previous_data.copy()
+        data = PollSnapshot(self.data)  # reads fall through to self.data, writes are kept until the commit
         block_results: list[BlockReadResult] = []
         fresh_keys: set[str] = set()
-        for block in group.holdingBlocks:
-            _LOGGER.debug(f"{self._name}: ** trying to read holding block 0x{block.start:x}")
-            block_result = await self.async_read_modbus_block(data, block, "holding")
-            block_results.append(block_result)
-            fresh_keys.update(block_result.fresh_keys)
-            _LOGGER.debug(
-                f"{self._name}: holding block 0x{block.start:x} read done; "
-                f"data_succeeded={block_result.data_succeeded}, communication_succeeded={block_result.communication_succeeded}"
-            )
-        for block in group.inputBlocks:
-            _LOGGER.debug(f"{self._name}: ** trying to read input block 0x{block.start:x}")
-            block_result = await self.async_read_modbus_block(data, block, "input")
-            block_results.append(block_result)
-            fresh_keys.update(block_result.fresh_keys)
-            _LOGGER.debug(
-                f"{self._name}: input block 0x{block.start:x} read done; "
-                f"data_succeeded={block_result.data_succeeded}, communication_succeeded={block_result.communication_succeeded}"
-            )
+        reads = [(block, "holding") for block in group.holdingBlocks] + [(block, "input") for block in group.inputBlocks]
+        pending: list[asyncio.Task[Any] | None] = [None] * len(reads)
+        if getattr(self, "_pipelined_reads", False) and len(reads) > 1:
+            # send all requests at once, but decode in block order so value functions see the same data as before
+            pending = [asyncio.get_running_loop().create_task(self._read_block_registers(block, typ)) for block, typ in reads]
+        try:
+            for (block, typ), request in zip(reads, pending, strict=True):
+                _LOGGER.debug(f"{self._name}: ** trying to read {typ} block 0x{block.start:x}")
+                if request is None:
+                    block_result = await self.async_read_modbus_block(data, block, typ)
+                else:
+                    block_result = await self.async_read_modbus_block(data, block, typ, pending=request)
+                block_results.append(block_result)
+                fresh_keys.update(block_result.fresh_keys)
+                _LOGGER.debug(
+                    f"{self._name}: {typ} block 0x{block.start:x} read done; "
+                    f"data_succeeded={block_result.data_succeeded}, communication_succeeded={block_result.communication_succeeded}"
+                )
+        finally:
+            for request in pending:
+                if request is not None and not request.done():
+                    request.cancel()
 
         all_data_succeeded = all(result.data_succeeded for result in block_results)
         communication_succeeded = not block_results or any(result.communication_succeeded for result in block_results)
@@ -1949,29 +2168,30 @@ class SolaXModbusHub:
         else:
             poll_outcome = PollOutcome.FAILED
 
-        local_callback_needed = self.localsUpdated
-        if self.localsUpdated:
-            await self._hass.async_add_executor_job(self.saveLocalData)
-            self.plugin.localDataCallback(self)
-        if not self.localsLoaded:
-            await self._hass.async_add_executor_job(self.loadLocalData)
-            local_callback_needed = local_callback_needed or self.localsLoaded
+        async with self._poll_side_effect_lock:  # localsUpdated and localsLoaded only change once the executor job is done
+            local_callback_needed = self.localsUpdated
+            if self.localsUpdated:
+                await self._hass.async_add_executor_job(self.saveLocalData)
+                self.plugin.localDataCallback(self)
+            if not self.localsLoaded:
+                await self._hass.async_add_executor_job(self.loadLocalData)
+                local_callback_needed = local_callback_needed or self.localsLoaded
 
         # Local controls can change independently while a Modbus group is being read.
         for key in self.writeLocals:
             if key in self.data:
-                data[key] = self.data[key]
+                data.forget(key)
 
         computed_fresh_keys: set[str] = set()
         if poll_outcome.communication_succeeded:
             computed_fresh_keys = self._compute_poll_sensors(data, fresh_keys)
 
             if group.readFollowUp is not None:
-                if not await group.readFollowUp(previous_data, data):
+                if not await group.readFollowUp(data.previous_view(), data):
                     _LOGGER.warning(f"{self._name}: device group validation failed; discarding polling snapshot")
                     return PollOutcome.DISCARDED
 
-            self._commit_poll_snapshot(previous_data, data)
+            group.changed_keys = self._commit_poll_snapshot(data)
             if local_callback_needed:
                 self.plugin.localDataCallback(self)
 
@@ -1979,6 +2199,8 @@ class SolaXModbusHub:
                 if key not in computed_fresh_keys:
                     continue
                 sens = self.sensorEntities.get(key)
+                if key not in group.changed_keys and not getattr(sens, "publish_every_poll", False):
+                    continue  # same value; the scan group of the sensor still publishes it on a full publish
                 _LOGGER.debug(f"{self._name}: quickly updating state for computed sensor {sens} {key} {self.data.get(descr.key)} ")
                 if sens and (not descr.internal):
                     try:
@@ -1987,7 +2209,13 @@ class SolaXModbusHub:
                         _LOGGER.debug(f"{self._name}: cannot send update for {key} - probably disabled ")
             group.publish_updates = True
 
-        if poll_outcome.communication_succeeded and not required_block_failed and self.writequeue and self.plugin.isAwake(self.data):
+        async with self._poll_side_effect_lock:  # groups polled concurrently must not send the same queued or repeated write twice
+            await self._async_run_poll_writes(poll_outcome.communication_succeeded and not required_block_failed)
+        return poll_outcome
+
+    async def _async_run_poll_writes(self, device_ok: bool) -> None:
+        """Send the writes that wait for a poll: queued writes once the device is awake, and the autorepeat entities."""
+        if device_ok and self.writequeue and self.plugin.isAwake(self.data):
             # process outstanding write requests
             _LOGGER.info(f"inverter is now awake, processing outstanding write requests {self.writequeue}")
             for queue_key, request in list(self.writequeue.items()):
@@ -2042,7 +2270,6 @@ class SolaXModbusHub:
                                 address=reg,
                                 payload=payload.get("data"),
                             )
-        return poll_outcome
 
     # --------------------------------------------- Check if sensor is a dependency -----------------------------------------------
 
@@ -2078,15 +2305,14 @@ class SolaXModbusHub:
 
     # --------------------------------------------- Sorting and grouping of entities -----------------------------------------------
 
-    def splitInBlocks(self, descriptions: dict[Any, Any]) -> list[Any]:
-        start = INVALID_START
-        end = 0
-        blocks: list[Any] = []
+    def splitInBlocks(self, descriptions: dict[Any, Any], layout_key: str | None = None) -> list[Any]:
+        """Split the descriptions in read blocks; layout_key: reuse the block layout restored under this key if it still fits."""
         block_size = self.plugin.block_size
         auto_block_ignore_readerror = self.plugin.auto_block_ignore_readerror
-        curblockregs: list[Any] = []
+        limits: BlockLimits | None = None
+        # entity (base, end) spans; a new segment starts at each newblock declaration and at each quarantined register
+        segments: list[list[tuple[int, int]]] = [[]]
         for reg, descr in descriptions.items():
-            d_ignore_readerror = auto_block_ignore_readerror
             if type(descr) is dict:  # 2 byte  REGISTER_U8L, _U8H values on same modbus 16 bit address
                 d_newblock = False
                 d_enabled = False
@@ -2116,85 +2342,88 @@ class SolaXModbusHub:
                 d_key = descr.key
                 d_regtype = descr.register_type  # HOLDING or INPUT
 
-            if d_enabled:
-                if d_newblock or ((reg - start) > block_size):
-                    if (end - start) > 0:
-                        _LOGGER.debug(f"{self._name}: Starting new block at 0x{reg:x} ")
-                        if (
-                            (auto_block_ignore_readerror is True) or (auto_block_ignore_readerror is False)
-                        ) and not d_newblock:  # automatically created block
-                            if type(descr) is dict:
-                                for _sub, d in descr.items():
-                                    if d.ignore_readerror is False:
-                                        descr[_sub] = replace(d, ignore_readerror=auto_block_ignore_readerror)
-                                        d_ignore_readerror = d_ignore_readerror or auto_block_ignore_readerror
-                            else:
-                                if descr.ignore_readerror is False:
-                                    descr = replace(descr, ignore_readerror=auto_block_ignore_readerror)
-                                    descriptions[reg] = descr
-                                    d_ignore_readerror = descr.ignore_readerror
-                        # newblock = block(start = start, end = end, order16 = descriptions[start].order16, order32 = descriptions[start].order32, descriptions = descriptions, regs = curblockregs)
-                        newblock = block(start=start, end=end, descriptions=descriptions, regs=curblockregs)
-                        blocks.append(newblock)
-                        start = INVALID_START
-                        end = 0
-                        curblockregs = []
-                    else:
-                        _LOGGER.debug(f"{self._name}: newblock declaration found for empty block")
-
-                if start == INVALID_START:
-                    start = reg
-
-                # Skip definitively bad entity bases and split blocks at bad boundaries
-                typ_key = "holding" if d_regtype == REG_HOLDING else "input"
-                if reg in self.bad_regs[typ_key]:
-                    # Close current block if it already has content
-                    if (end - start) > 0:
-                        newblock = block(start=start, end=end, descriptions=descriptions, regs=curblockregs)
-                        blocks.append(newblock)
-                    # Reset for next block after the bad address
-                    start = INVALID_START
-                    end = 0
-                    curblockregs = []
-                    _LOGGER.debug(f"{self._name}: skipping bad {typ_key} register 0x{reg:x}")
-                    continue
+            if not d_enabled:
+                _LOGGER.debug(f"{self._name}: ignoring type {d_regtype} register 0x{reg:x} {d_key}")
+                continue
 
-                _LOGGER.debug(
-                    f"{self._name}: adding register 0x{reg:x} {d_key} to block with start 0x{start:x} ignore_readerror:{d_ignore_readerror}"
-                )
-                if d_unit in (
-                    REGISTER_STR,
-                    REGISTER_WORDS,
-                ):
-                    if d_wordcount:
-                        end = reg + d_wordcount
-                    else:
-                        _LOGGER.warning(f"{self._name}: invalid or missing missing wordcount for {d_key}")
-                elif d_unit in (
-                    REGISTER_S32,
-                    REGISTER_U32,
-                    REGISTER_F32,
-                    REGISTER_ULSB16MSB16,
-                ):
-                    end = reg + 2
+            if d_newblock:
+                if segments[-1]:
+                    _LOGGER.debug(f"{self._name}: Starting new block at 0x{reg:x} ")
+                    segments.append([])
                 else:
+                    _LOGGER.debug(f"{self._name}: newblock declaration found for empty block")
+
+            # Skip definitively bad entity bases and split blocks at bad boundaries
+            typ_key = "holding" if d_regtype == REG_HOLDING else "input"
+            limits = self.block_limits.get(typ_key)
+            if reg in self.bad_regs[typ_key]:
+                if segments[-1]:
+                    segments.append([])
+                _LOGGER.debug(f"{self._name}: skipping bad {typ_key} register 0x{reg:x}")
+                continue
+
+            if d_unit in (
+                REGISTER_STR,
+                REGISTER_WORDS,
+            ):
+                if d_wordcount:
+                    end = reg + d_wordcount
+                else:
+                    _LOGGER.warning(f"{self._name}: invalid or missing missing wordcount for {d_key}")
                     end = reg + 1
-                _LOGGER.debug(f"{self._name}: adding type {d_regtype} register 0x{reg:x} {d_key} to block with start 0x{start:x}")
-                curblockregs.append(reg)
+            elif d_unit in (
+                REGISTER_S32,
+                REGISTER_U32,
+                REGISTER_F32,
+                REGISTER_ULSB16MSB16,
+            ):
+                end = reg + 2
             else:
-                _LOGGER.debug(f"{self._name}: ignoring type {d_regtype} register 0x{reg:x} {d_key} to block with start 0x{start:x}")
-
-        if (end - start) > 0:  # close last block
-            # newblock = block(start = start, end = end, order16 = descriptions[start].order16, order32 = descriptions[start].order32, descriptions = descriptions, regs = curblockregs)
-            newblock = block(start=start, end=end, descriptions=descriptions, regs=curblockregs)
-            blocks.append(newblock)
+                end = reg + 1
+            _LOGGER.debug(f"{self._name}: adding type {d_regtype} register 0x{reg:x} {d_key}")
+            segments[-1].append((reg, end))
+
+        max_registers = MODBUS_MAX_READ_REGISTERS
+        holes: tuple[int, ...] = ()
+        if limits is not None:  # discovered limits replace the static plugin block_size
+            block_size = max_registers = limits.max_registers
+            holes = limits.holes
+        restored_layout = getattr(self, "_restored_block_layouts", {}).get(layout_key) if layout_key is not None else None
+        plans = replay_layout(segments, restored_layout, block_size, holes, max_registers) if restored_layout is not None else None
+        if plans is None:
+            plans = [plan_blocks(spans, block_size, self.block_cost_model, holes, max_registers) for spans in segments]
+        else:
+            _LOGGER.debug(f"{self._name}: reusing the restored block layout {layout_key}")
+        blocks: list[Any] = []
+        for spans, plan in zip(segments, plans, strict=True):
+            for position, (first, last) in enumerate(plan):
+                regs = [base for base, _end in spans[first:last]]
+                start = regs[0]
+                if position > 0 and ((auto_block_ignore_readerror is True) or (auto_block_ignore_readerror is False)):
+                    self._apply_auto_block_ignore_readerror(descriptions, start, auto_block_ignore_readerror)
+                newblock = block(start=start, end=max(end for _base, end in spans[first:last]), descriptions=descriptions, regs=regs)
+                _LOGGER.debug(f"{self._name}: planned block 0x{newblock.start:x}-0x{newblock.end:x} with {len(regs)} entities")
+                blocks.append(newblock)
         return blocks
 
-    def rebuild_blocks(self, initial_groups: dict[Any, Any]) -> None:  # , computedRegs):
-        _LOGGER.debug(f"{self._name}: rebuilding groups and blocks - pre: {initial_groups.keys()}")
+    def _apply_auto_block_ignore_readerror(self, descriptions: dict[Any, Any], reg: int, ignore_readerror: bool) -> None:
+        """Mark the first entity of an automatically split block with the plugin's ignore_readerror."""
+        descr = descriptions[reg]
+        if type(descr) is dict:
+            for _sub, d in descr.items():
+                if d.ignore_readerror is False:
+                    descr[_sub] = replace(d, ignore_readerror=ignore_readerror)
+        elif descr.ignore_readerror is False:
+            descriptions[reg] = replace(descr, ignore_readerror=ignore_readerror)
+
+    def rebuild_blocks(self, initial_groups: dict[Any, Any], only: set[tuple[Any, Any]] | None = None) -> None:  # , computedRegs):
+        """Split the registers of the initial groups in blocks; only: rebuild just these (interval, device name) groups."""
+        _LOGGER.debug(f"{self._name}: rebuilding groups and blocks - pre: {initial_groups.keys()} only: {only}")
         self.initial_groups = initial_groups
         for interval, interval_group in initial_groups.items():
             for device_name, device_group in interval_group.device_groups.items():
+                if only is not None and (interval, device_name) not in only:
+                    continue
                 _LOGGER.debug(f"{self._name}: rebuild for device {device_name} in interval {interval}")
                 holdingRegs = dict(sorted(device_group.holdingRegs.items()))
                 inputRegs = dict(sorted(device_group.inputRegs.items()))
@@ -2203,8 +2432,13 @@ class SolaXModbusHub:
                 hub_device_group = hub_interval_group.device_groups.setdefault(device_name, empty_hub_device_group_lambda())
                 hub_device_group.readPreparation = device_group.readPreparation
                 hub_device_group.readFollowUp = device_group.readFollowUp
-                hub_device_group.holdingBlocks = self.splitInBlocks(holdingRegs)
-                hub_device_group.inputBlocks = self.splitInBlocks(inputRegs)
+                hub_device_group.holdingBlocks = self.splitInBlocks(holdingRegs, self._layout_key(interval, device_name, "holding"))
+                hub_device_group.inputBlocks = self.splitInBlocks(inputRegs, self._layout_key(interval, device_name, "input"))
+                layouts = getattr(self, "_block_layouts", {})
+                layouts[self._layout_key(interval, device_name, "holding")] = [list(b.regs) for b in hub_device_group.holdingBlocks]
+                layouts[self._layout_key(interval, device_name, "input")] = [list(b.regs) for b in hub_device_group.inputBlocks]
+                self._compile_decode_plans(hub_device_group.holdingBlocks)
+                self._compile_decode_plans(hub_device_group.inputBlocks)
                 # self.computedSensors = computedRegs # moved outside the loops
                 for i in hub_device_group.holdingBlocks:
                     _LOGGER.debug(f"{self._name} - interval {interval}s: adding holding block: {', '.join(f'0x{num:x}' for num in i.regs)}")
@@ -2212,9 +2446,32 @@ class SolaXModbusHub:
                     _LOGGER.debug(f"{self._name} - interval {interval}s: adding input block: {', '.join(f'0x{num:x}' for num in i.regs)}")
                 # _LOGGER.debug(f"holdingBlocks: {hub_device_group.holdingBlocks}")
                 # _LOGGER.debug(f"inputBlocks: {hub_device_group.inputBlocks}")
+        self._register_index = self._build_register_index()
+        self._stale_block_groups = set()
         self.blocks_changed = False
+        if getattr(self, "_initial_refresh_done", False):  # the layout has been read successfully; keep it for the next start
+            self._save_learned_state()
         _LOGGER.debug(f"{self._name}: done rebuilding groups and blocks - post: {self.initial_groups.keys()}")
 
+    def _layout_key(self, interval: Any, device_name: Any, typ: str) -> str:
+        return f"{interval}/{device_name}/{typ}"
+
+    def _invalidate_blocks(self, groups: Iterable[tuple[Any, Any]] | None = None) -> None:
+        """Have the next poll rebuild the blocks of the given (interval, device name) groups, or of all groups if None."""
+        stale = getattr(self, "_stale_block_groups", set())
+        self._stale_block_groups = None if groups is None or stale is None else stale | set(groups)
+        self.blocks_changed = True
+
+    def _groups_with_register(self, typ: str, addr: int) -> set[tuple[Any, Any]]:
+        """Return the (interval, device name) groups that poll the register at addr."""
+        regs_attr = "holdingRegs" if typ == "holding" else "inputRegs"
+        return {
+            (interval, device_name)
+            for interval, interval_group in getattr(self, "initial_groups", {}).items()
+            for device_name, device_group in interval_group.device_groups.items()
+            if addr in getattr(device_group, regs_attr, {})
+        }
+
     def _block_key(self, block_obj: Any, typ: str) -> str:
         return f"{typ}:0x{block_obj.start:x}-0x{block_obj.end:x}"
 
@@ -2229,37 +2486,48 @@ class SolaXModbusHub:
         return f"{label} ({key})" if key else label
 
     def _find_descriptor_for_reg(self, typ: str, addr: int) -> Any | None:
+        return self._register_index.get((typ, addr))
+
+    def _build_register_index(self) -> dict[tuple[str, int], Any]:
+        """Map (register type, address) to the description(s) at that address, registered descriptions first, then block ones."""
+        index: dict[tuple[str, int], Any] = {}
         for interval_group in self.initial_groups.values():
             for device_group in getattr(interval_group, "device_groups", {}).values():
-                regs = getattr(device_group, "holdingRegs", {}) if typ == "holding" else getattr(device_group, "inputRegs", {})
-                if addr in regs:
-                    return regs[addr]
+                for typ, regs in (("holding", getattr(device_group, "holdingRegs", {})), ("input", getattr(device_group, "inputRegs", {}))):
+                    for addr, descr in regs.items():
+                        index.setdefault((typ, addr), descr)
         for interval_group in self.groups.values():
             for device_group in getattr(interval_group, "device_groups", {}).values():
-                blocks = getattr(device_group, "holdingBlocks", []) if typ == "holding" else getattr(device_group, "inputBlocks", [])
-                for block_obj in blocks:
-                    if addr in (block_obj.regs or []):
-                        return block_obj.descriptions.get(addr) if block_obj.descriptions else None
-        return None
+                for typ, blocks in (("holding", getattr(device_group, "holdingBlocks", [])), ("input", getattr(device_group, "inputBlocks", []))):
+                    for block_obj in blocks:
+                        for addr in block_obj.regs or []:
+                            index.setdefault((typ, addr), block_obj.descriptions.get(addr) if block_obj.descriptions else None)
+        return index
 
-    def _record_block_result(self, block_obj: Any, typ: str, success: bool, errmsg: str | None = None) -> None:
+    def _record_block_result(self, block_obj: Any, typ: str, success: bool, errmsg: str | None = None, exception_code: int | None = None) -> None:
         key = self._block_key(block_obj, typ)
         if success:
             self._comm_last_block_success_time = _mtime.time()
             self._comm_block_failures.pop(key, None)
+            self._comm_block_successes[key] = (typ, self._comm_last_block_success_time, block_obj.regs)
             return
 
         now = _mtime.time()
         self._comm_last_block_failure_time = now
+        self._comm_block_successes.pop(key, None)
         self._comm_last_error = f"{key}: {errmsg or 'read_error'}"
         self._comm_last_error_time = _mtime.strftime("%Y-%m-%d %H:%M:%S")
         failures = [ts for ts in self._comm_block_failures.get(key, []) if now - ts <= COMM_BLOCK_FAILURE_WINDOW]
         failures.append(now)
         self._comm_block_failures[key] = failures
-        if len(failures) >= COMM_BLOCK_FAILURE_THRESHOLD:
+        if exception_code == MODBUS_ILLEGAL_DATA_ADDRESS:
+            # the device answered that part of the block does not exist; repeating the read will not change that
+            self._schedule_runtime_bisect(block_obj, typ, definitive=True)
+        elif len(failures) >= COMM_BLOCK_FAILURE_THRESHOLD:
             self._schedule_runtime_bisect(block_obj, typ)
 
-    def _schedule_runtime_bisect(self, block_obj: Any, typ: str) -> None:
+    def _schedule_runtime_bisect(self, block_obj: Any, typ: str, definitive: bool = False) -> None:
+        """Start isolating the bad registers of block_obj; definitive: the device rejected the addresses, so it is reachable."""
         if getattr(self, "_stopping", False):
             return
         key = self._block_key(block_obj, typ)
@@ -2267,11 +2535,13 @@ class SolaXModbusHub:
         if task and not task.done():
             return
         last_success = self._comm_last_block_success_time
-        if last_success is None or (_mtime.time() - last_success) > COMM_BLOCK_FAILURE_WINDOW:
+        recent = self._comm_recent_outcomes[-20:]
+        if definitive:
+            _LOGGER.info(f"{self._name}: illegal data address reply for {key}; isolating the missing register(s) now")
+        elif last_success is None or (_mtime.time() - last_success) > COMM_BLOCK_FAILURE_WINDOW:
             _LOGGER.debug(f"{self._name}: skipping runtime bisect for {key}; no recent successful block reads")
             return
-        recent = self._comm_recent_outcomes[-20:]
-        if recent and not any(outcome.communication_succeeded for outcome in recent):
+        elif recent and not any(outcome.communication_succeeded for outcome in recent):
             _LOGGER.debug(f"{self._name}: skipping runtime bisect for {key}; all recent polls failed")
             return
         probe_block = block(
@@ -2280,7 +2550,7 @@ class SolaXModbusHub:
             descriptions=block_obj.descriptions,
             regs=list(block_obj.regs or []),
         )
-        task = self._hass.loop.create_task(self._runtime_bisect_block(probe_block, typ, key))
+        task = self._hass.loop.create_task(self._runtime_bisect_block(probe_block, typ, key), context=background_context())
         self._runtime_bisect_tasks[key] = task
 
         def _remove_runtime_bisect_task(_task: asyncio.Task[Any], block_key: str = key) -> None:
@@ -2304,8 +2574,9 @@ class SolaXModbusHub:
                     self._comm_last_quarantined_register = self._format_register(typ, addr)
                     confirmed.append(addr)
             if confirmed:
-                self.blocks_changed = True
+                self._invalidate_blocks({group for addr in confirmed for group in self._groups_with_register(typ, addr)})
                 self._ensure_quarantine_recheck_task()
+                self._save_learned_state()
                 labels = ", ".join(self._format_register(typ, addr) for addr in confirmed)
                 _LOGGER.warning(f"{self._name}: quarantined unreadable Modbus register(s): {labels}")
                 self._update_communication_data()
@@ -2315,7 +2586,12 @@ class SolaXModbusHub:
         except Exception as ex:
             _LOGGER.debug(f"{self._name}: runtime bisect for {key} failed: {ex}")
 
-    async def _find_bad_regs_in_block(self, block_obj: Any, typ: str, candidates: set[int], depth: int = 0) -> None:
+    async def _find_bad_regs_in_block(self, block_obj: Any, typ: str, candidates: set[int]) -> None:
+        """Collect the entity bases that make block_obj unreadable as candidates.
+
+        Entities that were read successfully within COMM_BLOCK_FAILURE_WINDOW, in another block, are not suspected
+        as long as the block still fails without them.
+        """
         if getattr(self, "_stopping", False):
             return
         if await self._probe_block(block_obj, typ):
@@ -2324,15 +2600,57 @@ class SolaXModbusHub:
             return
 
         regs = list(block_obj.regs or [])
-        if depth >= self.bisect_max_depth or len(regs) <= 1:
-            if len(regs) == 1:
-                candidates.add(regs[0])
-                _LOGGER.debug(f"{self._name}: candidate bad {typ} entity base 0x{regs[0]:x}")
+        if not regs:
+            return
+        good = self._recently_read_registers(typ)
+        suspects = [reg for reg in regs if reg not in good]
+        if suspects and len(suspects) < len(regs):
+            if await self._probe_block(self._suspect_span(block_obj, suspects), typ):
+                _LOGGER.debug(f"{self._name}: recently read {typ} entities are needed to fail block 0x{block_obj.start:x}; suspecting all")
+                suspects = regs
+            elif not self._transport.is_connected():
+                return
+        await self._split_suspects(block_obj, typ, suspects or regs, candidates)
+
+    async def _split_suspects(self, block_obj: Any, typ: str, suspects: list[int], candidates: set[int], depth: int = 0) -> None:
+        """Narrow down suspects, whose span is known to fail, by binary splitting.
+
+        When the first half reads fine, the second half must fail and is split without being probed.
+        """
+        if len(suspects) == 1:
+            candidates.add(suspects[0])
+            _LOGGER.debug(f"{self._name}: candidate bad {typ} entity base 0x{suspects[0]:x}")
+            return
+        if depth >= self.bisect_max_depth or getattr(self, "_stopping", False):
             return
 
-        mid = len(regs) // 2
-        await self._find_bad_regs_in_block(self._subblock_entity_span(block_obj, 0, mid), typ, candidates, depth + 1)
-        await self._find_bad_regs_in_block(self._subblock_entity_span(block_obj, mid, len(regs)), typ, candidates, depth + 1)
+        mid = len(suspects) // 2
+        first, second = suspects[:mid], suspects[mid:]
+        first_fails = not await self._probe_block(self._suspect_span(block_obj, first), typ)
+        if not self._transport.is_connected():
+            return
+        if first_fails:
+            await self._split_suspects(block_obj, typ, first, candidates, depth + 1)
+            if not await self._probe_block(self._suspect_span(block_obj, second), typ) and self._transport.is_connected():
+                await self._split_suspects(block_obj, typ, second, candidates, depth + 1)
+        else:
+            await self._split_suspects(block_obj, typ, second, candidates, depth + 1)
+
+    def _suspect_span(self, block_obj: Any, suspects: list[int]) -> Any:
+        """Return the sub-block of block_obj from the first to the end of the last suspect entity."""
+        regs = list(block_obj.regs)
+        return self._subblock_entity_span(block_obj, regs.index(suspects[0]), regs.index(suspects[-1]) + 1)
+
+    def _recently_read_registers(self, typ: str) -> set[int]:
+        """Return the entity bases of typ in blocks that were read successfully within COMM_BLOCK_FAILURE_WINDOW."""
+        now = _mtime.time()
+        good: set[int] = set()
+        for key, (block_typ, success_time, regs) in list(self._comm_block_successes.items()):
+            if now - success_time > COMM_BLOCK_FAILURE_WINDOW:
+                del self._comm_block_successes[key]
+            elif block_typ == typ:
+                good.update(regs)
+        return good
 
     async def _confirm_bad_register(self, typ: str, addr: int) -> bool:
         single = self._single_register_block(typ, addr)
@@ -2359,7 +2677,7 @@ class SolaXModbusHub:
         task = self._quarantine_recheck_task
         if task and not task.done():
             return
-        self._quarantine_recheck_task = self._hass.loop.create_task(self._quarantine_recheck_loop())
+        self._quarantine_recheck_task = self._hass.loop.create_task(self._quarantine_recheck_loop(), context=background_context())
 
     async def _quarantine_recheck_loop(self) -> None:
         try:
@@ -2388,8 +2706,10 @@ class SolaXModbusHub:
         if not await self._probe_block(single, typ, timeout=self._quarantine_recheck_timeout()):
             return
         self.bad_regs[typ].discard(addr)
+        getattr(self, "_restored_bad_regs", {}).get(typ, set()).discard(addr)
         self._comm_last_recovered_register = self._format_register(typ, addr)
-        self.blocks_changed = True
+        self._invalidate_blocks(self._groups_with_register(typ, addr))
+        self._save_learned_state()
         _LOGGER.info(f"{self._name}: restored previously quarantined Modbus register {self._comm_last_recovered_register}")
 
     def _quarantine_recheck_timeout(self) -> float:
@@ -2471,6 +2791,82 @@ class SolaXModbusHub:
             "last_recovered_register": self._comm_last_recovered_register,
         }
 
+    async def async_discover_block_limits(self) -> dict[str, BlockLimits]:
+        """Learn the largest read request and the unreadable gaps of the device.
+
+        Only device groups without readPreparation are probed, groups like battery packs select other
+        data behind the same addresses. The result replaces the plugin block_size at the next rebuild.
+        """
+        with bus_priority(BUS_PRIORITY_BACKGROUND):
+            for typ in ("holding", "input"):
+                spans = self._discovery_spans(typ)
+                if not spans or getattr(self, "_stopping", False) or not self._transport.is_connected():
+                    continue
+                holes: set[int] = set()
+                for (_base, gap_start), (gap_end, _end) in pairwise(spans):
+                    if gap_start < gap_end and gap_end - gap_start <= MODBUS_MAX_READ_REGISTERS:
+                        if not await self._probe_range(typ, gap_start, gap_end):
+                            await self._find_unreadable_gap(typ, gap_start, gap_end, holes)
+                runs = readable_runs(spans, sorted(holes))
+                start, end = max(runs, key=lambda run: run[1] - run[0])
+                max_registers = await self._discover_max_registers(typ, start, min(end - start, MODBUS_MAX_READ_REGISTERS))
+                if not self._transport.is_connected():
+                    _LOGGER.warning(f"{self._name}: connection lost during {typ} block limit discovery; keeping previous limits")
+                    continue
+                self.block_limits[typ] = BlockLimits(max_registers=max_registers, holes=tuple(sorted(holes)))
+                _LOGGER.info(f"{self._name}: discovered {typ} block limits: max {max_registers} registers, {len(holes)} unreadable gap addresses")
+            self._restored_block_layouts = {}  # planned without the new limits
+            self._invalidate_blocks()
+            self._save_learned_state()
+            return dict(self.block_limits)
+
+    def _discovery_spans(self, typ: str) -> list[tuple[int, int]]:
+        spans: dict[int, int] = {}
+        for interval_group in self.groups.values():
+            for device_group in interval_group.device_groups.values():
+                if device_group.readPreparation is not None:
+                    continue
+                for block_obj in device_group.holdingBlocks if typ == "holding" else device_group.inputBlocks:
+                    for reg in block_obj.regs:
+                        spans[reg] = max(spans.get(reg, reg), self._entity_span_end(block_obj.descriptions, reg))
+        return sorted(spans.items())
+
+    async def _probe_range(self, typ: str, start: int, end: int) -> bool:
+        """Probe [start, end), repeating a failed probe so that a single collision or timeout does not mark the range unreadable."""
+        probe_block = block(start=start, end=end, descriptions={}, regs=[start])
+        for _attempt in range(DISCOVERY_PROBE_ATTEMPTS):
+            if await self._probe_block(probe_block, typ, timeout=self._quarantine_recheck_timeout()):
+                return True
+            if not self._transport.is_connected():
+                break
+        return False
+
+    async def _find_unreadable_gap(self, typ: str, start: int, end: int, holes: set[int], depth: int = 0) -> None:
+        """Narrow down a failing gap read; parts that cannot be split further are marked as holes."""
+        if not self._transport.is_connected():
+            return
+        if end - start == 1 or depth >= DISCOVERY_GAP_SPLIT_DEPTH:
+            holes.update(range(start, end))
+            return
+        mid = (start + end) // 2
+        for part_start, part_end in ((start, mid), (mid, end)):
+            if not await self._probe_range(typ, part_start, part_end):
+                await self._find_unreadable_gap(typ, part_start, part_end, holes, depth + 1)
+
+    async def _discover_max_registers(self, typ: str, start: int, limit: int) -> int:
+        """Binary search the largest read from start that the device answers, never below the plugin block_size."""
+        known_good = min(self.plugin.block_size, MODBUS_MAX_READ_REGISTERS)
+        if limit <= known_good or await self._probe_range(typ, start, start + limit):
+            return max(limit, known_good)
+        low, high = known_good, limit
+        while high - low > 1:
+            mid = (low + high) // 2
+            if await self._probe_range(typ, start, start + mid):
+                low = mid
+            else:
+                high = mid
+        return low
+
     def _entity_span_end(self, desc_map: dict[int, Any], base_reg: int) -> int:
         """Compute end address (exclusive) for a single entity starting at base_reg based on its unit.
         This ensures we never split STR/WORDS or 32-bit entities."""
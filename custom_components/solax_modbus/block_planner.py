@@ -0,0 +1,148 @@
+"""Cost-model planner that groups register entities into Modbus read blocks."""
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+MODBUS_MAX_READ_REGISTERS = 125  # protocol limit for one read holding/input registers request
+SERIAL_BITS_PER_CHAR = 10  # 8N1: start bit, 8 data bits, stop bit
+SERIAL_FRAME_CHARS = 8 + 5 + 7  # read request, response header and crc, 2 x 3.5 chars inter-frame silence
+DEVICE_TURNAROUND_MS = 20.0  # typical inverter processing time before it answers a request
+TCP_ROUND_TRIP_MS = 20.0  # LAN/WiFi dongle round trip, including the device turnaround
+TCP_PER_REGISTER_MS = 0.01  # two payload bytes on an ethernet or wifi link
+
+
+@dataclass(frozen=True)
+class BlockCostModel:
+    """Estimated bus time of one read request, in milliseconds."""
+
+    request_overhead: float  # per request: round trip, framing and device turnaround
+    per_register: float  # per register transferred in the response
+
+    def cost(self, count: int) -> float:
+        """Return the estimated time of one request reading count registers."""
+        return self.request_overhead + count * self.per_register
+
+
+@dataclass(frozen=True)
+class BlockLimits:
+    """Read limits learned from the device, replacing the static plugin block_size."""
+
+    max_registers: int  # largest request the device answered
+    holes: tuple[int, ...] = ()  # sorted gap addresses that fail when read across
+
+
+def readable_runs(spans: Sequence[tuple[int, int]], holes: Sequence[int] = (), max_gap: int = MODBUS_MAX_READ_REGISTERS) -> list[tuple[int, int]]:
+    """Return the (start, end) address ranges that join sorted entity spans across gaps of at most max_gap without holes."""
+    runs: list[tuple[int, int]] = []
+    for base, end in spans:
+        gap_start = runs[-1][1] if runs else base
+        if runs and (base <= gap_start or (base - gap_start <= max_gap and not _has_hole(holes, gap_start, base))):
+            runs[-1] = (runs[-1][0], max(runs[-1][1], end))
+        else:
+            runs.append((base, end))
+    return runs
+
+
+def serial_cost_model(baudrate: int, extra_overhead: float = 0.0) -> BlockCostModel:
+    """Return the cost model of an RTU link at the given baudrate."""
+    char_ms = SERIAL_BITS_PER_CHAR * 1000.0 / max(baudrate, 1)
+    return BlockCostModel(
+        request_overhead=SERIAL_FRAME_CHARS * char_ms + DEVICE_TURNAROUND_MS + extra_overhead,
+        per_register=2 * char_ms,
+    )
+
+
+def transport_cost_model(interface: str, tcp_type: str | None, baudrate: int) -> BlockCostModel:
+    """Return the cost model for a configured hub transport."""
+    if interface == "serial":
+        return serial_cost_model(baudrate)
+    if interface == "tcp" and tcp_type in ("rtu", "ascii"):  # tcp to serial gateway: serial timing behind a tcp hop
+        return serial_cost_model(baudrate, extra_overhead=TCP_ROUND_TRIP_MS)
+    return BlockCostModel(request_overhead=TCP_ROUND_TRIP_MS, per_register=TCP_PER_REGISTER_MS)
+
+
+def _has_hole(holes: Sequence[int], start: int, end: int) -> bool:
+    pos = bisect_left(holes, start)
+    return pos < len(holes) and holes[pos] < end
+
+
+def plan_blocks(
+    spans: Sequence[tuple[int, int]],
+    block_size: int,
+    cost_model: BlockCostModel,
+    holes: Sequence[int] = (),
+    max_registers: int = MODBUS_MAX_READ_REGISTERS,
+) -> list[tuple[int, int]]:
+    """Partition entity spans into read blocks with minimal estimated bus time.
+
+    spans are the (base, end) register ranges of the entities, sorted by base.
+    A block may not start more than block_size registers before its last entity base,
+    may not read more than max_registers registers and may not cover a hole (sorted
+    addresses known to be unreadable). A single entity is always a valid block.
+    Returns (first, last) index ranges into spans, last exclusive.
+    """
+    count = len(spans)
+    best = [0.0] + [float("inf")] * count
+    first_of = [0] * (count + 1)
+    for j in range(count):
+        last_base = spans[j][0]
+        block_end = 0
+        for i in range(j, -1, -1):
+            base = spans[i][0]
+            block_end = max(block_end, spans[i][1])
+            if i < j and (
+                last_base - base > block_size or block_end - base > max_registers or _has_hole(holes, base, block_end)
+            ):  # the block only grows towards smaller i
+                break
+            total = best[i] + cost_model.cost(block_end - base)
+            if total <= best[j + 1]:  # on a tie prefer the larger block
+                best[j + 1] = total
+                first_of[j + 1] = i
+    plan: list[tuple[int, int]] = []
+    last = count
+    while last > 0:
+        first = first_of[last]
+        plan.append((first, last))
+        last = first
+    plan.reverse()
+    return plan
+
+
+def replay_layout(
+    segments: Sequence[Sequence[tuple[int, int]]],
+    layout: Sequence[Sequence[int]],
+    block_size: int,
+    holes: Sequence[int] = (),
+    max_registers: int = MODBUS_MAX_READ_REGISTERS,
+) -> list[list[tuple[int, int]]] | None:
+    """Return the plan_blocks result of each segment that reproduces a saved block layout, or None if it does not fit.
+
+    layout lists the entity bases of each block, in order. It fits if its blocks cover the entity bases of
+    the segments exactly and in order, without a block crossing the end of a segment, and every block keeps
+    the current limits of plan_blocks (block_size, max_registers, holes), which may be lower than when it was saved.
+    """
+    blocks = iter(layout)
+    plans: list[list[tuple[int, int]]] = []
+    for spans in segments:
+        bases = [base for base, _end in spans]
+        plan: list[tuple[int, int]] = []
+        first = 0
+        while first < len(bases):
+            regs = list(next(blocks, ()))
+            last = first + len(regs)
+            if not regs or regs != bases[first:last] or not _block_fits(spans[first:last], block_size, holes, max_registers):
+                return None
+            plan.append((first, last))
+            first = last
+        plans.append(plan)
+    return plans if next(blocks, None) is None else None
+
+
+def _block_fits(spans: Sequence[tuple[int, int]], block_size: int, holes: Sequence[int], max_registers: int) -> bool:
+    """Return whether one block of entity spans keeps the limits plan_blocks applies; a single entity always fits."""
+    if len(spans) < 2:
+        return True
+    base = spans[0][0]
+    block_end = max(end for _base, end in spans)
+    return spans[-1][0] - base <= block_size and block_end - base <= max_registers and not _has_hole(holes, base, block_end)
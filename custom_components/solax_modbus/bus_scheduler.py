@@ -0,0 +1,82 @@
+"""Priority scheduling of Modbus bus access, one request at a time."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import Context, ContextVar, copy_context
+from typing import Any
+
+BUS_PRIORITY_WRITE = 0  # user writes from number/select/switch/button entities go first
+BUS_PRIORITY_BACKGROUND = 1_000_000  # detection, bisect and quarantine probes, discovery: after every poll
+# polls use their interval in seconds as priority, so faster groups are served before slower ones
+
+_bus_priority: ContextVar[int] = ContextVar("solax_modbus_bus_priority", default=BUS_PRIORITY_BACKGROUND)
+
+
+@contextmanager
+def bus_priority(priority: int) -> Iterator[None]:
+    """Run the bus requests of the current task (and the tasks it creates) with priority."""
+    token = _bus_priority.set(priority)
+    try:
+        yield
+    finally:
+        _bus_priority.reset(token)
+
+
+class PriorityBusLock:
+    """Drop-in replacement for asyncio.Lock that hands the bus to the most urgent waiter.
+
+    The lock is held for one Modbus request only. When it is released while requests are waiting,
+    it goes to the lowest priority value (FIFO within a priority), so a fast poll or a write can
+    run between two blocks of a slow poll instead of waiting for the whole group.
+    """
+
+    def __init__(self) -> None:
+        self._locked = False
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+
+    def locked(self) -> bool:
+        """Return True if a request holds the bus."""
+        return self._locked
+
+    async def acquire(self, priority: int | None = None) -> bool:
+        """Wait for the bus; priority defaults to the one set by bus_priority for the current task."""
+        if not self._locked and not self._waiters:
+            self._locked = True
+            return True
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (_bus_priority.get() if priority is None else priority, next(self._sequence), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():  # the bus was already handed over to us
+                self.release()
+            raise
+        return True
+
+    def release(self) -> None:
+        """Hand the bus to the most urgent waiter that is still waiting, or free it."""
+        while self._waiters:
+            _priority, _sequence, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)  # ownership passes on, the lock stays locked
+                return
+        self._locked = False
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.release()
+
+
+def background_context() -> Context:
+    """Return a copy of the current context in which bus requests run with background priority, for create_task."""
+    context = copy_context()
+    context.run(_bus_priority.set, BUS_PRIORITY_BACKGROUND)
+    return context
@@ -18,8 +18,8 @@ from .const import (
     WRITE_MULTISINGLE_MODBUS,
     WRITE_SINGLE_MODBUS,
     BaseModbusButtonEntityDescription,
+    applicable_descriptions,
     autorepeat_set,
-    matches_modbus_protocol,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -36,34 +36,31 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
     plugin = hub.plugin
     entities = []
-    for button_info in plugin.BUTTON_TYPES:
-        if plugin.matchInverterWithMask(
-            hub._invertertype, button_info.allowedtypes, hub.seriesnumber, button_info.blacklist
-        ) and matches_modbus_protocol(hub, button_info):
-            button = SolaXModbusButton(hub_name, hub, modbus_addr, hub.device_info, button_info)
-            entities.append(button)
-            if button_info.key == plugin.wakeupButton():
-                hub.wakeupButton = button_info
-            if button_info.value_function:
-                hub.computedEntities[button_info.key] = button_info
-            elif button_info.command is None:
-                _LOGGER.warning(f"button without command and without value_function found: {button_info.key}")
+    for button_info in applicable_descriptions(hub, plugin.BUTTON_TYPES):
+        button = SolaXModbusButton(hub_name, hub, modbus_addr, hub.device_info, button_info)
+        entities.append(button)
+        if button_info.key == plugin.wakeupButton():
+            hub.wakeupButton = button_info
+        if button_info.value_function:
+            hub.computedEntities[button_info.key] = button_info
+        elif button_info.command is None:
+            _LOGGER.warning(f"button without command and without value_function found: {button_info.key}")
 
-            # register dependency chain
-            deplist = button_info.depends_on
-            if isinstance(deplist, str):
-                deplist = (deplist,)
-            if isinstance(
-                deplist,
-                (
-                    list,
-                    tuple,
-                ),
-            ):
-                _LOGGER.debug(f"{hub.name}: {button_info.key} depends on entities {deplist}")
-                for dep_on in deplist:  # register inter-sensor dependencies (e.g. for value functions)
-                    if dep_on != button_info.key:
-                        hub.entity_dependencies.setdefault(dep_on, []).append(button_info.key)  # can be more than one
+        # register dependency chain
+        deplist = button_info.depends_on
+        if isinstance(deplist, str):
+            deplist = (deplist,)
+        if isinstance(
+            deplist,
+            (
+                list,
+                tuple,
+            ),
+        ):
+            _LOGGER.debug(f"{hub.name}: {button_info.key} depends on entities {deplist}")
+            for dep_on in deplist:  # register inter-sensor dependencies (e.g. for value functions)
+                if dep_on != button_info.key:
+                    hub.entity_dependencies.setdefault(dep_on, []).append(button_info.key)  # can be more than one
 
     async_add_entities(entities)
     _LOGGER.info(f"hub.wakeuButton: {hub.wakeupButton}")
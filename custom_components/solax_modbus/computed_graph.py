@@ -0,0 +1,133 @@
+"""Evaluation order of computed sensors, derived from their depends_on declarations and traced reads."""
+
+import heapq
+import logging
+from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ComputedNode:
+    """A computed sensor with the dependencies that gate its evaluation."""
+
+    key: str
+    descr: Any
+    dependencies: frozenset[str] | None  # active declared dependencies; None: no declaration, computed on every poll
+    inputs: frozenset[str] = frozenset()  # declared dependencies and keys the value_function was seen reading
+
+
+class DependencyTracer(MutableMapping[str, Any]):
+    """Datadict stand-in that records every key a value_function looks up.
+
+    Writes are kept in the tracer and mutable values are handed out as copies, so tracing never changes
+    the traced data (e.g. the autorepeat bookkeeping in _repeatUntil); keys the function wrote itself are
+    not reported as read.
+    """
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        self.data = data
+        self.written: dict[str, Any] = {}
+        self.keys_read: set[str] = set()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.written:
+            return self.written[key]
+        self.keys_read.add(key)
+        return self._private(key, self.data[key])
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.written:
+            return self.written[key]
+        self.keys_read.add(key)
+        if key not in self.data:
+            return default
+        return self._private(key, self.data[key])
+
+    def _private(self, key: str, value: Any) -> Any:
+        """Return value, or a copy kept as written value when the function could change it in place."""
+        if isinstance(value, dict | list | set | bytearray):
+            value = self.written[key] = deepcopy(value)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        if key in self.written:
+            return True
+        if isinstance(key, str):
+            self.keys_read.add(key)
+        return key in self.data
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.written[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        self.written.pop(key, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter({**self.data, **self.written})
+
+    def __len__(self) -> int:
+        return len({**self.data, **self.written})
+
+
+def trace_dependencies(descr: Any, samples: Iterable[Mapping[str, Any]]) -> frozenset[str]:
+    """Return the datadict keys the value_function of descr reads when run against each sample, except its own key.
+
+    Branches that a sample does not reach are not seen, so the result is a lower bound of the real dependencies;
+    use samples that exercise the interesting branches. Exceptions of the value_function are ignored.
+    """
+    keys_read: set[str] = set()
+    for sample in samples:
+        tracer = DependencyTracer(sample)
+        try:
+            descr.value_function(0, descr, tracer)
+        except Exception as ex:
+            _LOGGER.debug(f"tracing {descr.key}: value_function failed: {ex}")
+        keys_read |= tracer.keys_read
+    keys_read.discard(descr.key)
+    return frozenset(keys_read)
+
+
+def order_computed_sensors(
+    computed: Mapping[str, Any],
+    active_dependencies: Callable[[Any], set[str] | None],
+    traced_reads: Callable[[Any], frozenset[str]] | None = None,
+) -> tuple[ComputedNode, ...]:
+    """Return the computed sensors in topological order of their inputs that are other computed sensors.
+
+    Inputs are the declared dependencies plus, if traced_reads is given, the keys the value_function reads.
+    Independent sensors keep their registration order. Sensors on a dependency cycle cannot be ordered;
+    they are appended at the end in registration order.
+    """
+    nodes: list[ComputedNode] = []
+    for key, descr in computed.items():
+        dependencies = active_dependencies(descr)
+        declared = frozenset() if dependencies is None else frozenset(dependencies)
+        inputs = declared | traced_reads(descr) if traced_reads is not None else declared
+        nodes.append(ComputedNode(key, descr, None if dependencies is None else declared, inputs))
+    position = {node.key: index for index, node in enumerate(nodes)}
+    waiting_for = [0] * len(nodes)
+    dependents: list[list[int]] = [[] for _ in nodes]
+    for index, node in enumerate(nodes):
+        for dependency in node.inputs:
+            upstream = position.get(dependency)
+            if upstream is not None and upstream != index:
+                waiting_for[index] += 1
+                dependents[upstream].append(index)
+
+    ready = [index for index, count in enumerate(waiting_for) if count == 0]
+    heapq.heapify(ready)
+    order: list[int] = []
+    while ready:
+        index = heapq.heappop(ready)
+        order.append(index)
+        for dependent in dependents[index]:
+            waiting_for[dependent] -= 1
+            if waiting_for[dependent] == 0:
+                heapq.heappush(ready, dependent)
+    ordered = set(order)
+    order.extend(index for index in range(len(nodes)) if index not in ordered)  # dependency cycles
+    return tuple(nodes[index] for index in order)
@@ -50,6 +50,7 @@ from .const import (
     CONF_SCAN_INTERVAL_FAST,
     CONF_SCAN_INTERVAL_MEDIUM,
     CONF_SERIAL_PORT,
+    CONF_TCP_MAX_INFLIGHT,
     CONF_TCP_TYPE,
     CONF_TIME_OUT,
     DEFAULT_BAUDRATE,
@@ -67,9 +68,11 @@ from .const import (
     DEFAULT_READ_PM,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_SERIAL_PORT,
+    DEFAULT_TCP_MAX_INFLIGHT,
     DEFAULT_TCP_TYPE,
     DEFAULT_TIME_OUT,
     DOMAIN,
+    MAX_TCP_MAX_INFLIGHT,
     PLUGIN_PATH,
 )
 
@@ -200,6 +203,7 @@ TCP_SCHEMA = vol.Schema(
         vol.Required(CONF_TCP_TYPE, default=DEFAULT_TCP_TYPE): selector.SelectSelector(
             selector.SelectSelectorConfig(options=TCP_TYPES),
         ),
+        vol.Optional(CONF_TCP_MAX_INFLIGHT, default=DEFAULT_TCP_MAX_INFLIGHT): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_TCP_MAX_INFLIGHT)),
     }
 )
 
@@ -1,8 +1,8 @@
 import logging
 import pathlib
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, is_dataclass
 from datetime import datetime, timedelta
 from enum import StrEnum
 from typing import Any, Self
@@ -45,6 +45,9 @@ DEFAULT_PORT = 502
 DEFAULT_MODBUS_ADDR = 1
 DEFAULT_TCP_TYPE = "tcp"
 CONF_TCP_TYPE = "tcp_type"
+CONF_TCP_MAX_INFLIGHT = "tcp_max_inflight"
+DEFAULT_TCP_MAX_INFLIGHT = 1  # one outstanding request per connection; higher values pipeline reads
+MAX_TCP_MAX_INFLIGHT = 16  # devices and gateways queue only a few requests; more only adds timeouts
 TMPDATA_EXPIRY = 120  # seconds before temp entities return to modbus value
 CONF_INVERTER_NAME_SUFFIX = "inverter_name_suffix"
 CONF_INVERTER_POWER_KW = "inverter_power_kw"
@@ -159,6 +162,51 @@ class base_battery_config:
     battery_sensor_key_prefix: str | None = None
 
 
+class SerialPrefixTable[T]:
+    """Serial number (or firmware) prefixes mapped to what a plugin derives from them, usually an inverter type.
+
+    A lookup behaves like an if/elif chain of startswith tests in declaration order: the first declared
+    prefix that matches wins, so a longer prefix must be declared before a shorter one it should override.
+    Prefixes are bucketed by length, so a lookup costs one dict lookup per distinct prefix length.
+    """
+
+    def __init__(self, entries: Mapping[str, T]) -> None:
+        self._entries: dict[str, tuple[int, T]] = {prefix: (position, value) for position, (prefix, value) in enumerate(entries.items())}
+        self._lengths = sorted({len(prefix) for prefix in self._entries})
+
+    def match(self, identifier: str | None) -> T | None:
+        """Return the value of the first declared prefix of identifier, None if no prefix matches."""
+        if not identifier:
+            return None
+        found: tuple[int, T] | None = None
+        for length in self._lengths:
+            if length > len(identifier):
+                break
+            entry = self._entries.get(identifier[:length])
+            if entry is not None and (found is None or entry[0] < found[0]):
+                found = entry
+        return None if found is None else found[1]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+
+def _description_items(value: Any) -> list[Any]:
+    """Return the frozen descriptions held by a plugin attribute, looking into the battery config one level deep."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return [item for member in vars(value).values() for item in _frozen_items(member)]
+    return _frozen_items(value)
+
+
+def _frozen_items(value: Any) -> list[Any]:
+    if not isinstance(value, list | tuple):
+        return []
+    return [item for item in value if is_dataclass(item) and type(item).__dataclass_params__.frozen]
+
+
 @dataclass
 class plugin_base:
     """Base class for plugin implementations."""
@@ -175,17 +223,26 @@ class plugin_base:
     ENERGY_DASHBOARD_MAPPING: Any = None  # Optional energy dashboard configuration
     block_size: int = 100
     auto_block_ignore_readerror: bool | None = None  # if True or False, inserts a ignore_readerror statement for each block
+    batch_decode: bool = True  # decode all-numeric blocks with one struct unpack; False forces per-register decoding
     # order16: str | None = None # ignored since 2025.09 - assuming "big" for all plugins
     order32: str | None = None  # "big" or "little" - used to be Endian.BIG or Endian.LITTLE
     inverter_model: str | None = None
+    serial_address: int | None = None  # register async_determineInverterType read the serial number from
     default_holding_scangroup: str = SCAN_GROUP_DEFAULT
     default_input_scangroup: str = SCAN_GROUP_DEFAULT  # or SCAN_GROUP_AUTO
     auto_default_scangroup: str = SCAN_GROUP_FAST  # only used when default_xxx_scangroup is set to SCAN_GROUP_AUTO
     auto_slow_scangroup: str = SCAN_GROUP_MEDIUM  # only usedwhen default_xxx_scangroup is set to SCAN_GROUP_AUTO
 
     def create_hub_instance(self) -> Self:
-        """Create an independent runtime plugin instance for one hub."""
-        return deepcopy(self)
+        """Create an independent runtime plugin instance for one hub.
+
+        The frozen entity descriptions are shared with the template; the lists holding them and all other state are copied.
+        """
+        shared: dict[int, Any] = {}
+        for value in vars(self).values():
+            for item in _description_items(value):
+                shared[id(item)] = item
+        return deepcopy(self, shared)
 
     def isAwake(self, datadict: dict[str, Any]) -> bool:
         """Check if inverter is awake."""
@@ -199,6 +256,16 @@ class plugin_base:
         """Determine the inverter type from configuration."""
         return 0
 
+    async def async_confirmInverterType(
+        self, hub: Any, configdict: dict[str, Any], invertertype: int, seriesnumber: str, serial_address: int | None
+    ) -> bool:
+        """Confirm with a cheap read that the inverter detected in an earlier run is still connected.
+
+        serial_address is the serial_address of that run. Return True to skip async_determineInverterType;
+        plugins without a cheap check keep the full detection.
+        """
+        return False
+
     async def async_determineInverterData(self, hub: Any, configdict: dict[str, Any]) -> bool:
         """Determine inverter data from hub."""
         return False
@@ -274,6 +341,16 @@ class BaseModbusSensorEntityDescription(SensorEntityDescription):
     # Possible register keys required by the value function. On partial polls,
     # computed sensors are only recalculated when every active dependency is fresh.
     depends_on: list[str] | None = None
+    # Set when value_function (or a callable scale) is a pure function of the register value and the depends_on keys:
+    # the last inputs and result are kept, and the function is not called again while the inputs are unchanged.
+    # Computed sensors are only memoized when they declare depends_on.
+    memoize: bool = False
+    # Publishing policy for noisy numeric values: a new value is not written to the HA state machine while it stays
+    # within deadband (absolute) or deadband_relative (fraction of the last published value) of the last published value,
+    # but at most for max_silence seconds.
+    deadband: float | None = None
+    deadband_relative: float | None = None
+    max_silence: float = 300
     _energy_dashboard_device_info: Any = None  # DeviceInfo for energy dashboard
     _energy_dashboard_mapping: Any = None  # EnergyDashboardMapping
     _energy_dashboard_source_hub: Any = None  # Source hub reference
@@ -428,6 +505,26 @@ def matches_modbus_protocol(hub: Any, description: Any) -> bool:
     return True
 
 
+def applicable_descriptions[T](hub: Any, descriptions: Iterable[T]) -> list[T]:
+    """Return the descriptions that apply to the inverter of the hub, in declaration order.
+
+    Plugins share a handful of allowedtypes masks between hundreds of descriptions, so matchInverterWithMask
+    is evaluated once per distinct mask and blacklist instead of once per description.
+    """
+    matches: dict[tuple[Any, tuple[Any, ...] | None], bool] = {}
+    applicable: list[T] = []
+    for description in descriptions:
+        allowedtypes = getattr(description, "allowedtypes", 0)
+        blacklist = getattr(description, "blacklist", None)
+        mask = (allowedtypes, None if blacklist is None else tuple(blacklist))
+        matched = matches.get(mask)
+        if matched is None:
+            matched = matches[mask] = hub.plugin.matchInverterWithMask(hub._invertertype, allowedtypes, hub.seriesnumber, blacklist)
+        if matched and matches_modbus_protocol(hub, description):
+            applicable.append(description)
+    return applicable
+
+
 # ========================= autorepeat aux functions to be used on hub.data dictionary ===============================
 
 
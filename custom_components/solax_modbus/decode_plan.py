@@ -0,0 +1,306 @@
+"""Precompiled per-descriptor decode plans for Modbus block reads."""
+
+import logging
+import operator
+import struct
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.const import (
+    PERCENTAGE,
+    UnitOfElectricCurrent,
+    UnitOfElectricPotential,
+    UnitOfPower,
+    UnitOfTemperature,
+)
+from pymodbus.exceptions import ModbusIOException
+
+from .const import (
+    REGISTER_F32,
+    REGISTER_S16,
+    REGISTER_S32,
+    REGISTER_STR,
+    REGISTER_U8H,
+    REGISTER_U8L,
+    REGISTER_U16,
+    REGISTER_U32,
+    REGISTER_ULSB16MSB16,
+    REGISTER_WORDS,
+    SLEEPMODE_LASTAWAKE,
+)
+from .pymodbus_compat import DataType, convert_from_registers
+
+_LOGGER = logging.getLogger(__name__)
+
+# decode(regs, idx, initval, advance) -> (raw value, words consumed)
+RegisterDecoder = Callable[[list[int], int, int, bool], tuple[Any, int]]
+# finish(raw value, datadict) -> scaled and range checked value
+ValueFinisher = Callable[[Any, dict[str, Any]], Any]
+
+_FLOAT32 = struct.Struct(">f")
+_TWO_WORDS = struct.Struct(">HH")
+
+
+@dataclass(frozen=True)
+class DecodePlan:
+    """Decode steps resolved once for one sensor description."""
+
+    descr: Any  # the description this plan was compiled for; used to detect stale plans
+    key: str
+    data_type: str | None
+    little: bool  # 32-bit word order of this description
+    decode: RegisterDecoder
+    finish: ValueFinisher
+    is_words: bool  # REGISTER_WORDS values are lists by design
+    lastawake: bool  # SLEEPMODE_LASTAWAKE: only store while the inverter is awake
+    needs_locals: bool  # read_scale_exceptions: only store once local data has been loaded
+
+
+def _is_little(order: Any) -> bool:
+    order = getattr(order, "value", order)
+    return isinstance(order, str) and order.lower() == "little"
+
+
+def _compile_decoder(name: str, descr: Any, plugin_order32: Any) -> RegisterDecoder:
+    """Return a decoder specialized for the register data type of descr."""
+    unit = descr.register_data_type
+    order32 = getattr(descr, "order32", None) or plugin_order32
+    little = _is_little(order32)
+
+    if unit == REGISTER_U16:
+
+        def decode_u16(regs: list[int], idx: int, initval: int, advance: bool) -> tuple[Any, int]:
+            return regs[idx], 1
+
+        return decode_u16
+
+    if unit == REGISTER_S16:
+
+        def decode_s16(regs: list[int], idx: int, initval: int, advance: bool) -> tuple[Any, int]:
+            val = regs[idx]
+            return (val - 0x10000 if val & 0x8000 else val), 1
+
+        return decode_s16
+
+    if unit in (REGISTER_U32, REGISTER_S32, REGISTER_F32):
+        hi_off, lo_off = (1, 0) if little else (0, 1)
+        signed = unit == REGISTER_S32
+        is_float = unit == REGISTER_F32
+
+        def decode_32(regs: list[int], idx: int, initval: int, advance: bool) -> tuple[Any, int]:
+            hi = regs[idx + hi_off]
+            lo = regs[idx + lo_off]
+            if is_float:
+                return _FLOAT32.unpack(_TWO_WORDS.pack(hi, lo))[0], 2
+            val = (hi << 16) | lo
+            if signed and val & 0x80000000:
+                val -= 0x100000000
+            return val, 2
+
+        return decode_32
+
+    if unit == REGISTER_STR:
+        wc = descr.wordcount or 0
+
+        def decode_str(regs: list[int], idx: int, initval: int, advance: bool) -> tuple[Any, int]:
+            raw = convert_from_registers(regs[idx : idx + wc], DataType.STRING, order32)  # type: ignore[attr-defined]
+            return (raw.decode("ascii", errors="ignore") if isinstance(raw, (bytes, bytearray)) else str(raw)), wc
+
+        return decode_str
+
+    if unit == REGISTER_WORDS:
+        wc = descr.wordcount or 0
+
+        def decode_words(regs: list[int], idx: int, initval: int, advance: bool) -> tuple[Any, int]:
+            words = regs[idx : idx + wc]
+            if len(words) != wc:
+                raise IndexError(f"{len(words)} of {wc} words available")
+            return words, wc
+
+        return decode_words
+
+    if unit == REGISTER_ULSB16MSB16:
+        lsb_first = order32 == "big"
+
+        def decode_ulsb16msb16(regs: list[int], idx: int, initval: int, advance: bool) -> tuple[Any, int]:
+            lo = regs[idx]
+            hi = regs[idx + 1]
+            return ((hi + lo * 65536) if lsb_first else (lo + hi * 65536)), 2
+
+        return decode_ulsb16msb16
+
+    if unit in (REGISTER_U8L, REGISTER_U8H):
+        high = unit == REGISTER_U8H
+
+        def decode_u8(regs: list[int], idx: int, initval: int, advance: bool) -> tuple[Any, int]:
+            if advance:
+                base, words_used = regs[idx], 1
+            else:
+                base, words_used = initval, 0
+            return (base >> 8 if high else base % 256), words_used
+
+        return decode_u8
+
+    def decode_undefined(regs: list[int], idx: int, initval: int, advance: bool) -> tuple[Any, int]:
+        _LOGGER.warning(f"{name}: undefinded unit for entity {descr.key} - setting value to zero")
+        return 0, 0
+
+    return decode_undefined
+
+
+def _value_bounds(descr: Any, inverter_power_kw: float) -> tuple[Any, Any]:
+    """Resolve the plausibility range exactly as the historic per-read checks did."""
+    native_unit = getattr(descr, "native_unit_of_measurement", None)
+    if native_unit == PERCENTAGE:
+        return getattr(descr, "min_value", 0), getattr(descr, "max_value", 100)
+    if native_unit == UnitOfTemperature.CELSIUS:
+        return getattr(descr, "min_value", -100), getattr(descr, "max_value", 200)
+    if native_unit in (UnitOfPower.KILO_WATT, UnitOfElectricCurrent.AMPERE):
+        return getattr(descr, "min_value", -inverter_power_kw * 2), getattr(descr, "max_value", +inverter_power_kw * 2)
+    if native_unit == UnitOfElectricPotential.VOLT:
+        return getattr(descr, "min_value", 0), getattr(descr, "max_value", 2000)
+    # UnitOfFrequency.HERTZ deliberately falls through: its 20..80 default never took effect
+    return getattr(descr, "min_value", None), getattr(descr, "max_value", None)
+
+
+def _dependency_keys(descr: Any) -> tuple[str, ...]:
+    """Return the depends_on keys of descr as a tuple."""
+    depends_on = getattr(descr, "depends_on", None) or ()
+    return (depends_on,) if isinstance(depends_on, str) else tuple(depends_on)
+
+
+def _compile_finisher(descr: Any, inverter_power_kw: float) -> ValueFinisher:
+    """Return the scaling step for descr, with range checks for numeric scales."""
+    scale = descr.scale
+    key = descr.key
+
+    if type(scale) is dict:
+
+        def finish_dict(val: Any, data: dict[str, Any]) -> Any:
+            return scale.get(val, "Unknown")
+
+        return finish_dict
+
+    if callable(scale):
+        if getattr(descr, "memoize", False):
+            depends_on = _dependency_keys(descr)
+            last: list[Any] = [None, None]  # inputs and result of the last call
+
+            def finish_memoized(val: Any, data: dict[str, Any]) -> Any:
+                inputs = (val, *(data.get(dependency) for dependency in depends_on))
+                if last[0] != inputs:
+                    last[1] = scale(val, descr, data)
+                    last[0] = inputs
+                return last[1]
+
+            return finish_memoized
+
+        def finish_callable(val: Any, data: dict[str, Any]) -> Any:
+            return scale(val, descr, data)
+
+        return finish_callable
+
+    read_scale = descr.read_scale  # read scale might still be wrong the first polling cycle
+    rounding = descr.rounding
+    min_val, max_val = _value_bounds(descr, inverter_power_kw)
+
+    def finish_numeric(val: Any, data: dict[str, Any]) -> Any:
+        try:
+            return_value = round(val * scale * read_scale, rounding)
+        except Exception:
+            return_value = val  # probably a REGISTER_WORDS instance
+        if min_val is not None and return_value < min_val:
+            raise ModbusIOException(f"Value {return_value} of '{key}' lower than {min_val}")  # type: ignore[no-untyped-call]
+        if max_val is not None and return_value > max_val:
+            raise ModbusIOException(f"Value {return_value} of '{key}' greater than {max_val}")  # type: ignore[no-untyped-call]
+        return return_value
+
+    return finish_numeric
+
+
+def compile_decode_plan(name: str, descr: Any, plugin_order32: Any, inverter_power_kw: float) -> DecodePlan:
+    """Compile the decode, scale and store decisions for one sensor description."""
+    return DecodePlan(
+        descr=descr,
+        key=descr.key,
+        data_type=descr.register_data_type,
+        little=_is_little(getattr(descr, "order32", None) or plugin_order32),
+        decode=_compile_decoder(name, descr, plugin_order32),
+        finish=_compile_finisher(descr, inverter_power_kw),
+        is_words=descr.register_data_type == REGISTER_WORDS,
+        lastawake=descr.sleepmode == SLEEPMODE_LASTAWAKE,
+        needs_locals=bool(descr.read_scale_exceptions),
+    )
+
+
+# struct codes for register types that can be decoded as part of a whole block
+_BATCH_CODES: dict[str | None, str] = {
+    REGISTER_U16: "H",
+    REGISTER_S16: "h",
+    REGISTER_U32: "I",
+    REGISTER_S32: "i",
+    REGISTER_F32: "f",
+    REGISTER_U8L: "H",
+    REGISTER_U8H: "H",
+}
+_BYTE_TYPES = (REGISTER_U8L, REGISTER_U8H)
+
+
+@dataclass(frozen=True)
+class BlockDecodePlan:
+    """One gather, pack and unpack for all descriptions of a block."""
+
+    count: int  # number of registers the response must hold
+    gather: Callable[[list[int]], Any]  # picks the used words, 32-bit little word order already swapped
+    packer: struct.Struct
+    unpacker: struct.Struct
+    entries: tuple[tuple[int, Any, DecodePlan, bool], ...]  # (value index, descr, plan, byte entity) in block order
+
+    def unpack(self, regs: list[int]) -> tuple[Any, ...]:
+        """Decode all raw values of the block in one pass."""
+        return self.unpacker.unpack(self.packer.pack(*self.gather(regs)))
+
+
+def compile_block_decode_plan(blk: Any, plan_for: Callable[[Any], DecodePlan]) -> BlockDecodePlan | None:
+    """Compile a batch decoder for blk, or return None if a description needs per-register decoding."""
+    indices: list[int] = []
+    codes: list[str] = []
+    entries: list[tuple[int, Any, DecodePlan, bool]] = []
+    idx = 0
+    for reg in blk.regs:
+        idx = max(idx, reg - blk.start)  # same alignment rule as the per-register loop
+        descr = blk.descriptions[reg]
+        if isinstance(descr, dict):
+            subs = [(d, plan_for(d)) for d in descr.values()]
+            if any(plan.data_type not in _BYTE_TYPES for _d, plan in subs):
+                return None
+            for d, plan in subs:
+                entries.append((len(codes), d, plan, True))
+            indices.append(idx)
+            codes.append("H")
+            idx += 1
+            continue
+        plan = plan_for(descr)
+        code = _BATCH_CODES.get(plan.data_type)
+        if code is None:
+            return None
+        entries.append((len(codes), descr, plan, plan.data_type in _BYTE_TYPES))
+        codes.append(code)
+        if code in ("I", "i", "f"):
+            indices.extend((idx + 1, idx) if plan.little else (idx, idx + 1))
+            idx += 2
+        else:
+            indices.append(idx)
+            idx += 1
+    if not indices:
+        return None
+    # itemgetter with a single index would return a bare value instead of a tuple
+    gather = operator.itemgetter(*indices) if len(indices) > 1 else operator.itemgetter(slice(indices[0], indices[0] + 1))
+    return BlockDecodePlan(
+        count=max(indices) + 1,
+        gather=gather,
+        packer=struct.Struct(f">{len(indices)}H"),
+        unpacker=struct.Struct(">" + "".join(codes)),
+        entries=tuple(entries),
+    )
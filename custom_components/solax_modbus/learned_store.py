@@ -0,0 +1,50 @@
+"""What a hub learned about its device at runtime, kept in Home Assistant storage across restarts."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30  # seconds; learned state changes in bursts (e.g. a bisect quarantining several registers)
+
+
+class LearnedDeviceStore:
+    """Storage of one config entry; the stored state only applies to the device with the same serial number.
+
+    The firmware version is stored as well, so that the hub can drop what it learned once it sees
+    the device runs a different firmware.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.learned")
+
+    async def async_load(self, serial: str) -> dict[str, Any] | None:
+        """Return the stored state if it was learned from the device with this serial number."""
+        stored = await self._store.async_load()
+        if not isinstance(stored, dict) or stored.get("serial") != serial:
+            return None
+        return stored
+
+    async def async_load_detection(self) -> dict[str, Any] | None:
+        """Return the stored inverter detection result together with the serial number it belongs to.
+
+        Unlike async_load, this is used before the serial number is known; the caller confirms the serial on the device.
+        """
+        stored = await self._store.async_load()
+        if not isinstance(stored, dict) or not isinstance(stored.get("detection"), dict) or not stored.get("serial"):
+            return None
+        return {**stored["detection"], "serial": stored["serial"]}
+
+    def schedule_save(self, state: Callable[[], dict[str, Any]]) -> None:
+        """Save the state returned by state() after SAVE_DELAY seconds, once for all changes in between."""
+        self._store.async_delay_save(state, SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Delete the stored state, e.g. when the config entry is removed."""
+        await self._store.async_remove()
@@ -21,7 +21,7 @@ from .const import (
     WRITE_MULTISINGLE_MODBUS,
     WRITE_SINGLE_MODBUS,
     BaseModbusNumberEntityDescription,
-    matches_modbus_protocol,
+    applicable_descriptions,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -43,7 +43,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
     plugin = hub.plugin  # getPlugin(hub_name)
     entities = []
-    for number_info in plugin.NUMBER_TYPES:
+    for number_info in applicable_descriptions(hub, plugin.NUMBER_TYPES):
         newdescr = number_info
         if number_info.read_scale_exceptions:
             for (
@@ -52,35 +52,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
             ) in number_info.read_scale_exceptions:
                 if hub.seriesnumber.startswith(prefix):
                     newdescr = replace(number_info, read_scale=value)
-        if plugin.matchInverterWithMask(hub._invertertype, newdescr.allowedtypes, hub.seriesnumber, newdescr.blacklist) and matches_modbus_protocol(
-            hub, newdescr
-        ):
-            number = SolaXModbusNumber(hub_name, hub, modbus_addr, hub.device_info, newdescr)
-            if newdescr.write_method == WRITE_DATA_LOCAL:
-                hub.writeLocals[newdescr.key] = newdescr
-            # Use the explicit sensor_key if provided, otherwise fall back to the number's own key.
-            dependency_key = getattr(newdescr, "sensor_key", newdescr.key)
-            if dependency_key != newdescr.key:
-                hub.entity_dependencies.setdefault(dependency_key, []).append(newdescr.key)  # can be more than one
+        number = SolaXModbusNumber(hub_name, hub, modbus_addr, hub.device_info, newdescr)
+        if newdescr.write_method == WRITE_DATA_LOCAL:
+            hub.writeLocals[newdescr.key] = newdescr
+        # Use the explicit sensor_key if provided, otherwise fall back to the number's own key.
+        dependency_key = getattr(newdescr, "sensor_key", newdescr.key)
+        if dependency_key != newdescr.key:
+            hub.entity_dependencies.setdefault(dependency_key, []).append(newdescr.key)  # can be more than one
 
-            # register dependency chain
-            deplist = newdescr.depends_on
-            if isinstance(deplist, str):
-                deplist = (deplist,)
-            if isinstance(
-                deplist,
-                (
-                    list,
-                    tuple,
-                ),
-            ):
-                _LOGGER.debug(f"{hub.name}: {newdescr.key} depends on entities {deplist}")
-                for dep_on in deplist:  # register inter-sensor dependencies (e.g. for value functions)
-                    if dep_on != newdescr.key:
-                        hub.entity_dependencies.setdefault(dep_on, []).append(newdescr.key)  # can be more than one
+        # register dependency chain
+        deplist = newdescr.depends_on
+        if isinstance(deplist, str):
+            deplist = (deplist,)
+        if isinstance(
+            deplist,
+            (
+                list,
+                tuple,
+            ),
+        ):
+            _LOGGER.debug(f"{hub.name}: {newdescr.key} depends on entities {deplist}")
+            for dep_on in deplist:  # register inter-sensor dependencies (e.g. for value functions)
+                if dep_on != newdescr.key:
+                    hub.entity_dependencies.setdefault(dep_on, []).append(newdescr.key)  # can be more than one
 
-            hub.numberEntities[newdescr.key] = number
-            entities.append(number)
+        hub.numberEntities[newdescr.key] = number
+        entities.append(number)
     async_add_entities(entities)
     return True
 
@@ -0,0 +1,190 @@
+"""Modbus TCP client that keeps several read requests in flight on one connection."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import struct
+from contextlib import suppress
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
+
+from pymodbus.exceptions import ConnectionException, ModbusIOException
+
+_LOGGER = logging.getLogger(__name__)
+
+_MBAP = struct.Struct(">HHHB")  # transaction id, protocol id (0), length of unit id + pdu, unit id
+_READ_REQUEST = struct.Struct(">BHH")  # function code, address, count
+_READ_HOLDING_REGISTERS = 0x03
+_READ_INPUT_REGISTERS = 0x04
+_WRITE_SINGLE_REGISTER = 0x06
+_WRITE_MULTIPLE_REGISTERS = 0x10
+_EXCEPTION_FLAG = 0x80
+
+
+@dataclass(slots=True)
+class PipelinedModbusResponse:
+    """Pymodbus-compatible response used by the existing hub."""
+
+    registers: list[int] = field(default_factory=list)
+    exception_code: int | None = None  # Modbus exception code of an error response
+
+    def isError(self) -> bool:
+        """Return True for a Modbus exception response."""
+        return self.exception_code is not None
+
+
+class AsyncPipelinedTcpClient:
+    """Expose the small pymodbus client surface used by SolaX over a pipelined Modbus TCP connection.
+
+    Each request gets its own MBAP transaction id, so up to max_inflight requests can be outstanding
+    and responses are matched to their requests in whatever order the device answers them.
+    """
+
+    def __init__(self, *, host: str, port: int, timeout: float, max_inflight: int) -> None:
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._slots = asyncio.Semaphore(max(1, max_inflight))
+        self._connect_lock = asyncio.Lock()
+        self._writer: asyncio.StreamWriter | None = None
+        self._receive_task: asyncio.Task[None] | None = None
+        self._pending: dict[int, tuple[int, asyncio.Future[bytes]]] = {}  # transaction id: (unit id, response pdu)
+        self._transaction_ids = itertools.cycle(range(1, 0x10000))
+
+        # Keep the diagnostics/logging attributes consumed by SolaXModbusHub.
+        self.comm_params = SimpleNamespace(host=host, port=port)
+
+    @property
+    def connected(self) -> bool:
+        """Return whether the TCP connection is open."""
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def connect(self) -> bool:
+        """Open the TCP connection and start matching responses to requests."""
+        async with self._connect_lock:
+            if self.connected:
+                return True
+            try:
+                reader, writer = await asyncio.wait_for(asyncio.open_connection(self._host, self._port), self._timeout)
+            except (OSError, TimeoutError) as err:
+                _LOGGER.debug(f"pipelined Modbus TCP connection to {self._host}:{self._port} failed: {err}")
+                return False
+            self._writer = writer
+            self._receive_task = asyncio.get_running_loop().create_task(self._receive_loop(reader))
+        return True
+
+    async def close(self) -> None:
+        """Close the connection and fail all outstanding requests."""
+        writer, self._writer = self._writer, None
+        task, self._receive_task = self._receive_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        self._fail_pending(ConnectionException("connection closed"))  # type: ignore[no-untyped-call]
+        if writer is not None:
+            writer.close()
+            with suppress(OSError):
+                await writer.wait_closed()
+
+    def _fail_pending(self, err: Exception) -> None:
+        pending, self._pending = self._pending, {}
+        for _unit_id, future in pending.values():
+            if not future.done():
+                future.set_exception(err)
+
+    async def _receive_loop(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                transaction_id, protocol_id, length, unit_id = _MBAP.unpack(await reader.readexactly(_MBAP.size))
+                if protocol_id != 0 or length < 2:  # the stream is out of sync, later frames cannot be trusted either
+                    raise ModbusIOException(f"invalid MBAP header: protocol id {protocol_id}, length {length}")  # type: ignore[no-untyped-call]
+                pdu = await reader.readexactly(length - 1)
+                pending = self._pending.pop(transaction_id, None)
+                if pending is None or pending[1].done():  # responses to requests that already timed out are dropped
+                    continue
+                request_unit_id, future = pending
+                if unit_id != request_unit_id:
+                    future.set_exception(ModbusIOException(f"response of unit {unit_id} to a request for unit {request_unit_id}"))  # type: ignore[no-untyped-call]
+                else:
+                    future.set_result(pdu)
+        except asyncio.CancelledError:
+            raise
+        except (asyncio.IncompleteReadError, OSError) as err:
+            _LOGGER.debug(f"pipelined Modbus TCP connection to {self._host}:{self._port} lost: {err}")
+            await self.close()
+        except Exception as err:
+            _LOGGER.warning(f"pipelined Modbus TCP connection to {self._host}:{self._port} closed after a receive error: {err}")
+            await self.close()
+
+    async def _execute(self, unit_id: int, request: bytes) -> bytes:
+        """Send one request pdu and wait for its response pdu; other requests may be sent meanwhile."""
+        async with self._slots:
+            if not self.connected:
+                await self.connect()
+            writer = self._writer
+            if writer is None:
+                raise ConnectionException(f"cannot connect to {self._host}:{self._port}")  # type: ignore[no-untyped-call]
+            transaction_id = next(self._transaction_ids)
+            future: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+            self._pending[transaction_id] = (unit_id, future)
+            try:
+                writer.write(_MBAP.pack(transaction_id, 0, len(request) + 1, unit_id) + request)
+                await writer.drain()
+                return await asyncio.wait_for(future, self._timeout)
+            except TimeoutError as err:
+                raise ModbusIOException(f"no response to transaction {transaction_id} within {self._timeout}s") from err  # type: ignore[no-untyped-call]
+            except OSError as err:
+                await self.close()
+                raise ConnectionException(str(err)) from err  # type: ignore[no-untyped-call]
+            finally:
+                self._pending.pop(transaction_id, None)
+
+    @staticmethod
+    def _unit_id(kwargs: dict[str, Any]) -> int:
+        """Extract the unit id accepted by supported pymodbus versions."""
+        unit_id = kwargs.pop("device_id", kwargs.pop("slave", None))
+        if kwargs:
+            unexpected = ", ".join(sorted(kwargs))
+            raise TypeError(f"Unexpected Modbus TCP arguments: {unexpected}")
+        if unit_id is None:
+            raise TypeError("Modbus TCP unit id is required")
+        return int(unit_id)
+
+    @staticmethod
+    def _response(function_code: int, pdu: bytes) -> PipelinedModbusResponse:
+        """Parse a response pdu of a register request."""
+        try:
+            if pdu[0] == function_code | _EXCEPTION_FLAG:
+                return PipelinedModbusResponse(exception_code=pdu[1])
+            if pdu[0] != function_code:
+                raise ModbusIOException(f"unexpected function code {pdu[0]} in response to {function_code}")  # type: ignore[no-untyped-call]
+            if function_code in (_READ_HOLDING_REGISTERS, _READ_INPUT_REGISTERS):
+                byte_count = pdu[1]
+                return PipelinedModbusResponse(registers=list(struct.unpack(f">{byte_count // 2}H", pdu[2 : 2 + byte_count])))
+        except (IndexError, struct.error) as err:
+            raise ModbusIOException(f"malformed response: {pdu.hex()}") from err  # type: ignore[no-untyped-call]
+        return PipelinedModbusResponse()
+
+    async def _read(self, function_code: int, address: int, count: int, kwargs: dict[str, Any]) -> PipelinedModbusResponse:
+        pdu = await self._execute(self._unit_id(kwargs), _READ_REQUEST.pack(function_code, address, count))
+        return self._response(function_code, pdu)
+
+    async def read_holding_registers(self, *, address: int, count: int, **kwargs: Any) -> PipelinedModbusResponse:
+        """Read holding registers."""
+        return await self._read(_READ_HOLDING_REGISTERS, address, count, kwargs)
+
+    async def read_input_registers(self, *, address: int, count: int, **kwargs: Any) -> PipelinedModbusResponse:
+        """Read input registers."""
+        return await self._read(_READ_INPUT_REGISTERS, address, count, kwargs)
+
+    async def write_register(self, *, address: int, value: int, **kwargs: Any) -> PipelinedModbusResponse:
+        """Write one holding register."""
+        request = struct.pack(">BHH", _WRITE_SINGLE_REGISTER, address, value)
+        return self._response(_WRITE_SINGLE_REGISTER, await self._execute(self._unit_id(kwargs), request))
+
+    async def write_registers(self, *, address: int, values: list[int], **kwargs: Any) -> PipelinedModbusResponse:
+        """Write multiple holding registers."""
+        request = struct.pack(f">BHHB{len(values)}H", _WRITE_MULTIPLE_REGISTERS, address, len(values), 2 * len(values), *values)
+        return self._response(_WRITE_MULTIPLE_REGISTERS, await self._execute(self._unit_id(kwargs), request))
@@ -42,6 +42,7 @@ from custom_components.solax_modbus.const import (  # type: ignore[attr-defined]
     BaseModbusSelectEntityDescription,
     BaseModbusSensorEntityDescription,
     BaseModbusTimeEntityDescription,
+    SerialPrefixTable,
     UnitOfReactivePower,
     plugin_base,
     value_function_rtc_ymd,
@@ -9656,115 +9657,114 @@ TIME_TYPES = [
 SERIAL_NUMBER_REGISTERS = (3001, 209, 23)
 
 # Serial-number prefixes from the supported Growatt model families.
-SERIAL_PREFIX_TYPES = {
-    # MIN hybrid
-    "ABJ": HYBRID | GEN4 | X1,  # MIN 2500 TL-XH Hybrid, 2 MPPT
-    "SKL": HYBRID | GEN4 | X1,  # MIN 3600 TL-XH Hybrid, 2 MPPT
-    "XVM": HYBRID | GEN4 | X1,  # MIN 5000 TL-XH Hybrid, 2 MPPT
-    "SMN": HYBRID | GEN4 | X1 | MPPT4,  # MIN TL-XH-US Hybrid, 4 MPPT
-    "JGQ": HYBRID | GEN4 | X1 | MPPT3,  # MIN 7600 TL-XH-US Hybrid (Split Phase), 3 MPPT
-    "HJU": HYBRID | GEN4 | X1,  # MIN 4200TL-XH2 Hybrid, 2 MPPT
-    "VFJ": HYBRID | GEN4 | X1 | MPPT4,  # MIN 10000 TL-XH-US Hybrid (Split Phase), 4 MPPT
-    # MOD hybrid
-    "XHL": HYBRID | GEN4 | X1,  # MOD 4000 TL3-XH Hybrid, 2 MPPT
-    "DPS": HYBRID | GEN4 | X3,  # MOD 5000 TL3-HU Hybrid, 2 MPPT
-    "DMS": HYBRID | GEN4 | X3 | MPPT3,  # MOD 8000 TL3-HU Hybrid, 3 MPPT
-    "DKS": HYBRID | GEN4 | X3 | MPPT3,  # MOD 10000 TL3-HU Hybrid, 3 MPPT
-    "DO1": HYBRID | GEN4 | X3 | MPPT3,  # MOD 12000 TL3-HU Hybrid, 3 MPPT
-    "TTS": HYBRID | GEN4 | X3 | MPPT3,  # Hybrid KTL3-HU 12kW
-    "TSS": HYBRID | GEN4 | X3 | MPPT3,  # Hybrid KTL3-HU 12kW
-    "PYL": HYBRID | GEN4 | X3,  # MOD 5000 TL3-XH Hybrid, 2 MPPT
-    "JCM": HYBRID | GEN4 | X3,  # MOD 6000 TL3-XH Hybrid, 2 MPPT
-    "MEK": HYBRID | GEN4 | X3,  # MOD 7000 TL3-XH Hybrid, 2 MPPT
-    "MFK": HYBRID | GEN4 | X1,  # MOD 8000 TL3-XH Hybrid, 2 MPPT
-    "DFK": HYBRID | GEN4 | X3,  # MOD 100000 TL3-XH Hybrid, 2 MPPT
-    "EGR": HYBRID | GEN4 | X3 | MPPT3,  # MOD 150000 TL3-HU Hybrid, 3 MPPT
-    # MID hybrid
-    "KLN": HYBRID | GEN4 | X3,  # MID 15000 TL3-XH Hybrid, 2 MPPT
-    "KMN": HYBRID | GEN4 | X3,  # MID 17000 TL3-XH Hybrid, 2 MPPT
-    "KNN": HYBRID | GEN4 | X3 | MPPT3,  # MID 25000 TL3-XH Hybrid, 3 MPPT
-    "RKM": HYBRID | GEN4 | X3 | MPPT3,  # MID 30000 TL3-XH Hybrid, 3 MPPT
-    "DLP": HYBRID | GEN4 | X3 | MPPT3,  # MID 30000 TL3-XH Hybrid, 3 MPPT
-    # MOD BP hybrid
-    "FMP": HYBRID | GEN4 | X3,  # MOD 5000 TL3-XH (BP) Hybrid, 2 MPPT
-    "FPP": HYBRID | GEN4 | X3,  # MOD 7000 TL3-XH (BP) Hybrid, 2 MPPT
-    "FQP": HYBRID | GEN4 | X3,  # MOD 8000 TL3-XH (BP) Hybrid, 2 MPPT
-    "CZM": HYBRID | GEN4 | X3,  # MOD 10000 TL3-XH (BP) Hybrid, 2 MPPT
-    # SPH, SPE and SPA storage
-    "YRP": HYBRID | GEN3 | X1,  # SPH 5000 TL-HUB Hybrid, 2 MPPT
-    "NFR": HYBRID | SPF | X1,  # SPE 8000 ES, 2 MPPT
-    "WPD": AC | GEN3 | X1,  # SPA 3000TL BL AC, no PV MPPT
-    # SPF
-    "YRE": HYBRID | SPF | X1,  # SPF 5000 ES, 1 MPPT
-    "TTJ": HYBRID | SPF | X1,  # SPF 5000 ES, 1 MPPT
-    "BNJ": HYBRID | SPF | X1,  # SPF 3000 TL LVM 24P, 1 MPPT
-    "KAM": HYBRID | SPF | X1,  # SPF 5000 ES observed live, 1 MPPT
-    "NUK": HYBRID | SPF | X1,  # SPF 12000T DVM-US MPV, 2 MPPT
-    # WIT
-    "0PE": HYBRID | GEN4 | X3,  # WIT 8000-HU, 2 MPPT
-    "0PC": HYBRID | GEN4 | X3,  # WIT 12000-HU, 2 MPPT
-    "0PH": HYBRID | GEN4 | X3 | MPPT10,  # WIT 100000-HU, 10 MPPT
-    "0HU": HYBRID | GEN4 | X3,  # WIT 15K-HU, 2 MPPT
-    # MIC and MIN PV
-    "FPH": PV | GEN4 | X1,  # MIC 2000 TL-X, 1 MPPT
-    "FWJ": PV | GEN4 | X1,  # MIC 3300 TL-X, 1 MPPT
-    "QYL": PV | GEN4 | X1,  # MIN 2500 TL-X, 2 MPPT
-    "XTD": PV | GEN4 | X1,  # MIN 5000 TL-X, 2 MPPT
-    "BDK": PV | GEN4 | X1,  # MIN 4200 TL-XE, 2 MPPT
-    "WVN": PV | GEN4 | X1 | MPPT3,  # MIN 8000 TL-X2, 3 MPPT
-    # MOD, MID and MAX PV
-    "RDH": PV | GEN2 | X3,  # MOD 4000 TL3-X, 2 MPPT
-    "QEH": PV | GEN2 | X3,  # MOD 8000 TL3-X, 2 MPPT
-    "RPH": PV | GEN2 | X3,  # MOD 15000 TL3-X, 2 MPPT
-    "GXF": PV | GEN4 | X3,  # MID 12000 TL3-XL, 2 MPPT
-    "NAH": PV | GEN4 | X3 | MPPT6,  # MAX 60000 TL3 LV, 6 MPPT
-    # SPH PV
-    "DIE": PV | GEN3 | X1,  # SPH 1000-S, 1 MPPT
-    "PYH": PV | GEN3 | X1,  # SPH 1500 TL-X, 1 MPPT
-    "NLC": PV | GEN3 | X1,  # SPH 3000 BP, 1 MPPT
-    "NRC": PV | GEN3 | X1,  # SPH 5000, 1 MPPT
-    # NEO and older PV models
-    "BZP": PV | GEN | X1,  # Neo 800M-X, 2 MPPT
-    "QNB": PV | GEN | X1,  # 1000-S, 1 MPPT
-    "QMB": PV | GEN | X1,  # 1500-S, 1 MPPT
-    "JLE": PV | GEN | X1,  # 5000 TL3-S, x MPPT
-    "MVC": PV | GEN | X3,  # 12000 TL3-S, ? MPPT
-    "4FZ": PV | GEN | X1,  # 5000 MTL-S, 2 MPPT
-    "BY3": PV | GEN | X1,  # 5000, ? MPPT
-}
+SERIAL_PREFIX_TYPES = SerialPrefixTable(
+    {
+        # MIN hybrid
+        "ABJ": HYBRID | GEN4 | X1,  # MIN 2500 TL-XH Hybrid, 2 MPPT
+        "SKL": HYBRID | GEN4 | X1,  # MIN 3600 TL-XH Hybrid, 2 MPPT
+        "XVM": HYBRID | GEN4 | X1,  # MIN 5000 TL-XH Hybrid, 2 MPPT
+        "SMN": HYBRID | GEN4 | X1 | MPPT4,  # MIN TL-XH-US Hybrid, 4 MPPT
+        "JGQ": HYBRID | GEN4 | X1 | MPPT3,  # MIN 7600 TL-XH-US Hybrid (Split Phase), 3 MPPT
+        "HJU": HYBRID | GEN4 | X1,  # MIN 4200TL-XH2 Hybrid, 2 MPPT
+        "VFJ": HYBRID | GEN4 | X1 | MPPT4,  # MIN 10000 TL-XH-US Hybrid (Split Phase), 4 MPPT
+        # MOD hybrid
+        "XHL": HYBRID | GEN4 | X1,  # MOD 4000 TL3-XH Hybrid, 2 MPPT
+        "DPS": HYBRID | GEN4 | X3,  # MOD 5000 TL3-HU Hybrid, 2 MPPT
+        "DMS": HYBRID | GEN4 | X3 | MPPT3,  # MOD 8000 TL3-HU Hybrid, 3 MPPT
+        "DKS": HYBRID | GEN4 | X3 | MPPT3,  # MOD 10000 TL3-HU Hybrid, 3 MPPT
+        "DO1": HYBRID | GEN4 | X3 | MPPT3,  # MOD 12000 TL3-HU Hybrid, 3 MPPT
+        "TTS": HYBRID | GEN4 | X3 | MPPT3,  # Hybrid KTL3-HU 12kW
+        "TSS": HYBRID | GEN4 | X3 | MPPT3,  # Hybrid KTL3-HU 12kW
+        "PYL": HYBRID | GEN4 | X3,  # MOD 5000 TL3-XH Hybrid, 2 MPPT
+        "JCM": HYBRID | GEN4 | X3,  # MOD 6000 TL3-XH Hybrid, 2 MPPT
+        "MEK": HYBRID | GEN4 | X3,  # MOD 7000 TL3-XH Hybrid, 2 MPPT
+        "MFK": HYBRID | GEN4 | X1,  # MOD 8000 TL3-XH Hybrid, 2 MPPT
+        "DFK": HYBRID | GEN4 | X3,  # MOD 100000 TL3-XH Hybrid, 2 MPPT
+        "EGR": HYBRID | GEN4 | X3 | MPPT3,  # MOD 150000 TL3-HU Hybrid, 3 MPPT
+        # MID hybrid
+        "KLN": HYBRID | GEN4 | X3,  # MID 15000 TL3-XH Hybrid, 2 MPPT
+        "KMN": HYBRID | GEN4 | X3,  # MID 17000 TL3-XH Hybrid, 2 MPPT
+        "KNN": HYBRID | GEN4 | X3 | MPPT3,  # MID 25000 TL3-XH Hybrid, 3 MPPT
+        "RKM": HYBRID | GEN4 | X3 | MPPT3,  # MID 30000 TL3-XH Hybrid, 3 MPPT
+        "DLP": HYBRID | GEN4 | X3 | MPPT3,  # MID 30000 TL3-XH Hybrid, 3 MPPT
+        # MOD BP hybrid
+        "FMP": HYBRID | GEN4 | X3,  # MOD 5000 TL3-XH (BP) Hybrid, 2 MPPT
+        "FPP": HYBRID | GEN4 | X3,  # MOD 7000 TL3-XH (BP) Hybrid, 2 MPPT
+        "FQP": HYBRID | GEN4 | X3,  # MOD 8000 TL3-XH (BP) Hybrid, 2 MPPT
+        "CZM": HYBRID | GEN4 | X3,  # MOD 10000 TL3-XH (BP) Hybrid, 2 MPPT
+        # SPH, SPE and SPA storage
+        "YRP": HYBRID | GEN3 | X1,  # SPH 5000 TL-HUB Hybrid, 2 MPPT
+        "NFR": HYBRID | SPF | X1,  # SPE 8000 ES, 2 MPPT
+        "WPD": AC | GEN3 | X1,  # SPA 3000TL BL AC, no PV MPPT
+        # SPF
+        "YRE": HYBRID | SPF | X1,  # SPF 5000 ES, 1 MPPT
+        "TTJ": HYBRID | SPF | X1,  # SPF 5000 ES, 1 MPPT
+        "BNJ": HYBRID | SPF | X1,  # SPF 3000 TL LVM 24P, 1 MPPT
+        "KAM": HYBRID | SPF | X1,  # SPF 5000 ES observed live, 1 MPPT
+        "NUK": HYBRID | SPF | X1,  # SPF 12000T DVM-US MPV, 2 MPPT
+        # WIT
+        "0PE": HYBRID | GEN4 | X3,  # WIT 8000-HU, 2 MPPT
+        "0PC": HYBRID | GEN4 | X3,  # WIT 12000-HU, 2 MPPT
+        "0PH": HYBRID | GEN4 | X3 | MPPT10,  # WIT 100000-HU, 10 MPPT
+        "0HU": HYBRID | GEN4 | X3,  # WIT 15K-HU, 2 MPPT
+        # MIC and MIN PV
+        "FPH": PV | GEN4 | X1,  # MIC 2000 TL-X, 1 MPPT
+        "FWJ": PV | GEN4 | X1,  # MIC 3300 TL-X, 1 MPPT
+        "QYL": PV | GEN4 | X1,  # MIN 2500 TL-X, 2 MPPT
+        "XTD": PV | GEN4 | X1,  # MIN 5000 TL-X, 2 MPPT
+        "BDK": PV | GEN4 | X1,  # MIN 4200 TL-XE, 2 MPPT
+        "WVN": PV | GEN4 | X1 | MPPT3,  # MIN 8000 TL-X2, 3 MPPT
+        # MOD, MID and MAX PV
+        "RDH": PV | GEN2 | X3,  # MOD 4000 TL3-X, 2 MPPT
+        "QEH": PV | GEN2 | X3,  # MOD 8000 TL3-X, 2 MPPT
+        "RPH": PV | GEN2 | X3,  # MOD 15000 TL3-X, 2 MPPT
+        "GXF": PV | GEN4 | X3,  # MID 12000 TL3-XL, 2 MPPT
+        "NAH": PV | GEN4 | X3 | MPPT6,  # MAX 60000 TL3 LV, 6 MPPT
+        # SPH PV
+        "DIE": PV | GEN3 | X1,  # SPH 1000-S, 1 MPPT
+        "PYH": PV | GEN3 | X1,  # SPH 1500 TL-X, 1 MPPT
+        "NLC": PV | GEN3 | X1,  # SPH 3000 BP, 1 MPPT
+        "NRC": PV | GEN3 | X1,  # SPH 5000, 1 MPPT
+        # NEO and older PV models
+        "BZP": PV | GEN | X1,  # Neo 800M-X, 2 MPPT
+        "QNB": PV | GEN | X1,  # 1000-S, 1 MPPT
+        "QMB": PV | GEN | X1,  # 1500-S, 1 MPPT
+        "JLE": PV | GEN | X1,  # 5000 TL3-S, x MPPT
+        "MVC": PV | GEN | X3,  # 12000 TL3-S, ? MPPT
+        "4FZ": PV | GEN | X1,  # 5000 MTL-S, 2 MPPT
+        "BY3": PV | GEN | X1,  # 5000, ? MPPT
+    }
+)
 
 # Firmware/build prefixes used when no supported serial-number prefix is available.
-FIRMWARE_PREFIX_TYPES = {
-    "dha": PV | GEN | X3,  # PV TL3-SL 10-22kW #1067
-    "DL1": PV | GEN2 | X3,  # PV TL3-X 15kW 3Phase (MOD)
-    "DM1": PV | GEN2 | X3 | MPPT4,  # PV TL3-X 35kW 3Phase (MID)
-    "AH1": PV | GEN3 | X1,  # Hybrid SPH 4kW - 10kW
-    "AJ1": PV | GEN4 | X1,  # PV TL-X 2.5kW - 6kW (MIN)
-    "GH1": PV | GEN4 | X1,  # PV TL-X 2.5kW - 6kW (MIN)
-    "AK1": PV | GEN4 | X1,  # MIN 3600TL-X2, 2 MPPT #2027
-    "AM1": PV | GEN4 | X1 | MPPT3,  # PV TL-X2 7kW - 120kW (MIN)
-    "RAA": HYBRID | GEN3 | X1,  # Hybrid SPH 3kW - 6kW
-    "RA1": HYBRID | GEN3 | X1,  # Hybrid SPH 3kW - 6kW
-    "SPH": HYBRID | GEN3 | X3,  # Hybrid SPH 4kW - 10kW
-    "YA1": HYBRID | GEN3 | X3,  # Hybrid SPH 4kW - 10kW 3P TL UP
-    "RH1": AC | GEN3 | X1,  # SPA 3000TL BL AC, no PV MPPT
-    "AL1": HYBRID | GEN4 | X1,  # Hybrid TL-XH 2.5kW - 6kW (MIN)
-    "DN1": HYBRID | GEN4 | X3,  # Hybrid TL3-XH (BP) 3kW - 10kW (MOD), 11kW - 30kW (MID)
-    "V": HYBRID | GEN4 | X3,  # Hybrid TL3-XH 3kW - 10kW (MOD)
-    "067": HYBRID | SPF | X1,  # Hybrid SPF 5kW / SPF5000ES branch, treated as 1 MPPT
-    "113": HYBRID | SPF | X1,  # Hybrid SPF 5kW / SPF5000ES branch, treated as 1 MPPT
-    "500": HYBRID | SPF | X1,  # Hybrid SPF 5kW / SPF5000ES branch, treated as 1 MPPT
-    "040": HYBRID | SPF | X1,  # Hybrid SPF 5kW / SPF5000ES branch, treated as 1 MPPT
-}
-
-
-def _inverter_type_from_prefix(identifier: str | None, prefix_types: dict[str, int]) -> int:
-    if not identifier:
-        return 0
-    for prefix, invertertype in prefix_types.items():
-        if identifier.startswith(prefix):
-            return invertertype
-    return 0
+FIRMWARE_PREFIX_TYPES = SerialPrefixTable(
+    {
+        "dha": PV | GEN | X3,  # PV TL3-SL 10-22kW #1067
+        "DL1": PV | GEN2 | X3,  # PV TL3-X 15kW 3Phase (MOD)
+        "DM1": PV | GEN2 | X3 | MPPT4,  # PV TL3-X 35kW 3Phase (MID)
+        "AH1": PV | GEN3 | X1,  # Hybrid SPH 4kW - 10kW
+        "AJ1": PV | GEN4 | X1,  # PV TL-X 2.5kW - 6kW (MIN)
+        "GH1": PV | GEN4 | X1,  # PV TL-X 2.5kW - 6kW (MIN)
+        "AK1": PV | GEN4 | X1,  # MIN 3600TL-X2, 2 MPPT #2027
+        "AM1": PV | GEN4 | X1 | MPPT3,  # PV TL-X2 7kW - 120kW (MIN)
+        "RAA": HYBRID | GEN3 | X1,  # Hybrid SPH 3kW - 6kW
+        "RA1": HYBRID | GEN3 | X1,  # Hybrid SPH 3kW - 6kW
+        "SPH": HYBRID | GEN3 | X3,  # Hybrid SPH 4kW - 10kW
+        "YA1": HYBRID | GEN3 | X3,  # Hybrid SPH 4kW - 10kW 3P TL UP
+        "RH1": AC | GEN3 | X1,  # SPA 3000TL BL AC, no PV MPPT
+        "AL1": HYBRID | GEN4 | X1,  # Hybrid TL-XH 2.5kW - 6kW (MIN)
+        "DN1": HYBRID | GEN4 | X3,  # Hybrid TL3-XH (BP) 3kW - 10kW (MOD), 11kW - 30kW (MID)
+        "V": HYBRID | GEN4 | X3,  # Hybrid TL3-XH 3kW - 10kW (MOD)
+        "067": HYBRID | SPF | X1,  # Hybrid SPF 5kW / SPF5000ES branch, treated as 1 MPPT
+        "113": HYBRID | SPF | X1,  # Hybrid SPF 5kW / SPF5000ES branch, treated as 1 MPPT
+        "500": HYBRID | SPF | X1,  # Hybrid SPF 5kW / SPF5000ES branch, treated as 1 MPPT
+        "040": HYBRID | SPF | X1,  # Hybrid SPF 5kW / SPF5000ES branch, treated as 1 MPPT
+    }
+)
+
+
+def _inverter_type_from_prefix(identifier: str | None, prefix_types: SerialPrefixTable[int]) -> int:
+    return prefix_types.match(identifier) or 0
 
 
 @dataclass(kw_only=True)
@@ -9773,6 +9773,7 @@ class growatt_plugin(plugin_base):
         _LOGGER.info(f"{hub.name}: trying to determine inverter type")
         invertertype = 0
         identifier: str | None = None
+        self.serial_address = None
 
         for address in SERIAL_NUMBER_REGISTERS:
             candidate = await async_read_serialnr(hub, address)
@@ -9780,6 +9781,7 @@ class growatt_plugin(plugin_base):
             if candidate_type:
                 identifier = candidate
                 invertertype = candidate_type
+                self.serial_address = address
                 break
             if candidate:
                 _LOGGER.info(f"{hub.name}: unrecognized serial number at 0x{address:x}: {candidate}")
@@ -9793,6 +9795,7 @@ class growatt_plugin(plugin_base):
                 invertertype = _inverter_type_from_prefix(firmware, SERIAL_PREFIX_TYPES)
             if invertertype:
                 identifier = firmware
+                self.serial_address = 9
             else:
                 displayed_firmware = firmware or "unknown"
                 _LOGGER.error(f"unrecognized {hub.name} inverter type - firmware version : {displayed_firmware}")
@@ -9811,6 +9814,14 @@ class growatt_plugin(plugin_base):
 
         return invertertype
 
+    async def async_confirmInverterType(
+        self, hub: Any, configdict: dict[str, Any], invertertype: int, seriesnumber: str, serial_address: int | None
+    ) -> bool:
+        if serial_address is None or await async_read_serialnr(hub, serial_address) != seriesnumber:
+            return False
+        hub.seriesnumber = seriesnumber
+        return True
+
     def matchInverterWithMask(
         self,
         inverterspec: Any,
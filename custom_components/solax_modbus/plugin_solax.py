@@ -1,5 +1,5 @@
 import logging
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, replace
 from time import time
 from typing import Any
@@ -56,6 +56,7 @@ from custom_components.solax_modbus.const import (  # type: ignore[attr-defined]
     BaseModbusSensorEntityDescription,
     BaseModbusSwitchEntityDescription,
     BaseModbusTimeEntityDescription,
+    SerialPrefixTable,
     UnitOfReactivePower,
     autorepeat_remaining,
     autorepeat_stop,
@@ -11327,6 +11328,152 @@ TIME_TYPES = [
 # ============================ plugin declaration =================================================
 
 
+def _x1_vast_type(seriesnumber: str) -> int:
+    kw_value = int(seriesnumber[3:5], 16)
+    return HYBRID | GEN6 | X1 | (MPPT3 if kw_value < 8 else MPPT4)
+
+
+def _x3_g4pro_type(seriesnumber: str) -> int:
+    kw_value = int(seriesnumber[3:5], 16)
+    return HYBRID | GEN6 | X3 | (MPPT3 if kw_value >= 8 else 0)
+
+
+def _x3_mic_pro_type(seriesnumber: str) -> int:
+    kw_value = int(seriesnumber[3:5])
+    return MIC | GEN2 | X3 | (MPPT3 if kw_value >= 25 else 0)
+
+
+# Serial number prefix: (inverter type, inverter model); either may be a function of the serial number.
+# The first matching prefix in this order wins, so keep longer prefixes (e.g. H3BC15L) before shorter ones (H3BC15).
+SERIAL_PREFIX_TYPES: SerialPrefixTable[tuple[int | Callable[[str], int], str | Callable[[str], str] | None]] = SerialPrefixTable(
+    {
+        "L30": (HYBRID | GEN2 | X1, lambda sn: f"X1-Hybrid-{sn[1:2]}.{sn[2:3]}kW SK-TL"),  # Gen2 X1 SK-TL 3kW
+        "U30": (HYBRID | GEN2 | X1, lambda sn: f"X1-Hybrid-{sn[1:2]}.{sn[2:3]}kW SK-SU"),  # Gen2 X1 SK-SU 3kW
+        "L37": (HYBRID | GEN2 | X1, lambda sn: f"X1-Hybrid-{sn[1:2]}.{sn[2:3]}kW SK-TL"),  # Gen2 X1 SK-TL 3.7kW Untested
+        "U37": (HYBRID | GEN2 | X1, lambda sn: f"X1-Hybrid-{sn[1:2]}.{sn[2:3]}kW SK-SU"),  # Gen2 X1 SK-SU 3.7kW Untested
+        "L50": (HYBRID | GEN2 | X1, lambda sn: f"X1-Hybrid-{sn[1:2]}.{sn[2:3]}kW SK-TL"),  # Gen2 X1 SK-TL 5kW
+        "U50": (HYBRID | GEN2 | X1, lambda sn: f"X1-Hybrid-{sn[1:2]}.{sn[2:3]}kW SK-SU"),  # Gen2 X1 SK-SU 5kW
+        "H1E": (HYBRID | GEN3 | X1, lambda sn: f"X1-Hybrid-{sn[3:4]}.{sn[4:5]}kW"),  # Gen3 X1 Early
+        "H1I": (HYBRID | GEN3 | X1, lambda sn: f"X1-Hybrid-{sn[3:4]}.{sn[4:5]}kW"),  # Gen3 X1 Alternative
+        "HCC": (HYBRID | GEN3 | X1, lambda sn: f"X1-Hybrid-{sn[3:4]}.{sn[4:5]}kW"),  # Gen3 X1 Alternative
+        "HUE": (HYBRID | GEN3 | X1, lambda sn: f"X1-Hybrid-{sn[3:4]}.{sn[4:5]}kW"),  # Gen3 X1 Late
+        "XRE": (HYBRID | GEN3 | X1, lambda sn: f"X1-Hybrid-{sn[3:4]}.{sn[4:5]}kW"),  # Gen3 X1 Alternative
+        "XAC": (AC | GEN3 | X1, "X1-AC"),  # X1AC
+        "PRI": (FIT | GEN3 | X1, "X1-FIT"),  # X1-FIT GEN3: AC hardware, uses Hybrid register layout for some registers
+        "H3DE": (HYBRID | GEN3 | X3, lambda sn: f"X3-Hybrid-{sn[3:5]}kW"),  # Gen3 X3
+        "H3E": (HYBRID | GEN3 | X3, lambda sn: f"X3-Hybrid-{sn[4:6]}kW"),  # Gen3 X3
+        "H3LE": (HYBRID | GEN3 | X3, lambda sn: f"X3-Hybrid-{sn[4:6]}kW"),  # Gen3 X3
+        "H3PE": (HYBRID | GEN3 | X3, lambda sn: f"X3-Hybrid-{sn[4:6]}kW"),  # Gen3 X3
+        "H3UE": (HYBRID | GEN3 | X3, lambda sn: f"X3-Hybrid-{sn[4:6]}kW"),  # Gen3 X3
+        "F3D": (AC | GEN3 | X3, "X3-RetroFit"),  # RetroFit
+        "F3E": (AC | GEN3 | X3, "X3-RetroFit"),  # RetroFit
+        "63150": (HYBRID | GEN4 | X1, lambda sn: f"X1-TIGO-TSI-{sn[3:4]}.{sn[4:5]}kW"),  # Gen4 X1 5.0kW
+        "H43": (HYBRID | GEN4 | X1, lambda sn: f"X1-Hybrid-{sn[2:3]}.{sn[3:4]}kW"),  # Gen4 X1 3kW / 3.7kW
+        "H44": (HYBRID | GEN4 | X1, lambda sn: f"X1-Hybrid-{sn[2:3]}.{sn[3:4]}kW"),  # Gen4 X1 alt 5kW
+        "H450": (HYBRID | GEN4 | X1, lambda sn: f"X1-Hybrid-{sn[2:3]}.{sn[3:4]}kW"),  # Gen4 X1 5.0kW
+        "H460": (HYBRID | GEN4 | X1, lambda sn: f"X1-Hybrid-{sn[2:3]}.{sn[3:4]}kW"),  # Gen4 X1 6kW?
+        "H475": (HYBRID | GEN4 | X1, lambda sn: f"X1-Hybrid-{sn[2:3]}.{sn[3:4]}kW"),  # Gen4 X1 7.5kW
+        "F43": (AC | GEN4 | X1, lambda sn: f"X1-RetroFit-{sn[2:3]}.{sn[3:4]}kW"),  # RetroFit X1 3kW / 3.7kW?
+        "F450": (AC | GEN4 | X1, lambda sn: f"X1-RetroFit-{sn[2:3]}.{sn[3:4]}kW"),  # RetroFit 5kW
+        "F460": (AC | GEN4 | X1, lambda sn: f"X1-RetroFit-{sn[2:3]}.{sn[3:4]}kW"),  # RetroFit X1 6kW?
+        "F475": (AC | GEN4 | X1, lambda sn: f"X1-RetroFit-{sn[2:3]}.{sn[3:4]}kW"),  # RetroFit X1 7.5kW?
+        "PRE": (AC | GEN4 | X1, "X1-RetroFit"),  # RetroFit
+        "H53": (HYBRID | GEN5 | X1, lambda sn: f"X1-IES-{sn[2:3]}.{sn[3:4]}kW"),  # X1-IES 3.7kW?
+        "H55": (HYBRID | GEN5 | X1 | MPPT3, lambda sn: f"X1-IES-{sn[2:3]}.{sn[3:4]}kW"),  # X1-IES 5kW?
+        "H56": (HYBRID | GEN5 | X1 | MPPT3, lambda sn: f"X1-IES-{sn[2:3]}.{sn[3:4]}kW"),  # X1-IES 6kW?
+        "H58": (HYBRID | GEN5 | X1 | MPPT3, lambda sn: f"X1-IES-{sn[2:3]}.{sn[3:4]}kW"),  # X1-IES 8kW
+        "10M": (_x1_vast_type, lambda sn: f"X1-VAST-{int(sn[3:5], 16)}kW"),  # datasheet name X1-VAST-6K
+        "H31": (HYBRID | GEN4 | X3, "X3-TIGO TSI"),  # TIGO TSI X3
+        "H34": (HYBRID | GEN4 | X3, lambda sn: f"X3-Hybrid-{int(sn[4:6])}kW"),  # Gen4 X3 5-15kW
+        "H3VC83": (HYBRID | GEN4 | X1, lambda sn: f"X3-Hybrid-{sn[4:5]}.{sn[5:6]}kW"),  # Gen4 8.3kW
+        "F34": (AC | GEN4 | X3, "X3-RetroFit"),  # Gen4 X3 FIT
+        "H35A0": (HYBRID | GEN5 | X3, lambda sn: f"X3-IES-{sn[5:6]}kW"),  # X3-IES 4-8kW A
+        "H35A1": (HYBRID | GEN5 | X3, lambda sn: f"X3-IES-{sn[4:6]}kW"),  # X3-IES 10-15kW A
+        "P35A0": (HYBRID | GEN5 | X3, lambda sn: f"X3-IES-{sn[5:6]}kW"),  # X3-IES 4-8kW P
+        "P35A1": (HYBRID | GEN5 | X3, lambda sn: f"X3-IES-{sn[4:6]}kW"),  # X3-IES 10-15kW P
+        "H35F0": (HYBRID | GEN5 | X3, lambda sn: f"X3-IES-{sn[5:6]}kW"),  # X3-IES 4-8kW F
+        "H35F1": (HYBRID | GEN5 | X3, lambda sn: f"X3-IES-{sn[4:6]}kW"),  # X3-IES 10-15kW F
+        "H3BC15L": (HYBRID | GEN5 | MPPT3 | X3, "X3-Ultra-15kW"),  # X3 Ultra 15KP C #1668
+        "H3BC15": (HYBRID | GEN5 | X3, "X3-Ultra-15kW"),  # X3 Ultra C
+        "H3BC19": (HYBRID | GEN5 | X3, "X3-Ultra-19.9kW"),  # X3 Ultra C
+        "H3BC20L": (HYBRID | GEN5 | MPPT3 | X3, "X3-Ultra-20kW"),  # X3 Ultra 20KP C
+        "H3BC20K": (HYBRID | GEN5 | MPPT3 | X3, "X3-Ultra-20kW"),  # X3 Ultra 20KP C #1668
+        "H3BC20": (HYBRID | GEN5 | X3, "X3-Ultra-20kW"),  # X3 Ultra C
+        "H3BC25": (HYBRID | GEN5 | MPPT3 | X3, "X3-Ultra-25kW"),  # X3 Ultra C
+        "H3BC30": (HYBRID | GEN5 | MPPT3 | X3, "X3-Ultra-30kW"),  # X3 Ultra C
+        "H3BD15L": (HYBRID | GEN5 | MPPT3 | X3, "X3-Ultra-15kW"),  # X3 Ultra 15KP D #1668
+        "H3BD15": (HYBRID | GEN5 | X3, "X3-Ultra-15kW"),  # X3 Ultra D
+        "H3BD19": (HYBRID | GEN5 | X3, "X3-Ultra-19.9kW"),  # X3 Ultra D
+        "H3BD20L": (HYBRID | GEN5 | MPPT3 | X3, "X3-Ultra-20kW"),  # X3 Ultra 20KP D
+        "H3BD20K": (HYBRID | GEN5 | MPPT3 | X3, "X3-Ultra-20kW"),  # X3 Ultra 20KP D #1668
+        "H3BD20": (HYBRID | GEN5 | X3, "X3-Ultra-20kW"),  # X3 Ultra D
+        "H3BD25": (HYBRID | GEN5 | MPPT3 | X3, "X3-Ultra-20kW"),  # X3 Ultra D
+        "H3BD30": (HYBRID | GEN5 | MPPT3 | X3, "X3-Ultra-30kW"),  # X3 Ultra D
+        "H3BF15L": (HYBRID | GEN5 | MPPT3 | X3, "X3-Ultra-15kW"),  # X3 Ultra 15KP F #1668
+        "H3BF15": (HYBRID | GEN5 | X3, "X3-Ultra-15kW"),  # X3 Ultra F
+        "H3BF19": (HYBRID | GEN5 | X3, "X3-Ultra-19.9kW"),  # X3 Ultra F
+        "H3BF20L": (HYBRID | GEN5 | MPPT3 | X3, "X3-Ultra-20kW"),  # X3 Ultra 20KP F
+        "H3BF20K": (HYBRID | GEN5 | MPPT3 | X3, "X3-Ultra-20kW"),  # X3 Ultra 20KP F #1668
+        "H3BF20": (HYBRID | GEN5 | X3, "X3-Ultra-20kW"),  # X3 Ultra F
+        "H3BF25": (HYBRID | GEN5 | MPPT3 | X3, "X3-Ultra-25kW"),  # X3 Ultra F
+        "H3BF30": (HYBRID | GEN5 | MPPT3 | X3, "X3-Ultra-30kW"),  # X3 Ultra F
+        "H3BG15L": (HYBRID | GEN5 | MPPT3 | X3, "X3-Ultra-15kW"),  # X3 Ultra 15KP G #1668
+        "H3BG15": (HYBRID | GEN5 | X3, "X3-Ultra-15kW"),  # X3 Ultra G
+        "H3BG19": (HYBRID | GEN5 | X3, "X3-Ultra-19.9kW"),  # X3 Ultra G
+        "H3BG20L": (HYBRID | GEN5 | MPPT3 | X3, "X3-Ultra-20kW"),  # X3 Ultra 20KP G
+        "H3BG20K": (HYBRID | GEN5 | MPPT3 | X3, "X3-Ultra-20kW"),  # X3 Ultra 20KP G #1668
+        "H3BG20": (HYBRID | GEN5 | X3, "X3-Ultra-20kW"),  # X3 Ultra G
+        "H3BG25": (HYBRID | GEN5 | MPPT3 | X3, "X3-Ultra-20kW"),  # X3 Ultra G
+        "H3BG30": (HYBRID | GEN5 | MPPT3 | X3, "X3-Ultra-30kW"),  # X3 Ultra G
+        "10K": (_x3_g4pro_type, lambda sn: f"X3-G4PRO-{int(sn[3:5], 16)}kW"),  # X3-HYB-G4 PRO, datasheet name X3-HYB-4.0-P
+        "8021": (HYBRID | GEN5 | MPPT5 | X3, "X3-Aelio"),  # X3-Aelio #1555, Contains 5 or 6 MPPT depending on size
+        "XAU": (MIC | GEN2 | X1, "X1-Boost"),  # X1-Boost
+        "XB3": (MIC | GEN2 | X1, "X1-Boost"),  # X1-Boost
+        "XBE": (MIC | GEN2 | X1, "X1-Boost"),  # X1-Boost
+        "XBU": (MIC | GEN2 | X1, "X1-Boost"),  # X1-Boost
+        "XAT": (MIC | GEN2 | X1, "X1-Mini"),  # X1-Mini G3 #1340
+        "XM2": (MIC | GEN2 | X1, "X1-Mini"),  # X1-Mini G3 #2153
+        "XM3": (MIC | GEN2 | X1, "X1-Mini"),  # X1-Mini G3
+        "XB4": (MIC | GEN4 | X1, "X1-Boost"),  # X1-Boost G4
+        "XM4": (MIC | GEN4 | X1, "X1-Mini"),  # X1-Mini G4
+        "XMA": (MIC | GEN2 | X1, "X1-Mini"),  # X1-Mini G3
+        "ZA4": (MIC | GEN4 | X1, "X1-Boost"),  # X1-Boost G4
+        "XST": (MIC | GEN4 | X1 | MPPT3, "X1-SMART-G2"),  # X1-SMART-G2
+        "MC103T": (MIC | GEN | X3, "X3-MIC"),  # MIC X3
+        "MP153T": (MIC | GEN | X3, "X3-MIC"),  # MIC X3
+        "MC203T": (MIC | GEN | X3, "X3-MIC"),  # MIC X3
+        "MC402T": (MIC | GEN | X3, "X3-MIC"),  # MIC X3 #1339
+        "MC502T": (MIC | GEN | X3, "X3-MIC"),  # MIC X3
+        "MU502T": (MIC | GEN | X3, "X3-MIC"),  # MIC X3
+        "MC602T": (MIC | GEN | X3, "X3-MIC"),  # MIC X3 6kW
+        "MU602T": (MIC | GEN | X3, "X3-MIC"),  # MIC X3 6kW
+        "MC702T": (MIC | GEN | X3, "X3-MIC"),  # MIC X3
+        "MU702T": (MIC | GEN | X3, "X3-MIC"),  # MIC X3
+        "MC802T": (MIC | GEN | X3, None),  # MIC X3 8kW
+        "MCU08T": (MIC | GEN | X3, None),  # MIC X3 8kW
+        "MU802T": (MIC | GEN | X3, None),  # MIC X3
+        "MC803T": (MIC | GEN | X3, "X3-MIC"),  # MIC X3
+        "MU803T": (MIC | GEN | X3, "X3-MIC"),  # MIC X3
+        "MU902T": (MIC | GEN | X3, "X3-MIC"),  # MIC X3
+        "MU103T": (MIC | GEN | X3, "X3-MIC"),  # MIC X3
+        "MC806T": (MIC | GEN2 | X3, "X3-MIC"),  # MIC X3
+        "MU806T": (MIC | GEN2 | X3, "X3-MIC"),  # MIC X3
+        "MC106T": (MIC | GEN2 | X3, "X3-MIC"),  # MIC X3
+        "MC204T": (MIC | GEN2 | X3, "X3-MIC"),  # MIC X3
+        "MC205T": (MIC | GEN2 | X3, "X3-MIC"),  # MIC X3
+        "MC206T": (MIC | GEN2 | X3, "X3-MIC"),  # MIC X3
+        "MC208T": (MIC | GEN2 | X3, "X3-MIC"),  # MIC X3
+        "MC210T": (MIC | GEN2 | X3, "X3-MIC"),  # MIC X3
+        "MC212T": (MIC | GEN2 | X3, "X3-MIC"),  # MIC X3
+        "MC215T": (MIC | GEN2 | X3, "X3-MIC"),  # MIC X3
+        "MP156T": (MIC | GEN2 | X3, "X3-MIC"),  # MIC X3
+        "PU": (MIC | GEN2 | X3, "X3-MIC Pro"),  # MIC X3
+        "MPT": (_x3_mic_pro_type, lambda sn: f"X3-MIC PRO-{int(sn[3:5])}kW"),  # datasheet name X3-MIC-3K-G2
+        "MAX": (MAX, "X3-MAX"),  # MAX G1
+    }
+)
+
+
 @dataclass(kw_only=True)
 class solax_plugin(plugin_base):
     def isAwake(self, datadict: dict[str, Any]) -> bool:
@@ -11341,393 +11488,23 @@ class solax_plugin(plugin_base):
         # global SENSOR_TYPES
         _LOGGER.info(f"{hub.name}: trying to determine inverter type")
         self.inverter_model = None
-        seriesnumber = await async_read_serialnr(hub, 0x0)
-        if not seriesnumber:
-            seriesnumber = await async_read_serialnr(hub, 0x300)  # bug in Endian.LITTLE decoding?
-        if not seriesnumber:
-            seriesnumber = await async_read_serialnr(hub, 0x1A10)
+        self.serial_address = None
+        seriesnumber = None
+        for address in (0x0, 0x300, 0x1A10):  # 0x300: bug in Endian.LITTLE decoding?
+            seriesnumber = await async_read_serialnr(hub, address)
+            if seriesnumber:
+                self.serial_address = address
+                break
         if not seriesnumber:
             _LOGGER.error(f"{hub.name}: cannot find any serial number(s)")
             seriesnumber = "unknown"
 
         # derive invertertupe from seriiesnumber
-        if seriesnumber.startswith("L30"):
-            invertertype = HYBRID | GEN2 | X1  # Gen2 X1 SK-TL 3kW
-            self.inverter_model = f"X1-Hybrid-{seriesnumber[1:2]}.{seriesnumber[2:3]}kW SK-TL"
-        elif seriesnumber.startswith("U30"):
-            invertertype = HYBRID | GEN2 | X1  # Gen2 X1 SK-SU 3kW
-            self.inverter_model = f"X1-Hybrid-{seriesnumber[1:2]}.{seriesnumber[2:3]}kW SK-SU"
-        elif seriesnumber.startswith("L37"):
-            invertertype = HYBRID | GEN2 | X1  # Gen2 X1 SK-TL 3.7kW Untested
-            self.inverter_model = f"X1-Hybrid-{seriesnumber[1:2]}.{seriesnumber[2:3]}kW SK-TL"
-        elif seriesnumber.startswith("U37"):
-            invertertype = HYBRID | GEN2 | X1  # Gen2 X1 SK-SU 3.7kW Untested
-            self.inverter_model = f"X1-Hybrid-{seriesnumber[1:2]}.{seriesnumber[2:3]}kW SK-SU"
-        elif seriesnumber.startswith("L50"):
-            invertertype = HYBRID | GEN2 | X1  # Gen2 X1 SK-TL 5kW
-            self.inverter_model = f"X1-Hybrid-{seriesnumber[1:2]}.{seriesnumber[2:3]}kW SK-TL"
-        elif seriesnumber.startswith("U50"):
-            invertertype = HYBRID | GEN2 | X1  # Gen2 X1 SK-SU 5kW
-            self.inverter_model = f"X1-Hybrid-{seriesnumber[1:2]}.{seriesnumber[2:3]}kW SK-SU"
-        elif seriesnumber.startswith("H1E"):
-            invertertype = HYBRID | GEN3 | X1  # Gen3 X1 Early
-            self.inverter_model = f"X1-Hybrid-{seriesnumber[3:4]}.{seriesnumber[4:5]}kW"
-        elif seriesnumber.startswith("H1I"):
-            invertertype = HYBRID | GEN3 | X1  # Gen3 X1 Alternative
-            self.inverter_model = f"X1-Hybrid-{seriesnumber[3:4]}.{seriesnumber[4:5]}kW"
-        elif seriesnumber.startswith("HCC"):
-            invertertype = HYBRID | GEN3 | X1  # Gen3 X1 Alternative
-            self.inverter_model = f"X1-Hybrid-{seriesnumber[3:4]}.{seriesnumber[4:5]}kW"
-        elif seriesnumber.startswith("HUE"):
-            invertertype = HYBRID | GEN3 | X1  # Gen3 X1 Late
-            self.inverter_model = f"X1-Hybrid-{seriesnumber[3:4]}.{seriesnumber[4:5]}kW"
-        elif seriesnumber.startswith("XRE"):
-            invertertype = HYBRID | GEN3 | X1  # Gen3 X1 Alternative
-            self.inverter_model = f"X1-Hybrid-{seriesnumber[3:4]}.{seriesnumber[4:5]}kW"
-        elif seriesnumber.startswith("XAC"):
-            invertertype = AC | GEN3 | X1  # X1AC
-            self.inverter_model = "X1-AC"
-        elif seriesnumber.startswith("PRI"):
-            invertertype = FIT | GEN3 | X1  # X1-FIT GEN3: AC hardware, uses Hybrid register layout for some registers
-            self.inverter_model = "X1-FIT"
-        elif seriesnumber.startswith("H3DE"):
-            invertertype = HYBRID | GEN3 | X3  # Gen3 X3
-            self.inverter_model = f"X3-Hybrid-{seriesnumber[3:5]}kW"
-        elif seriesnumber.startswith("H3E"):
-            invertertype = HYBRID | GEN3 | X3  # Gen3 X3
-            self.inverter_model = f"X3-Hybrid-{seriesnumber[4:6]}kW"
-        elif seriesnumber.startswith("H3LE"):
-            invertertype = HYBRID | GEN3 | X3  # Gen3 X3
-            self.inverter_model = f"X3-Hybrid-{seriesnumber[4:6]}kW"
-        elif seriesnumber.startswith("H3PE"):
-            invertertype = HYBRID | GEN3 | X3  # Gen3 X3
-            self.inverter_model = f"X3-Hybrid-{seriesnumber[4:6]}kW"
-        elif seriesnumber.startswith("H3UE"):
-            invertertype = HYBRID | GEN3 | X3  # Gen3 X3
-            self.inverter_model = f"X3-Hybrid-{seriesnumber[4:6]}kW"
-        elif seriesnumber.startswith("F3D"):
-            invertertype = AC | GEN3 | X3  # RetroFit
-            self.inverter_model = "X3-RetroFit"
-        elif seriesnumber.startswith("F3E"):
-            invertertype = AC | GEN3 | X3  # RetroFit
-            self.inverter_model = "X3-RetroFit"
-        elif seriesnumber.startswith("63150"):
-            invertertype = HYBRID | GEN4 | X1  # Gen4 X1 5.0kW
-            self.inverter_model = f"X1-TIGO-TSI-{seriesnumber[3:4]}.{seriesnumber[4:5]}kW"
-        elif seriesnumber.startswith("H43"):
-            invertertype = HYBRID | GEN4 | X1  # Gen4 X1 3kW / 3.7kW
-            self.inverter_model = f"X1-Hybrid-{seriesnumber[2:3]}.{seriesnumber[3:4]}kW"
-        elif seriesnumber.startswith("H44"):
-            invertertype = HYBRID | GEN4 | X1  # Gen4 X1 alt 5kW
-            self.inverter_model = f"X1-Hybrid-{seriesnumber[2:3]}.{seriesnumber[3:4]}kW"
-        elif seriesnumber.startswith("H450"):
-            invertertype = HYBRID | GEN4 | X1  # Gen4 X1 5.0kW
-            self.inverter_model = f"X1-Hybrid-{seriesnumber[2:3]}.{seriesnumber[3:4]}kW"
-        elif seriesnumber.startswith("H460"):
-            invertertype = HYBRID | GEN4 | X1  # Gen4 X1 6kW?
-            self.inverter_model = f"X1-Hybrid-{seriesnumber[2:3]}.{seriesnumber[3:4]}kW"
-        elif seriesnumber.startswith("H475"):
-            invertertype = HYBRID | GEN4 | X1  # Gen4 X1 7.5kW
-            self.inverter_model = f"X1-Hybrid-{seriesnumber[2:3]}.{seriesnumber[3:4]}kW"
-        elif seriesnumber.startswith("F43"):
-            invertertype = AC | GEN4 | X1  # RetroFit X1 3kW / 3.7kW?
-            self.inverter_model = f"X1-RetroFit-{seriesnumber[2:3]}.{seriesnumber[3:4]}kW"
-        elif seriesnumber.startswith("F450"):
-            invertertype = AC | GEN4 | X1  # RetroFit 5kW
-            self.inverter_model = f"X1-RetroFit-{seriesnumber[2:3]}.{seriesnumber[3:4]}kW"
-        elif seriesnumber.startswith("F460"):
-            invertertype = AC | GEN4 | X1  # RetroFit X1 6kW?
-            self.inverter_model = f"X1-RetroFit-{seriesnumber[2:3]}.{seriesnumber[3:4]}kW"
-        elif seriesnumber.startswith("F475"):
-            invertertype = AC | GEN4 | X1  # RetroFit X1 7.5kW?
-            self.inverter_model = f"X1-RetroFit-{seriesnumber[2:3]}.{seriesnumber[3:4]}kW"
-        elif seriesnumber.startswith("PRE"):
-            invertertype = AC | GEN4 | X1  # RetroFit
-            self.inverter_model = "X1-RetroFit"
-        elif seriesnumber.startswith("H53"):
-            invertertype = HYBRID | GEN5 | X1  # X1-IES 3.7kW?
-            self.inverter_model = f"X1-IES-{seriesnumber[2:3]}.{seriesnumber[3:4]}kW"
-        elif seriesnumber.startswith("H55"):
-            invertertype = HYBRID | GEN5 | X1 | MPPT3  # X1-IES 5kW?
-            self.inverter_model = f"X1-IES-{seriesnumber[2:3]}.{seriesnumber[3:4]}kW"
-        elif seriesnumber.startswith("H56"):
-            invertertype = HYBRID | GEN5 | X1 | MPPT3  # X1-IES 6kW?
-            self.inverter_model = f"X1-IES-{seriesnumber[2:3]}.{seriesnumber[3:4]}kW"
-        elif seriesnumber.startswith("H58"):
-            invertertype = HYBRID | GEN5 | X1 | MPPT3  # X1-IES 8kW
-            self.inverter_model = f"X1-IES-{seriesnumber[2:3]}.{seriesnumber[3:4]}kW"
-        elif seriesnumber.startswith("10M"):
-            kw_value = int(seriesnumber[3:5], 16)
-            invertertype = HYBRID | GEN6 | X1
-            if kw_value < 8:
-                invertertype |= MPPT3
-            else:
-                invertertype |= MPPT4
-            self.inverter_model = f"X1-VAST-{kw_value}kW"  # datasheet name X1-VAST-6K
-        elif seriesnumber.startswith("H31"):
-            invertertype = HYBRID | GEN4 | X3  # TIGO TSI X3
-            self.inverter_model = "X3-TIGO TSI"
-        elif seriesnumber.startswith("H34"):
-            invertertype = HYBRID | GEN4 | X3  # Gen4 X3 5-15kW
-            self.inverter_model = f"X3-Hybrid-{int(seriesnumber[4:6])}kW"
-        elif seriesnumber.startswith("H3VC83"):
-            invertertype = HYBRID | GEN4 | X1  # Gen4 8.3kW
-            self.inverter_model = f"X3-Hybrid-{seriesnumber[4:5]}.{seriesnumber[5:6]}kW"
-        elif seriesnumber.startswith("F34"):
-            invertertype = AC | GEN4 | X3  # Gen4 X3 FIT
-            self.inverter_model = "X3-RetroFit"
-        elif seriesnumber.startswith("H35A0"):
-            invertertype = HYBRID | GEN5 | X3  # X3-IES 4-8kW A
-            self.inverter_model = f"X3-IES-{seriesnumber[5:6]}kW"
-        elif seriesnumber.startswith("H35A1"):
-            invertertype = HYBRID | GEN5 | X3  # X3-IES 10-15kW A
-            self.inverter_model = f"X3-IES-{seriesnumber[4:6]}kW"
-        elif seriesnumber.startswith("P35A0"):
-            invertertype = HYBRID | GEN5 | X3  # X3-IES 4-8kW P
-            self.inverter_model = f"X3-IES-{seriesnumber[5:6]}kW"
-        elif seriesnumber.startswith("P35A1"):
-            invertertype = HYBRID | GEN5 | X3  # X3-IES 10-15kW P
-            self.inverter_model = f"X3-IES-{seriesnumber[4:6]}kW"
-        elif seriesnumber.startswith("H35F0"):
-            invertertype = HYBRID | GEN5 | X3  # X3-IES 4-8kW F
-            self.inverter_model = f"X3-IES-{seriesnumber[5:6]}kW"
-        elif seriesnumber.startswith("H35F1"):
-            invertertype = HYBRID | GEN5 | X3  # X3-IES 10-15kW F
-            self.inverter_model = f"X3-IES-{seriesnumber[4:6]}kW"
-        elif seriesnumber.startswith("H3BC15L"):
-            invertertype = HYBRID | GEN5 | MPPT3 | X3  # X3 Ultra 15KP C #1668
-            self.inverter_model = "X3-Ultra-15kW"
-        elif seriesnumber.startswith("H3BC15"):
-            invertertype = HYBRID | GEN5 | X3  # X3 Ultra C
-            self.inverter_model = "X3-Ultra-15kW"
-        elif seriesnumber.startswith("H3BC19"):
-            invertertype = HYBRID | GEN5 | X3  # X3 Ultra C
-            self.inverter_model = "X3-Ultra-19.9kW"
-        elif seriesnumber.startswith("H3BC20L"):
-            invertertype = HYBRID | GEN5 | MPPT3 | X3  # X3 Ultra 20KP C
-            self.inverter_model = "X3-Ultra-20kW"
-        elif seriesnumber.startswith("H3BC20K"):
-            invertertype = HYBRID | GEN5 | MPPT3 | X3  # X3 Ultra 20KP C #1668
-            self.inverter_model = "X3-Ultra-20kW"
-        elif seriesnumber.startswith("H3BC20"):
-            invertertype = HYBRID | GEN5 | X3  # X3 Ultra C
-            self.inverter_model = "X3-Ultra-20kW"
-        elif seriesnumber.startswith("H3BC25"):
-            invertertype = HYBRID | GEN5 | MPPT3 | X3  # X3 Ultra C
-            self.inverter_model = "X3-Ultra-25kW"
-        elif seriesnumber.startswith("H3BC30"):
-            invertertype = HYBRID | GEN5 | MPPT3 | X3  # X3 Ultra C
-            self.inverter_model = "X3-Ultra-30kW"
-        elif seriesnumber.startswith("H3BD15L"):
-            invertertype = HYBRID | GEN5 | MPPT3 | X3  # X3 Ultra 15KP D #1668
-            self.inverter_model = "X3-Ultra-15kW"
-        elif seriesnumber.startswith("H3BD15"):
-            invertertype = HYBRID | GEN5 | X3  # X3 Ultra D
-            self.inverter_model = "X3-Ultra-15kW"
-        elif seriesnumber.startswith("H3BD19"):
-            invertertype = HYBRID | GEN5 | X3  # X3 Ultra D
-            self.inverter_model = "X3-Ultra-19.9kW"
-        elif seriesnumber.startswith("H3BD20L"):
-            invertertype = HYBRID | GEN5 | MPPT3 | X3  # X3 Ultra 20KP D
-            self.inverter_model = "X3-Ultra-20kW"
-        elif seriesnumber.startswith("H3BD20K"):
-            invertertype = HYBRID | GEN5 | MPPT3 | X3  # X3 Ultra 20KP D #1668
-            self.inverter_model = "X3-Ultra-20kW"
-        elif seriesnumber.startswith("H3BD20"):
-            invertertype = HYBRID | GEN5 | X3  # X3 Ultra D
-            self.inverter_model = "X3-Ultra-20kW"
-        elif seriesnumber.startswith("H3BD25"):
-            invertertype = HYBRID | GEN5 | MPPT3 | X3  # X3 Ultra D
-            self.inverter_model = "X3-Ultra-20kW"
-        elif seriesnumber.startswith("H3BD30"):
-            invertertype = HYBRID | GEN5 | MPPT3 | X3  # X3 Ultra D
-            self.inverter_model = "X3-Ultra-30kW"
-        elif seriesnumber.startswith("H3BF15L"):
-            invertertype = HYBRID | GEN5 | MPPT3 | X3  # X3 Ultra 15KP F #1668
-            self.inverter_model = "X3-Ultra-15kW"
-        elif seriesnumber.startswith("H3BF15"):
-            invertertype = HYBRID | GEN5 | X3  # X3 Ultra F
-            self.inverter_model = "X3-Ultra-15kW"
-        elif seriesnumber.startswith("H3BF19"):
-            invertertype = HYBRID | GEN5 | X3  # X3 Ultra F
-            self.inverter_model = "X3-Ultra-19.9kW"
-        elif seriesnumber.startswith("H3BF20L"):
-            invertertype = HYBRID | GEN5 | MPPT3 | X3  # X3 Ultra 20KP F
-            self.inverter_model = "X3-Ultra-20kW"
-        elif seriesnumber.startswith("H3BF20K"):
-            invertertype = HYBRID | GEN5 | MPPT3 | X3  # X3 Ultra 20KP F #1668
-            self.inverter_model = "X3-Ultra-20kW"
-        elif seriesnumber.startswith("H3BF20"):
-            invertertype = HYBRID | GEN5 | X3  # X3 Ultra F
-            self.inverter_model = "X3-Ultra-20kW"
-        elif seriesnumber.startswith("H3BF25"):
-            invertertype = HYBRID | GEN5 | MPPT3 | X3  # X3 Ultra F
-            self.inverter_model = "X3-Ultra-25kW"
-        elif seriesnumber.startswith("H3BF30"):
-            invertertype = HYBRID | GEN5 | MPPT3 | X3  # X3 Ultra F
-            self.inverter_model = "X3-Ultra-30kW"
-        elif seriesnumber.startswith("H3BG15L"):
-            invertertype = HYBRID | GEN5 | MPPT3 | X3  # X3 Ultra 15KP G #1668
-            self.inverter_model = "X3-Ultra-15kW"
-        elif seriesnumber.startswith("H3BG15"):
-            invertertype = HYBRID | GEN5 | X3  # X3 Ultra G
-            self.inverter_model = "X3-Ultra-15kW"
-        elif seriesnumber.startswith("H3BG19"):
-            invertertype = HYBRID | GEN5 | X3  # X3 Ultra G
-            self.inverter_model = "X3-Ultra-19.9kW"
-        elif seriesnumber.startswith("H3BG20L"):
-            invertertype = HYBRID | GEN5 | MPPT3 | X3  # X3 Ultra 20KP G
-            self.inverter_model = "X3-Ultra-20kW"
-        elif seriesnumber.startswith("H3BG20K"):
-            invertertype = HYBRID | GEN5 | MPPT3 | X3  # X3 Ultra 20KP G #1668
-            self.inverter_model = "X3-Ultra-20kW"
-        elif seriesnumber.startswith("H3BG20"):
-            invertertype = HYBRID | GEN5 | X3  # X3 Ultra G
-            self.inverter_model = "X3-Ultra-20kW"
-        elif seriesnumber.startswith("H3BG25"):
-            invertertype = HYBRID | GEN5 | MPPT3 | X3  # X3 Ultra G
-            self.inverter_model = "X3-Ultra-20kW"
-        elif seriesnumber.startswith("H3BG30"):
-            invertertype = HYBRID | GEN5 | MPPT3 | X3  # X3 Ultra G
-            self.inverter_model = "X3-Ultra-30kW"
-        elif seriesnumber.startswith("10K"):
-            kw_value = int(seriesnumber[3:5], 16)
-            invertertype = HYBRID | GEN6 | X3  # X3-HYB-G4 PRO
-            if kw_value >= 8:
-                invertertype |= MPPT3
-            self.inverter_model = f"X3-G4PRO-{kw_value}kW"  # datasheet name X3-HYB-4.0-P
-        elif seriesnumber.startswith("8021"):
-            invertertype = HYBRID | GEN5 | MPPT5 | X3  # X3-Aelio #1555, Contains 5 or 6 MPPT depending on size
-            self.inverter_model = "X3-Aelio"
-        elif seriesnumber.startswith("XAU"):
-            invertertype = MIC | GEN2 | X1  # X1-Boost
-            self.inverter_model = "X1-Boost"
-        elif seriesnumber.startswith("XB3"):
-            invertertype = MIC | GEN2 | X1  # X1-Boost
-            self.inverter_model = "X1-Boost"
-        elif seriesnumber.startswith("XBE"):
-            invertertype = MIC | GEN2 | X1  # X1-Boost
-            self.inverter_model = "X1-Boost"
-        elif seriesnumber.startswith("XBU"):
-            invertertype = MIC | GEN2 | X1  # X1-Boost
-            self.inverter_model = "X1-Boost"
-        elif seriesnumber.startswith("XAT"):
-            invertertype = MIC | GEN2 | X1  # X1-Mini G3 #1340
-            self.inverter_model = "X1-Mini"
-        elif seriesnumber.startswith("XM2"):
-            invertertype = MIC | GEN2 | X1  # X1-Mini G3 #2153
-            self.inverter_model = "X1-Mini"
-        elif seriesnumber.startswith("XM3"):
-            invertertype = MIC | GEN2 | X1  # X1-Mini G3
-            self.inverter_model = "X1-Mini"
-        elif seriesnumber.startswith("XB4"):
-            invertertype = MIC | GEN4 | X1  # X1-Boost G4
-            self.inverter_model = "X1-Boost"
-        elif seriesnumber.startswith("XM4"):
-            invertertype = MIC | GEN4 | X1  # X1-Mini G4
-            self.inverter_model = "X1-Mini"
-        elif seriesnumber.startswith("XMA"):
-            invertertype = MIC | GEN2 | X1  # X1-Mini G3
-            self.inverter_model = "X1-Mini"
-        elif seriesnumber.startswith("ZA4"):
-            invertertype = MIC | GEN4 | X1  # X1-Boost G4
-            self.inverter_model = "X1-Boost"
-        elif seriesnumber.startswith("XST"):
-            invertertype = MIC | GEN4 | X1 | MPPT3  # X1-SMART-G2
-            self.inverter_model = "X1-SMART-G2"
-        elif seriesnumber.startswith("MC103T"):
-            invertertype = MIC | GEN | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MP153T"):
-            invertertype = MIC | GEN | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MC203T"):
-            invertertype = MIC | GEN | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MC402T"):
-            invertertype = MIC | GEN | X3  # MIC X3 #1339
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MC502T"):
-            invertertype = MIC | GEN | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MU502T"):
-            invertertype = MIC | GEN | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MC602T"):
-            invertertype = MIC | GEN | X3  # MIC X3 6kW
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MU602T"):
-            invertertype = MIC | GEN | X3  # MIC X3 6kW
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MC702T"):
-            invertertype = MIC | GEN | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MU702T"):
-            invertertype = MIC | GEN | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MC802T"):
-            invertertype = MIC | GEN | X3  # MIC X3 8kW
-        elif seriesnumber.startswith("MCU08T"):
-            invertertype = MIC | GEN | X3  # MIC X3 8kW
-        elif seriesnumber.startswith("MU802T"):
-            invertertype = MIC | GEN | X3  # MIC X3
-        elif seriesnumber.startswith("MC803T"):
-            invertertype = MIC | GEN | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MU803T"):
-            invertertype = MIC | GEN | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MU902T"):
-            invertertype = MIC | GEN | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MU103T"):
-            invertertype = MIC | GEN | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MC806T"):
-            invertertype = MIC | GEN2 | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MU806T"):
-            invertertype = MIC | GEN2 | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MC106T"):
-            invertertype = MIC | GEN2 | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MC204T"):
-            invertertype = MIC | GEN2 | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MC205T"):
-            invertertype = MIC | GEN2 | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MC206T"):
-            invertertype = MIC | GEN2 | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MC208T"):
-            invertertype = MIC | GEN2 | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MC210T"):
-            invertertype = MIC | GEN2 | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MC212T"):
-            invertertype = MIC | GEN2 | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MC215T"):
-            invertertype = MIC | GEN2 | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("MP156T"):
-            invertertype = MIC | GEN2 | X3  # MIC X3
-            self.inverter_model = "X3-MIC"
-        elif seriesnumber.startswith("PU"):
-            invertertype = MIC | GEN2 | X3  # MIC X3
-            self.inverter_model = "X3-MIC Pro"
-        elif seriesnumber.startswith("MPT"):
-            kw_value = int(seriesnumber[3:5])
-            invertertype = MIC | GEN2 | X3
-            if kw_value >= 25:
-                invertertype |= MPPT3
-            self.inverter_model = f"X3-MIC PRO-{kw_value}kW"  # datasheet name X3-MIC-3K-G2
-        elif seriesnumber.startswith("MAX"):
-            invertertype = MAX  # MAX G1
-            self.inverter_model = "X3-MAX"
+        entry = SERIAL_PREFIX_TYPES.match(seriesnumber)
+        if entry is not None:
+            entry_type, entry_model = entry
+            invertertype = entry_type(seriesnumber) if callable(entry_type) else entry_type
+            self.inverter_model = entry_model(seriesnumber) if callable(entry_model) else entry_model
         else:
             invertertype = 0
             _LOGGER.error(f"unrecognized inverter type - serial number : {seriesnumber}")
@@ -11736,18 +11513,7 @@ class solax_plugin(plugin_base):
         hub._has_local_inverter_model = True
 
         if invertertype > 0:
-            # Firmware metadata is needed before the first poll so the device registry and
-            # protocol-specific register filters start with the right values.
-            if invertertype & (GEN4 | GEN5 | GEN6):
-                await async_read_inverter_firmware_info(hub)
-                if invertertype & GEN4:
-                    hub.data["hardware_version"] = value_function_hardware_version_g4(0, None, hub.data)
-                elif invertertype & GEN5:
-                    hub.data["hardware_version"] = value_function_hardware_version_g5(0, None, hub.data)
-                elif invertertype & GEN6:
-                    hub.data["hardware_version"] = value_function_hardware_version_g6(0, None, hub.data)
-                if "firmware_dsp" in hub.data or "firmware_dsp_minor" in hub.data:
-                    hub.data["software_version"] = value_function_software_version(0, None, hub.data)
+            await self.async_read_firmware_metadata(hub, invertertype)
 
             read_eps = configdict.get(CONF_READ_EPS, DEFAULT_READ_EPS)
             read_dcb = configdict.get(CONF_READ_DCB, DEFAULT_READ_DCB)
@@ -11761,6 +11527,30 @@ class solax_plugin(plugin_base):
 
         return invertertype
 
+    async def async_read_firmware_metadata(self, hub: Any, invertertype: int) -> None:
+        # Firmware metadata is needed before the first poll so the device registry and
+        # protocol-specific register filters start with the right values.
+        if invertertype & (GEN4 | GEN5 | GEN6):
+            await async_read_inverter_firmware_info(hub)
+            if invertertype & GEN4:
+                hub.data["hardware_version"] = value_function_hardware_version_g4(0, None, hub.data)
+            elif invertertype & GEN5:
+                hub.data["hardware_version"] = value_function_hardware_version_g5(0, None, hub.data)
+            elif invertertype & GEN6:
+                hub.data["hardware_version"] = value_function_hardware_version_g6(0, None, hub.data)
+            if "firmware_dsp" in hub.data or "firmware_dsp_minor" in hub.data:
+                hub.data["software_version"] = value_function_software_version(0, None, hub.data)
+
+    async def async_confirmInverterType(
+        self, hub: Any, configdict: dict[str, Any], invertertype: int, seriesnumber: str, serial_address: int | None
+    ) -> bool:
+        if serial_address is None or await async_read_serialnr(hub, serial_address) != seriesnumber:
+            return False
+        # The firmware may have been updated since, and the protocol version selects registers before the first poll.
+        # This is the same read as in async_determineInverterType, the confirmation only saves the serial number probes.
+        await self.async_read_firmware_metadata(hub, invertertype)
+        return True
+
     def matchInverterWithMask(
         self, inverterspec: int, entitymask: int, serialnumber: str = "not relevant", blacklist: list[str] | None = None
     ) -> bool:
@@ -0,0 +1,27 @@
+"""Phase-aligned tick deadlines for the interval groups of one hub."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+
+
+def phase_offsets(intervals: Iterable[float]) -> dict[float, float]:
+    """Return the phase offset of each interval, spreading the groups evenly over the fastest interval.
+
+    When the slower intervals are multiples of the fastest one (5, 15, 60), every tick of a group falls on
+    its own offset modulo the fastest interval, so no two groups ever tick at the same moment.
+    """
+    ordered = sorted(set(intervals))
+    if not ordered:
+        return {}
+    step = ordered[0] / len(ordered)
+    return {interval: index * step for index, interval in enumerate(ordered)}
+
+
+def next_deadline(anchor: float, offset: float, interval: float, now: float) -> float:
+    """Return the first tick anchor + offset + k * interval (k >= 0) that lies after now."""
+    elapsed = now - anchor - offset
+    if elapsed < 0:
+        return anchor + offset
+    return anchor + offset + (math.floor(elapsed / interval) + 1) * interval
@@ -0,0 +1,80 @@
+"""Copy-on-write view of the hub data for the poll of one device group."""
+
+from __future__ import annotations
+
+from collections import ChainMap
+from collections.abc import Iterator, Mapping, MutableMapping
+from typing import Any
+
+MISSING: Any = object()  # previous value of a key that did not exist before the poll
+_REMOVED: Any = object()  # written value of a key the poll removed
+
+
+class PollSnapshot(MutableMapping[str, Any]):
+    """Mutable view of the hub data that records the writes of a poll instead of copying the data.
+
+    Keys the poll did not touch are read from base. written holds the new value of every key the poll
+    wrote or removed; previous holds the base value of those keys when the poll first touched them,
+    so the poll can be committed, or simply dropped, without a copy or a diff of the whole data.
+    """
+
+    __slots__ = ("base", "previous", "written")
+
+    def __init__(self, base: dict[str, Any]) -> None:
+        self.base = base
+        self.written: dict[str, Any] = {}
+        self.previous: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.written.get(key, MISSING)
+        if value is MISSING:
+            return self.base[key]
+        if value is _REMOVED:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self.written.get(key, MISSING)
+        if value is MISSING:
+            return self.base.get(key, default)
+        return default if value is _REMOVED else value
+
+    def __contains__(self, key: object) -> bool:
+        value = self.written.get(key, MISSING)  # type: ignore[call-overload]
+        if value is MISSING:
+            return key in self.base
+        return value is not _REMOVED
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.previous:
+            self.previous[key] = self.base.get(key, MISSING)
+        self.written[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self[key] = _REMOVED
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.base:
+            if key not in self.written:
+                yield key
+        for key, value in self.written.items():
+            if value is not _REMOVED:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def forget(self, key: str) -> None:
+        """Drop what the poll wrote for key, so that it reads the current base value again."""
+        self.written.pop(key, None)
+        self.previous.pop(key, None)
+
+    def removed(self, key: str) -> bool:
+        """Return True if the poll removed key."""
+        return self.written.get(key) is _REMOVED
+
+    def previous_view(self) -> Mapping[str, Any]:
+        """Return a read-only view of the data as it was before the poll touched it."""
+        return ChainMap({key: value for key, value in self.previous.items() if value is not MISSING}, self.base)
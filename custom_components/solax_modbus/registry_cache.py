@@ -0,0 +1,54 @@
+"""Entity registry lookups of one hub, kept until the entity registry changes."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN
+
+
+class EntityRegistryCache:
+    """Remember whether (platform, unique_id) entities are registered and enabled.
+
+    Block building and entity setup ask this for every register. The answers stay valid until
+    the entity registry reports a change, which clears the cache.
+    """
+
+    def __init__(self) -> None:
+        self._enabled: dict[tuple[str, str], bool | None] = {}
+        self._unsub: Callable[[], None] | None = None
+
+    def enabled(self, hass: HomeAssistant, platform: str, unique_id: str) -> bool | None:
+        """Return True if the entity is enabled, False if it is disabled, None if it is not registered."""
+        key = (platform, unique_id)
+        if key in self._enabled:
+            return self._enabled[key]
+        registry = er.async_get(hass)
+        entity_id = registry.async_get_entity_id(platform, DOMAIN, unique_id)
+        if not entity_id:
+            enabled = None
+        else:
+            entity_entry = registry.async_get(entity_id)
+            enabled = entity_entry is not None and not entity_entry.disabled
+        self._enabled[key] = enabled
+        return enabled
+
+    def listen(self, hass: HomeAssistant) -> None:
+        """Clear the cache whenever the entity registry changes."""
+        if self._unsub is None:
+            self._unsub = hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._registry_updated)
+
+    def stop(self) -> None:
+        """Stop listening to the entity registry and forget all answers."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._enabled.clear()
+
+    @callback
+    def _registry_updated(self, event: Any) -> None:
+        self._enabled.clear()
@@ -19,8 +19,8 @@ from .const import (
     WRITE_MULTISINGLE_MODBUS,
     WRITE_SINGLE_MODBUS,
     BaseModbusSelectEntityDescription,
+    applicable_descriptions,
     autorepeat_set,
-    matches_modbus_protocol,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,41 +37,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
     plugin = hub.plugin  # getPlugin(hub_name)
     entities = []
-    for select_info in plugin.SELECT_TYPES:
-        if plugin.matchInverterWithMask(
-            hub._invertertype, select_info.allowedtypes, hub.seriesnumber, select_info.blacklist
-        ) and matches_modbus_protocol(hub, select_info):
-            select_info = replace(select_info, reverse_option_dict={v: k for k, v in select_info.option_dict.items()})
-            select = SolaXModbusSelect(hub_name, hub, modbus_addr, hub.device_info, select_info)
-            if select_info.write_method == WRITE_DATA_LOCAL:
-                if select_info.initvalue is not None:
-                    hub.data[select_info.key] = select_info.initvalue
-                hub.writeLocals[select_info.key] = select_info
-            hub.selectEntities[select_info.key] = select
-            # Register autorepeat selects in computedEntities so they can use the unified autorepeat loop
-            if select_info.value_function:
-                hub.computedEntities[select_info.key] = select_info
-
-            # register dependency chain
-            deplist = select_info.depends_on
-            if isinstance(deplist, str):
-                deplist = (deplist,)
-            if isinstance(
-                deplist,
-                (
-                    list,
-                    tuple,
-                ),
-            ):
-                _LOGGER.debug(f"{hub.name}: {select_info.key} depends on entities {deplist}")
-                for dep_on in deplist:  # register inter-sensor dependencies (e.g. for value functions)
-                    if dep_on != select_info.key:
-                        hub.entity_dependencies.setdefault(dep_on, []).append(select_info.key)  # can be more than one
-            # Use the explicit sensor_key if provided, otherwise fall back to the select's own key.
-            dependency_key = getattr(select_info, "sensor_key", select_info.key)
-            if dependency_key != select_info.key:
-                hub.entity_dependencies.setdefault(dependency_key, []).append(select_info.key)  # can be more than one
-            entities.append(select)
+    for select_info in applicable_descriptions(hub, plugin.SELECT_TYPES):
+        select_info = replace(select_info, reverse_option_dict={v: k for k, v in select_info.option_dict.items()})
+        select = SolaXModbusSelect(hub_name, hub, modbus_addr, hub.device_info, select_info)
+        if select_info.write_method == WRITE_DATA_LOCAL:
+            if select_info.initvalue is not None:
+                hub.data[select_info.key] = select_info.initvalue
+            hub.writeLocals[select_info.key] = select_info
+        hub.selectEntities[select_info.key] = select
+        # Register autorepeat selects in computedEntities so they can use the unified autorepeat loop
+        if select_info.value_function:
+            hub.computedEntities[select_info.key] = select_info
+
+        # register dependency chain
+        deplist = select_info.depends_on
+        if isinstance(deplist, str):
+            deplist = (deplist,)
+        if isinstance(
+            deplist,
+            (
+                list,
+                tuple,
+            ),
+        ):
+            _LOGGER.debug(f"{hub.name}: {select_info.key} depends on entities {deplist}")
+            for dep_on in deplist:  # register inter-sensor dependencies (e.g. for value functions)
+                if dep_on != select_info.key:
+                    hub.entity_dependencies.setdefault(dep_on, []).append(select_info.key)  # can be more than one
+        # Use the explicit sensor_key if provided, otherwise fall back to the select's own key.
+        dependency_key = getattr(select_info, "sensor_key", select_info.key)
+        if dependency_key != select_info.key:
+            hub.entity_dependencies.setdefault(dependency_key, []).append(select_info.key)  # can be more than one
+        entities.append(select)
 
     async_add_entities(entities)
     return True
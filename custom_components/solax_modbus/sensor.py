@@ -11,7 +11,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME, PERCENTAGE, STATE_UNAVAILABLE, STATE_UNKNOWN, EntityCategory
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
@@ -27,12 +26,19 @@ from .const import (
     SLEEPMODE_NONE,
     SLEEPMODE_ZERO,
     BaseModbusSensorEntityDescription,
-    matches_modbus_protocol,
+    applicable_descriptions,
+    modbus_protocol_version,
 )
 from .debug import get_debug_setting
+from .registry_cache import EntityRegistryCache
 
 _LOGGER = logging.getLogger(__name__)
 
+# Descriptions prepared by prepare_sensor_descriptions, kept for the lifetime of Home Assistant so that
+# config entry reloads skip the filtering; descriptions are frozen, so all hubs can share them.
+# One entry per plugin table and device: (inverter type, protocol version) of the entry, descriptions.
+_prepared_descriptions: dict[tuple[Any, ...], tuple[tuple[Any, ...], tuple[BaseModbusSensorEntityDescription, ...]]] = {}
+
 
 COMMUNICATION_SENSOR_TYPES: list[BaseModbusSensorEntityDescription] = [
     BaseModbusSensorEntityDescription(
@@ -111,18 +117,11 @@ def is_entity_enabled(
     # simple test, more complex counterpart is should_register_be_loaded
     unique_id_prefix = platform_name or hub._name
     unique_id = f"{unique_id_prefix}_{descriptor.key}"
-    registry = er.async_get(hass)
-    entity_id = registry.async_get_entity_id("sensor", DOMAIN, unique_id)
-    if entity_id:
-        entity_entry = registry.async_get(entity_id)
-        if entity_entry is None:
-            _LOGGER.debug(f"{hub.name}: is_entity_enabled: {entity_id} has no registry entry, returning False.")
-            return False
-        if entity_entry.disabled:
-            _LOGGER.debug(f"{hub.name}: is_entity_enabled: {entity_id} is disabled, returning False.")
-            return False
-        _LOGGER.debug(f"{hub.name}: is_entity_enabled: {entity_id} is enabled, returning True.")
-        return True  # Found an enabled entity, no need to check further
+    registry_cache = getattr(hub, "_registry_cache", None) or EntityRegistryCache()
+    enabled = registry_cache.enabled(hass, "sensor", unique_id)
+    if enabled is not None:
+        _LOGGER.debug(f"{hub.name}: is_entity_enabled: {unique_id} is {'enabled' if enabled else 'disabled'}, returning {enabled}.")
+        return enabled
 
     _LOGGER.info(f"{hub.name}: entity {unique_id} not found in registry")
     if use_default:
@@ -182,6 +181,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         "",
         None,
         readFollowUp,
+        cache_key="SENSOR_TYPES",
     )
     for sensor_description in COMMUNICATION_SENSOR_TYPES:
         entityToListSingle(
@@ -276,6 +276,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
                     key_prefix,
                     readPreparation,
                     readFollowUpBattery,
+                    cache_key="BATTERY_CONFIG",
                 )
 
     hub.computedSensors = computedRegs
@@ -425,6 +426,9 @@ class SolaXModbusSensor(SensorEntity):
         self.entity_description: BaseModbusSensorEntityDescription = description
         self._energy_dashboard_active = True
         self._attr_extra_state_attributes = _energy_dashboard_mapping_attrs(self.entity_description, self._hub)
+        self._last_published_value: Any = None
+        self._last_published_time: float | None = None  # monotonic
+        self.held_back_until: float | None = None  # monotonic; the hub publishes a value held back by the deadband at this time
 
     @callback
     def set_energy_dashboard_active(self, active: bool) -> None:
@@ -480,9 +484,34 @@ class SolaXModbusSensor(SensorEntity):
     def modbus_data_updated(self) -> None:
         if not self._energy_dashboard_active:
             return
+        if not self._should_publish(self._hub.data.get(self.entity_description.key)):
+            return
         self._attr_extra_state_attributes = _energy_dashboard_mapping_attrs(self.entity_description, self._hub)
         self.async_write_ha_state()
 
+    def _should_publish(self, value: Any) -> bool:
+        """Apply the deadband/max_silence policy of the description; remember the value if it is published."""
+        descr = self.entity_description
+        now = time.monotonic()
+        last = self._last_published_value
+        if (
+            (descr.deadband is not None or descr.deadband_relative is not None)
+            and self._last_published_time is not None
+            and now - self._last_published_time < descr.max_silence
+            and isinstance(value, int | float)
+            and isinstance(last, int | float)
+            and not isinstance(value, bool)
+            and not isinstance(last, bool)
+        ):
+            threshold = max(descr.deadband or 0, abs(last) * (descr.deadband_relative or 0))
+            if abs(value - last) <= threshold:
+                self.held_back_until = self._last_published_time + descr.max_silence
+                return False
+        self._last_published_value = value
+        self._last_published_time = now
+        self.held_back_until = None
+        return True
+
     @callback
     def _update_state(self) -> None:  # never called ?????
         _LOGGER.info(f"update_state {self.entity_description.key} : {self._hub.data.get(self.entity_description.key, 'None')}")
@@ -531,6 +560,8 @@ class SolaXModbusSensor(SensorEntity):
 class RiemannSumEnergySensor(SolaXModbusSensor, RestoreEntity):
     """Energy sensor that calculates cumulative energy using Riemann sum integration."""
 
+    publish_every_poll = True  # integrates the source power on every poll, its own key never changes in the poll data
+
     def __init__(
         self,
         platform_name: str,
@@ -692,6 +723,8 @@ class RiemannSumEnergySensor(SolaXModbusSensor, RestoreEntity):
 class DailyDeltaEnergySensor(SolaXModbusSensor, RestoreEntity):
     """Daily energy sensor calculated from a cumulative total register."""
 
+    publish_every_poll = True  # resets the daily baseline at midnight even when the cumulative total does not change
+
     def __init__(
         self,
         platform_name: str,
@@ -795,6 +828,66 @@ class DailyDeltaEnergySensor(SolaXModbusSensor, RestoreEntity):
         return self._attr_extra_state_attributes or {}
 
 
+def prepare_sensor_descriptions(
+    hub: Any,
+    sensor_types: list[BaseModbusSensorEntityDescription],
+    name_prefix: str,
+    key_prefix: str,
+    cache_key: str | None = None,
+) -> tuple[BaseModbusSensorEntityDescription, ...]:
+    """Return the descriptions of sensor_types that apply to the inverter, with value series expanded and prefixes applied.
+
+    With a cache_key naming the plugin table, the result is kept per plugin and serial number, and reused while
+    the inverter type and protocol version are the same; these determine it completely.
+    """
+    key = None
+    variant = (hub._invertertype, modbus_protocol_version(hub))
+    if cache_key is not None:
+        key = (hub.plugin.plugin_name, cache_key, hub.seriesnumber, name_prefix, key_prefix)
+        cached = _prepared_descriptions.get(key)
+        if cached is not None and cached[0] == variant:
+            return cached[1]
+    prepared: list[BaseModbusSensorEntityDescription] = []
+    for sensor_description in applicable_descriptions(hub, sensor_types):
+        # apply scale exceptions early
+        if sensor_description.value_series is not None:
+            for serie_value in range(sensor_description.value_series):
+                newdescr = sensor_description
+                if isinstance(newdescr.name, str):
+                    newdescr = replace(newdescr, name=name_prefix + newdescr.name.replace("{}", str(serie_value + 1)))
+                if isinstance(newdescr.key, str):
+                    newdescr = replace(newdescr, key=key_prefix + newdescr.key.replace("{}", str(serie_value + 1)))
+                if isinstance(sensor_description.register, int):
+                    newdescr = replace(newdescr, register=sensor_description.register + serie_value)
+                prepared.append(apply_read_scale_exceptions(hub, newdescr))
+        else:
+            newdescr = sensor_description
+            try:
+                if isinstance(newdescr.name, str):
+                    newdescr = replace(newdescr, name=name_prefix + newdescr.name)
+            except Exception:
+                pass
+
+            if isinstance(newdescr.key, str):
+                newdescr = replace(newdescr, key=key_prefix + newdescr.key)
+            prepared.append(apply_read_scale_exceptions(hub, newdescr))
+    result = tuple(prepared)
+    if key is not None:
+        _prepared_descriptions[key] = (variant, result)
+    return result
+
+
+def apply_read_scale_exceptions(hub: Any, newdescr: BaseModbusSensorEntityDescription) -> BaseModbusSensorEntityDescription:
+    if newdescr.read_scale_exceptions:
+        for (
+            prefix,
+            value,
+        ) in newdescr.read_scale_exceptions:
+            if hub.seriesnumber.startswith(prefix) and newdescr.read_scale != value:
+                newdescr = replace(newdescr, read_scale=value)
+    return newdescr
+
+
 def entityToList(
     hub: Any,
     hub_name: str,
@@ -807,43 +900,10 @@ def entityToList(
     key_prefix: str,
     readPreparation: Any,
     readFollowUp: Any,
+    cache_key: str | None = None,
 ) -> None:  # noqa: D103
-    for sensor_description in sensor_types:
-        if hub.plugin.matchInverterWithMask(
-            hub._invertertype, sensor_description.allowedtypes, hub.seriesnumber, sensor_description.blacklist
-        ) and matches_modbus_protocol(hub, sensor_description):
-            # apply scale exceptions early
-            if sensor_description.value_series is not None:
-                for serie_value in range(sensor_description.value_series):
-                    newdescr = sensor_description
-                    if isinstance(newdescr.name, str):
-                        newdescr = replace(newdescr, name=name_prefix + newdescr.name.replace("{}", str(serie_value + 1)))
-                    if isinstance(newdescr.key, str):
-                        newdescr = replace(newdescr, key=key_prefix + newdescr.key.replace("{}", str(serie_value + 1)))
-                    if isinstance(sensor_description.register, int):
-                        newdescr = replace(newdescr, register=sensor_description.register + serie_value)
-                    entityToListSingle(
-                        hub,
-                        hub_name,
-                        entities,
-                        groups,
-                        computedRegs,
-                        device_info,
-                        newdescr,
-                        readPreparation,
-                        readFollowUp,
-                    )
-            else:
-                newdescr = sensor_description
-                try:
-                    if isinstance(newdescr.name, str):
-                        newdescr = replace(newdescr, name=name_prefix + newdescr.name)
-                except Exception:
-                    pass
-
-                if isinstance(newdescr.key, str):
-                    newdescr = replace(newdescr, key=key_prefix + newdescr.key)
-                entityToListSingle(hub, hub_name, entities, groups, computedRegs, device_info, newdescr, readPreparation, readFollowUp)
+    for newdescr in prepare_sensor_descriptions(hub, sensor_types, name_prefix, key_prefix, cache_key):
+        entityToListSingle(hub, hub_name, entities, groups, computedRegs, device_info, newdescr, readPreparation, readFollowUp)
 
 
 def entityToListSingle(
@@ -857,13 +917,7 @@ def entityToListSingle(
     readPreparation: Any,
     readFollowUp: Any,
 ) -> None:  # noqa: D103
-    if newdescr.read_scale_exceptions:
-        for (
-            prefix,
-            value,
-        ) in newdescr.read_scale_exceptions:
-            if hub.seriesnumber.startswith(prefix):
-                newdescr = replace(newdescr, read_scale=value)
+    newdescr = apply_read_scale_exceptions(hub, newdescr)
 
     # Check if this sensor has custom Energy Dashboard device info
     if hasattr(newdescr, "_energy_dashboard_device_info") and newdescr._energy_dashboard_device_info is not None:
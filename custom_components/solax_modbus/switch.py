@@ -18,7 +18,7 @@ from .const import (
     WRITE_DATA_LOCAL,
     WRITE_MULTISINGLE_MODBUS,
     BaseModbusSwitchEntityDescription,
-    matches_modbus_protocol,
+    applicable_descriptions,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -36,37 +36,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     plugin = hub.plugin  # getPlugin(hub_name)
     entities = []
 
-    for switch_info in plugin.SWITCH_TYPES:
-        if plugin.matchInverterWithMask(
-            hub._invertertype, switch_info.allowedtypes, hub.seriesnumber, switch_info.blacklist
-        ) and matches_modbus_protocol(hub, switch_info):
-            switch = SolaXModbusSwitch(hub_name, hub, modbus_addr, hub.device_info, switch_info)
-            if switch_info.value_function:
-                hub.computedSwitches[switch_info.key] = switch_info
-            if switch_info.write_method == WRITE_DATA_LOCAL and switch_info.sensor_key is not None:
-                hub.writeLocals[switch_info.sensor_key] = switch_info
-            dependency_key = getattr(switch_info, "sensor_key", switch_info.key)
-            if dependency_key != switch_info.key:
-                hub.entity_dependencies.setdefault(dependency_key, []).append(switch_info.key)  # can be more than one
-
-            # register dependency chain
-            deplist = switch_info.depends_on
-            if isinstance(deplist, str):
-                deplist = (deplist,)
-            if isinstance(
-                deplist,
-                (
-                    list,
-                    tuple,
-                ),
-            ):
-                _LOGGER.debug(f"{hub.name}: {switch_info.key} depends on entities {deplist}")
-                for dep_on in deplist:  # register inter-sensor dependencies (e.g. for value functions)
-                    if dep_on != switch_info.key:
-                        hub.entity_dependencies.setdefault(dep_on, []).append(switch_info.key)  # can be more than one
-
-            hub.switchEntities[switch_info.key] = switch  # Store the switch entity
-            entities.append(switch)
+    for switch_info in applicable_descriptions(hub, plugin.SWITCH_TYPES):
+        switch = SolaXModbusSwitch(hub_name, hub, modbus_addr, hub.device_info, switch_info)
+        if switch_info.value_function:
+            hub.computedSwitches[switch_info.key] = switch_info
+        if switch_info.write_method == WRITE_DATA_LOCAL and switch_info.sensor_key is not None:
+            hub.writeLocals[switch_info.sensor_key] = switch_info
+        dependency_key = getattr(switch_info, "sensor_key", switch_info.key)
+        if dependency_key != switch_info.key:
+            hub.entity_dependencies.setdefault(dependency_key, []).append(switch_info.key)  # can be more than one
+
+        # register dependency chain
+        deplist = switch_info.depends_on
+        if isinstance(deplist, str):
+            deplist = (deplist,)
+        if isinstance(
+            deplist,
+            (
+                list,
+                tuple,
+            ),
+        ):
+            _LOGGER.debug(f"{hub.name}: {switch_info.key} depends on entities {deplist}")
+            for dep_on in deplist:  # register inter-sensor dependencies (e.g. for value functions)
+                if dep_on != switch_info.key:
+                    hub.entity_dependencies.setdefault(dep_on, []).append(switch_info.key)  # can be more than one
+
+        hub.switchEntities[switch_info.key] = switch  # Store the switch entity
+        entities.append(switch)
 
     providers = hass.data.get(DOMAIN, {}).get("_switch_entity_providers", [])
     for provider in providers:
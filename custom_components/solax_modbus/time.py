@@ -18,7 +18,7 @@ from .const import (
     WRITE_MULTISINGLE_MODBUS,
     WRITE_SINGLE_MODBUS,
     BaseModbusTimeEntityDescription,
-    matches_modbus_protocol,
+    applicable_descriptions,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -35,17 +35,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
 
     plugin = hub.plugin  # getPlugin(hub_name)
     entities = []
-    for time_info in plugin.TIME_TYPES:
-        if plugin.matchInverterWithMask(hub._invertertype, time_info.allowedtypes, hub.seriesnumber, time_info.blacklist) and matches_modbus_protocol(
-            hub, time_info
-        ):
-            time_entity = SolaXModbusTimeEntity(hub_name, hub, modbus_addr, hub.device_info, time_info)
-            if time_info.write_method == WRITE_DATA_LOCAL:
-                if time_info.initvalue is not None:
-                    hub.data[time_info.key] = time_info.initvalue
-                hub.writeLocals[time_info.key] = time_info
-            hub.timeEntities[time_info.key] = time_entity
-            entities.append(time_entity)
+    for time_info in applicable_descriptions(hub, plugin.TIME_TYPES):
+        time_entity = SolaXModbusTimeEntity(hub_name, hub, modbus_addr, hub.device_info, time_info)
+        if time_info.write_method == WRITE_DATA_LOCAL:
+            if time_info.initvalue is not None:
+                hub.data[time_info.key] = time_info.initvalue
+            hub.writeLocals[time_info.key] = time_info
+        hub.timeEntities[time_info.key] = time_entity
+        entities.append(time_entity)
 
     async_add_entities(entities)
 
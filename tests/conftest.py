@@ -1,5 +1,9 @@
+from collections.abc import Iterator
+
 import pytest
 
+from custom_components.solax_modbus import sensor
+
 
 class MockModbusResponse:
     def __init__(self, registers: list[int] | None = None, error: bool = False) -> None:
@@ -36,6 +40,13 @@ class MockHub:
         return await self.async_read_input_registers(unit, address, count)
 
 
+@pytest.fixture(autouse=True)
+def clear_prepared_descriptions() -> Iterator[None]:
+    """Keep the sensor descriptions prepared by one test from being reused by the next."""
+    yield
+    sensor._prepared_descriptions.clear()
+
+
 @pytest.fixture
 def mock_hub() -> MockHub:
     return MockHub()
@@ -0,0 +1,294 @@
+"""Tests for the cost-model Modbus block planner."""
+
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+import custom_components.solax_modbus as solax_modbus
+from custom_components.solax_modbus import SolaXModbusHub, block
+from custom_components.solax_modbus.block_planner import (
+    MODBUS_MAX_READ_REGISTERS,
+    BlockCostModel,
+    BlockLimits,
+    plan_blocks,
+    readable_runs,
+    replay_layout,
+    transport_cost_model,
+)
+from custom_components.solax_modbus.const import CONF_PLUGIN, REG_HOLDING, REGISTER_U16, REGISTER_U32, BaseModbusSensorEntityDescription
+
+TCP = BlockCostModel(request_overhead=20.0, per_register=0.01)
+SLOW_SERIAL = BlockCostModel(request_overhead=40.0, per_register=2.0)
+
+
+def test_fast_link_reads_across_gaps_within_block_size() -> None:
+    spans = [(0, 1), (50, 51), (100, 102), (130, 131)]
+
+    assert plan_blocks(spans, 100, TCP) == [(0, 1), (1, 4)]
+
+
+def test_slow_link_splits_at_expensive_gaps() -> None:
+    spans = [(0, 1), (1, 2), (50, 51), (51, 52)]
+
+    assert plan_blocks(spans, 100, SLOW_SERIAL) == [(0, 2), (2, 4)]
+    assert plan_blocks(spans, 100, TCP) == [(0, 4)]
+
+
+def test_blocks_respect_protocol_limit_and_holes() -> None:
+    spans = [(0, 1), (100, 101), (120, 130)]
+
+    plan = plan_blocks(spans, 200, TCP)
+    assert all(max(end for _base, end in spans[first:last]) - spans[first][0] <= MODBUS_MAX_READ_REGISTERS for first, last in plan)
+    assert plan_blocks([(0, 1), (5, 6)], 100, TCP, holes=[3]) == [(0, 1), (1, 2)]
+
+
+def test_single_entity_is_always_a_block() -> None:
+    assert plan_blocks([(0, 200)], 10, TCP) == [(0, 1)]
+    assert plan_blocks([], 100, TCP) == []
+
+
+def test_readable_runs_join_gaps_without_holes() -> None:
+    spans = [(0, 2), (10, 12), (30, 31), (200, 201)]
+
+    assert readable_runs(spans) == [(0, 31), (200, 201)]
+    assert readable_runs(spans, holes=[5]) == [(0, 2), (10, 31), (200, 201)]
+
+
+def test_replay_layout_only_fits_the_same_entities() -> None:
+    segments = [[(0, 1), (1, 2), (50, 51)], [(60, 61)]]
+
+    assert replay_layout(segments, [[0, 1], [50], [60]], 100) == [[(0, 2), (2, 3)], [(0, 1)]]
+    assert replay_layout(segments, [[0, 1, 50, 60]], 100) is None  # crosses a quarantine or newblock split
+    assert replay_layout(segments, [[0, 1], [50]], 100) is None
+    assert replay_layout(segments, [[0, 1], [50], [60], [70]], 100) is None
+
+
+def test_replay_layout_rejects_blocks_beyond_the_current_limits() -> None:
+    segments = [[(0, 1), (1, 2), (50, 51)]]
+    layout = [[0, 1, 50]]
+
+    assert replay_layout(segments, layout, 100) == [[(0, 3)]]
+    assert replay_layout(segments, layout, 40) is None  # block_size lowered since the layout was saved
+    assert replay_layout(segments, layout, 100, max_registers=50) is None
+    assert replay_layout(segments, layout, 100, holes=(20,)) is None
+    assert replay_layout(segments, [[0, 1], [50]], 40, holes=(20,)) == [[(0, 2), (2, 3)]]
+
+
+@pytest.mark.parametrize(
+    ("interface", "tcp_type", "baudrate", "slow"),
+    [
+        ("tcp", "tcp", 9600, False),
+        ("core", None, 9600, False),
+        ("serial", None, 9600, True),
+        ("tcp", "rtu", 9600, True),
+    ],
+)
+def test_transport_cost_model(interface: str, tcp_type: str | None, baudrate: int, slow: bool) -> None:
+    model = transport_cost_model(interface, tcp_type, baudrate)
+
+    assert (model.per_register > 1.0) is slow
+
+
+def make_hub(monkeypatch: pytest.MonkeyPatch, *, cost_model: BlockCostModel, auto_block_ignore_readerror: bool | None = None) -> Any:
+    """Build the minimal hub state required by splitInBlocks."""
+    monkeypatch.setattr(solax_modbus, "should_register_be_loaded", lambda hass, hub, descriptor: True)
+    hub = cast(Any, object.__new__(SolaXModbusHub))
+    hub._name = "test"
+    hub._hass = None
+    hub.bad_regs = {"holding": set(), "input": set()}
+    hub.block_limits = {}
+    hub.block_cost_model = cost_model
+    hub.plugin = SimpleNamespace(block_size=100, auto_block_ignore_readerror=auto_block_ignore_readerror)
+    return hub
+
+
+def make_descriptions(*registers: int, data_type: str = REGISTER_U16) -> dict[int, Any]:
+    return {
+        reg: BaseModbusSensorEntityDescription(key=f"reg_{reg}", register=reg, register_type=REG_HOLDING, register_data_type=data_type)
+        for reg in registers
+    }
+
+
+def test_split_in_blocks_uses_transport_cost_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    descriptions = make_descriptions(0, 1, 60, 61)
+
+    fast = make_hub(monkeypatch, cost_model=TCP).splitInBlocks(dict(descriptions))
+    slow = make_hub(monkeypatch, cost_model=SLOW_SERIAL).splitInBlocks(dict(descriptions))
+
+    assert [(blk.start, blk.end) for blk in fast] == [(0, 62)]
+    assert [(blk.start, blk.end) for blk in slow] == [(0, 2), (60, 62)]
+
+
+def test_split_in_blocks_splits_at_quarantined_register(monkeypatch: pytest.MonkeyPatch) -> None:
+    hub = make_hub(monkeypatch, cost_model=TCP)
+    hub.bad_regs["holding"].add(10)
+
+    blocks = hub.splitInBlocks(make_descriptions(0, 10, 12, data_type=REGISTER_U32))
+
+    assert [(blk.start, blk.end, blk.regs) for blk in blocks] == [(0, 2, [0]), (12, 14, [12])]
+
+
+def test_split_in_blocks_marks_automatically_split_blocks(monkeypatch: pytest.MonkeyPatch) -> None:
+    hub = make_hub(monkeypatch, cost_model=SLOW_SERIAL, auto_block_ignore_readerror=True)
+    descriptions = make_descriptions(0, 80)
+
+    blocks = hub.splitInBlocks(descriptions)
+
+    assert len(blocks) == 2
+    assert descriptions[0].ignore_readerror is False
+    assert descriptions[80].ignore_readerror is True
+
+
+def test_split_in_blocks_uses_discovered_limits(monkeypatch: pytest.MonkeyPatch) -> None:
+    hub = make_hub(monkeypatch, cost_model=TCP)
+    descriptions = make_descriptions(0, 1, 10, 11, 30)
+
+    assert [(blk.start, blk.end) for blk in hub.splitInBlocks(dict(descriptions))] == [(0, 31)]
+
+    hub.block_limits["holding"] = BlockLimits(max_registers=20, holes=(5,))
+    assert [(blk.start, blk.end) for blk in hub.splitInBlocks(dict(descriptions))] == [(0, 2), (10, 12), (30, 31)]
+
+
+def test_split_in_blocks_reuses_restored_layout_while_it_fits(monkeypatch: pytest.MonkeyPatch) -> None:
+    hub = make_hub(monkeypatch, cost_model=TCP)
+    hub._restored_block_layouts = {"5/inverter/holding": [[0, 1], [10, 11], [30]]}
+    descriptions = make_descriptions(0, 1, 10, 11, 30)
+
+    blocks = hub.splitInBlocks(dict(descriptions), "5/inverter/holding")
+    assert [(blk.start, blk.end) for blk in blocks] == [(0, 2), (10, 12), (30, 31)]
+    assert [(blk.start, blk.end) for blk in hub.splitInBlocks(dict(descriptions))] == [(0, 31)]
+
+    hub.bad_regs["holding"].add(10)
+    assert [blk.regs for blk in hub.splitInBlocks(dict(descriptions), "5/inverter/holding")] == [[0, 1], [11, 30]]
+
+
+@pytest.mark.asyncio
+async def test_layout_planned_with_discovered_limits_is_reused_after_a_restart(monkeypatch: pytest.MonkeyPatch) -> None:
+    hub = make_hub(monkeypatch, cost_model=TCP)
+    hub.plugin.block_size = 10
+    hub._seriesnumber = "SN1"
+    hub._invertertype = 3
+    hub.config = {CONF_PLUGIN: "solax"}
+    hub._restored_bad_regs = {"holding": set(), "input": set()}
+    hub._restored_block_layouts = {}
+    hub._restored_block_limits = {}
+    block_plans = {
+        "plugin": "solax",
+        "invertertype": 3,
+        "layouts": {"5/inverter/holding": [[0, 1, 10, 11, 30]]},
+        "limits": {"holding": {"max_registers": 40, "holes": []}},
+    }
+    hub._learned_store = SimpleNamespace(async_load=AsyncMock(return_value={"serial": "SN1", "firmware": "1.0", "block_plans": block_plans}))
+    hub._ensure_quarantine_recheck_task = Mock()
+
+    await hub._async_restore_learned_state()
+    blocks = hub.splitInBlocks(make_descriptions(0, 1, 10, 11, 30), "5/inverter/holding")
+
+    assert [(blk.start, blk.end) for blk in blocks] == [(0, 31)]
+
+
+def test_rebuild_blocks_indexes_descriptions_by_register(monkeypatch: pytest.MonkeyPatch) -> None:
+    hub = make_hub(monkeypatch, cost_model=TCP)
+    hub.groups = {}
+    hub._compile_decode_plans = Mock()
+    holding = make_descriptions(0, 10)
+    inputs = make_descriptions(10)
+    device_group = SimpleNamespace(holdingRegs=holding, inputRegs=inputs, readPreparation=None, readFollowUp=None)
+
+    hub.rebuild_blocks({5: SimpleNamespace(device_groups={"inverter": device_group})})
+
+    assert hub._find_descriptor_for_reg("holding", 10) is holding[10]
+    assert hub._find_descriptor_for_reg("input", 10) is inputs[10]
+    assert hub._find_descriptor_for_reg("input", 0) is None
+    assert hub._format_register("holding", 10) == "holding 0xa (reg_10)"
+
+
+def test_rebuild_blocks_only_splits_stale_groups(monkeypatch: pytest.MonkeyPatch) -> None:
+    hub = make_hub(monkeypatch, cost_model=TCP)
+    hub.groups = {}
+    hub._block_layouts = {}
+    hub._compile_decode_plans = Mock()
+    inverter = SimpleNamespace(holdingRegs=make_descriptions(0, 10), inputRegs={}, readPreparation=None, readFollowUp=None)
+    meter = SimpleNamespace(holdingRegs=make_descriptions(100), inputRegs={}, readPreparation=None, readFollowUp=None)
+    initial_groups = {5: SimpleNamespace(device_groups={"inverter": inverter}), 60: SimpleNamespace(device_groups={"meter": meter})}
+    hub.rebuild_blocks(initial_groups)
+    meter_blocks = hub.groups[60].device_groups["meter"].holdingBlocks
+
+    hub.bad_regs["holding"].add(10)
+    hub._invalidate_blocks(hub._groups_with_register("holding", 10))
+    assert hub._stale_block_groups == {(5, "inverter")}
+    hub.rebuild_blocks(initial_groups, hub._stale_block_groups)
+
+    assert [blk.regs for blk in hub.groups[5].device_groups["inverter"].holdingBlocks] == [[0]]
+    assert hub.groups[60].device_groups["meter"].holdingBlocks is meter_blocks
+    assert hub._stale_block_groups == set()
+    assert hub.blocks_changed is False
+    assert hub._block_layouts == {"5/inverter/holding": [[0]], "5/inverter/input": [], "60/meter/holding": [[100]], "60/meter/input": []}
+
+    hub._invalidate_blocks([(60, "meter")])
+    hub._invalidate_blocks()
+    assert hub._stale_block_groups is None
+
+
+@pytest.mark.asyncio
+async def test_discover_block_limits_finds_max_request_and_holes(monkeypatch: pytest.MonkeyPatch) -> None:
+    hub = make_hub(monkeypatch, cost_model=TCP)
+    hub.plugin.block_size = 4
+    hub._time_out = 6
+    hub._transport = Mock(is_connected=Mock(return_value=True))
+    hub.blocks_changed = False
+    descriptions = make_descriptions(0, 1, 10, 11, 30)
+    device_group = SimpleNamespace(
+        readPreparation=None,
+        holdingBlocks=[block(start=0, end=31, descriptions=descriptions, regs=sorted(descriptions))],
+        inputBlocks=[],
+    )
+    battery_group = SimpleNamespace(
+        readPreparation=Mock(),
+        holdingBlocks=[block(start=200, end=201, descriptions=make_descriptions(200), regs=[200])],
+        inputBlocks=[],
+    )
+    hub.groups = {10: SimpleNamespace(device_groups={"inverter": device_group, "battery": battery_group})}
+    probes: list[tuple[int, int]] = []
+
+    async def probe(block_obj: Any, typ: str, timeout: float | None = None) -> bool:
+        probes.append((block_obj.start, block_obj.end))
+        return block_obj.end - block_obj.start <= 20 and not block_obj.start <= 5 < block_obj.end
+
+    hub._probe_block = probe
+
+    limits = await hub.async_discover_block_limits()
+
+    assert limits == {"holding": BlockLimits(max_registers=20, holes=(5,))}
+    assert hub.blocks_changed is True
+    assert all(end <= 31 for _start, end in probes)
+
+
+@pytest.mark.asyncio
+async def test_discovery_repeats_a_failed_probe_before_marking_a_hole(monkeypatch: pytest.MonkeyPatch) -> None:
+    hub = make_hub(monkeypatch, cost_model=TCP)
+    hub.plugin.block_size = 40
+    hub._time_out = 6
+    hub._transport = Mock(is_connected=Mock(return_value=True))
+    hub.blocks_changed = False
+    descriptions = make_descriptions(0, 10)
+    device_group = SimpleNamespace(
+        readPreparation=None,
+        holdingBlocks=[block(start=0, end=11, descriptions=descriptions, regs=sorted(descriptions))],
+        inputBlocks=[],
+    )
+    hub.groups = {10: SimpleNamespace(device_groups={"inverter": device_group})}
+    probes: list[tuple[int, int]] = []
+
+    async def probe(block_obj: Any, typ: str, timeout: float | None = None) -> bool:
+        probes.append((block_obj.start, block_obj.end))
+        return len(probes) > 1  # the first probe collides with a poll
+
+    hub._probe_block = probe
+
+    limits = await hub.async_discover_block_limits()
+
+    assert limits == {"holding": BlockLimits(max_registers=40, holes=())}
+    assert probes[:2] == [(1, 10), (1, 10)]
@@ -0,0 +1,81 @@
+"""Tests for priority scheduling of Modbus bus access."""
+
+import asyncio
+
+import pytest
+
+from custom_components.solax_modbus.bus_scheduler import (
+    BUS_PRIORITY_BACKGROUND,
+    BUS_PRIORITY_WRITE,
+    PriorityBusLock,
+    background_context,
+    bus_priority,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+async def request(lock: PriorityBusLock, name: str, order: list[str], priority: int | None = None) -> None:
+    """Hold the bus for one simulated request."""
+    if priority is None:
+        async with lock:
+            order.append(name)
+            await asyncio.sleep(0)
+    else:
+        with bus_priority(priority):
+            async with lock:
+                order.append(name)
+                await asyncio.sleep(0)
+
+
+async def test_most_urgent_waiter_gets_the_bus_next() -> None:
+    lock = PriorityBusLock()
+    order: list[str] = []
+    await lock.acquire()
+
+    tasks = [
+        asyncio.create_task(request(lock, "slow block", order, 60)),
+        asyncio.create_task(request(lock, "probe", order)),
+        asyncio.create_task(request(lock, "fast block", order, 5)),
+        asyncio.create_task(request(lock, "write", order, BUS_PRIORITY_WRITE)),
+        asyncio.create_task(request(lock, "second fast block", order, 5)),
+    ]
+    await asyncio.sleep(0)
+    lock.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["write", "fast block", "second fast block", "slow block", "probe"]
+    assert lock.locked() is False
+
+
+async def test_cancelled_waiter_is_skipped() -> None:
+    lock = PriorityBusLock()
+    order: list[str] = []
+    await lock.acquire()
+    cancelled = asyncio.create_task(request(lock, "cancelled", order, BUS_PRIORITY_WRITE))
+    waiting = asyncio.create_task(request(lock, "waiting", order, 15))
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    lock.release()
+    await waiting
+
+    assert order == ["waiting"]
+    assert lock.locked() is False
+
+
+async def test_background_context_overrides_the_creating_task_priority() -> None:
+    lock = PriorityBusLock()
+    order: list[str] = []
+    await lock.acquire()
+
+    with bus_priority(5):
+        probe = asyncio.get_running_loop().create_task(request(lock, "probe", order), context=background_context())
+    poll = asyncio.create_task(request(lock, "slow block", order, 60))
+    await asyncio.sleep(0)
+    lock.release()
+    await asyncio.gather(probe, poll)
+
+    assert order == ["slow block", "probe"]
+    assert BUS_PRIORITY_BACKGROUND > 60
@@ -0,0 +1,128 @@
+"""Tests for the dependency tracing of computed sensors."""
+
+import importlib
+import pathlib
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import Mock
+
+import pytest
+
+from custom_components.solax_modbus import SolaXModbusHub
+from custom_components.solax_modbus.computed_graph import DependencyTracer, order_computed_sensors, trace_dependencies
+from custom_components.solax_modbus.const import autorepeat_set
+
+PLUGIN_DIR = pathlib.Path(__file__).parent.parent.parent / "custom_components" / "solax_modbus"
+PLUGIN_FILES = sorted(f.name[:-3] for f in PLUGIN_DIR.glob("plugin_*.py") if f.is_file())
+
+
+def test_tracer_records_reads_and_keeps_writes_local() -> None:
+    data = {"pv_power_1": 100, "pv_power_2": 50}
+    tracer = DependencyTracer(data)
+
+    tracer["pv_total"] = tracer["pv_power_1"] + tracer.get("pv_power_2", 0)
+    assert "battery_power" not in tracer
+    assert tracer["pv_total"] == 150
+
+    assert tracer.keys_read == {"pv_power_1", "pv_power_2", "battery_power"}
+    assert data == {"pv_power_1": 100, "pv_power_2": 50}
+
+
+def test_tracing_does_not_change_mutable_values_of_the_data() -> None:
+    def value_function(initval: int, descr: Any, datadict: dict[str, Any]) -> Any:
+        autorepeat_set(datadict, descr.key, 1000)
+        return datadict["battery_power"]
+
+    descr = SimpleNamespace(key="remotecontrol_trigger", value_function=value_function)
+    data: dict[str, Any] = {"_repeatUntil": {}, "battery_power": 100}
+
+    assert trace_dependencies(descr, [data]) == {"_repeatUntil", "battery_power"}
+    assert data == {"_repeatUntil": {}, "battery_power": 100}
+
+
+def test_trace_merges_branches_of_all_samples_and_ignores_own_key() -> None:
+    def value_function(initval: int, descr: Any, datadict: dict[str, Any]) -> Any:
+        if datadict.get("run_mode") == 1:
+            return datadict["grid_power"]
+        return datadict.get(descr.key)
+
+    descr = SimpleNamespace(key="feedin", value_function=value_function)
+
+    assert trace_dependencies(descr, [{}]) == {"run_mode"}
+    assert trace_dependencies(descr, [{}, {"run_mode": 1}]) == {"run_mode", "grid_power"}
+
+
+def test_undeclared_reads_of_computed_sensors_order_the_evaluation() -> None:
+    hub = cast(Any, object.__new__(SolaXModbusHub))
+    hub.computedSensors = {
+        "ratio": SimpleNamespace(key="ratio", depends_on=None, value_function=lambda v, d, data: data["total"] / 2),
+        "total": SimpleNamespace(key="total", depends_on=["raw"], value_function=lambda v, d, data: data["raw"] * 2),
+    }
+    hub.sensorDescriptions = {"raw": SimpleNamespace()}
+    hub._name = "test"
+    data = {"raw": 3}
+
+    assert hub._compute_poll_sensors(data, {"raw"}) == {"ratio", "total"}
+    assert data == {"raw": 3, "total": 6, "ratio": 3.0}
+    assert [node.key for node in hub._computed_sensor_order()] == ["total", "ratio"]
+
+
+def test_memoized_computed_sensor_is_only_recomputed_when_its_inputs_change() -> None:
+    hub = cast(Any, object.__new__(SolaXModbusHub))
+    value_function = Mock(side_effect=lambda v, d, data: f"mode {data['run_mode']}")
+    hub.computedSensors = {"mode_text": SimpleNamespace(key="mode_text", depends_on=["run_mode"], memoize=True, value_function=value_function)}
+    hub.sensorDescriptions = {"run_mode": SimpleNamespace()}
+    hub._name = "test"
+    hub._computed_memo = {}
+    data = {"run_mode": 1, "pv_power": 100}
+
+    for pv_power in (100, 200, 300):
+        data["pv_power"] = pv_power
+        hub._compute_poll_sensors(data, {"run_mode"})
+    assert value_function.call_count == 2  # one call traces the inputs when the order is built, one computes the value
+
+    data["run_mode"] = 2
+    assert hub._compute_poll_sensors(data, {"run_mode"}) == {"mode_text"}
+    assert value_function.call_count == 3
+    assert data["mode_text"] == "mode 2"
+
+
+def test_memoize_without_declared_dependencies_is_ignored(caplog: pytest.LogCaptureFixture) -> None:
+    hub = cast(Any, object.__new__(SolaXModbusHub))
+
+    def value_function(initval: int, descr: Any, datadict: dict[str, Any]) -> Any:
+        return datadict["grid_power"] if datadict.get("run_mode") == 1 else 0  # grid_power is only read in one branch
+
+    hub.computedSensors = {"feedin": SimpleNamespace(key="feedin", depends_on=None, memoize=True, value_function=value_function)}
+    hub.sensorDescriptions = {"run_mode": SimpleNamespace(), "grid_power": SimpleNamespace()}
+    hub._name = "test"
+    hub._computed_memo = {}
+    data = {"run_mode": 0, "grid_power": 100}
+    hub._compute_poll_sensors(data, {"run_mode", "grid_power"})  # traced without reading grid_power
+    assert "feedin sets memoize without depends_on" in caplog.text
+
+    data["run_mode"] = 1
+    hub._compute_poll_sensors(data, {"run_mode", "grid_power"})
+    data["grid_power"] = 200
+    hub._compute_poll_sensors(data, {"run_mode", "grid_power"})
+    assert data["feedin"] == 200
+
+
+@pytest.mark.parametrize("plugin_module_name", PLUGIN_FILES)
+def test_traced_plugin_dependencies_have_no_cycles(plugin_module_name: str) -> None:
+    """Every computed sensor must come after the computed sensors it declares or is seen reading."""
+    plugin = importlib.import_module(f"custom_components.solax_modbus.{plugin_module_name}").plugin_instance
+    computed = {descr.key: descr for descr in plugin.SENSOR_TYPES if descr.register < 0 and descr.value_function is not None}
+    samples = [{descr.key: 1 for descr in plugin.SENSOR_TYPES}, {}]
+
+    def declared(descr: Any) -> set[str] | None:
+        return None if descr.depends_on is None else {descr.depends_on} if isinstance(descr.depends_on, str) else set(descr.depends_on)
+
+    seen: set[str] = set()
+    late = {}
+    for node in order_computed_sensors(computed, declared, lambda descr: trace_dependencies(descr, samples)):
+        if unordered := {key for key in node.inputs if key in computed and key != node.key} - seen:
+            late[node.key] = sorted(unordered)
+        seen.add(node.key)
+
+    assert not late, f"{plugin_module_name}: computed sensors on a dependency cycle: {late}"
@@ -0,0 +1,48 @@
+"""Tests for the dependency order of computed sensors."""
+
+from types import SimpleNamespace
+from typing import Any, cast
+
+from custom_components.solax_modbus import SolaXModbusHub
+from custom_components.solax_modbus.computed_graph import order_computed_sensors
+
+
+def declared(descr: Any) -> set[str] | None:
+    return None if descr.depends_on is None else set(descr.depends_on)
+
+
+def computed(**depends_on: list[str] | None) -> dict[str, Any]:
+    return {key: SimpleNamespace(key=key, depends_on=deps) for key, deps in depends_on.items()}
+
+
+def test_dependencies_come_first_and_independent_sensors_keep_registration_order() -> None:
+    sensors = computed(total=["pv_1", "house"], status=None, house=["grid", "pv_1"], ratio=["total", "house"])
+
+    order = [node.key for node in order_computed_sensors(sensors, declared)]
+
+    assert order == ["status", "house", "total", "ratio"]
+
+
+def test_dependency_cycle_is_ordered_last() -> None:
+    sensors = computed(a=["b"], b=["a"], c=["raw"], d=["d"])
+
+    nodes = order_computed_sensors(sensors, declared)
+
+    assert [node.key for node in nodes] == ["c", "d", "a", "b"]
+    assert nodes[0].dependencies == frozenset({"raw"})
+
+
+def test_order_is_cached_until_computed_sensors_change() -> None:
+    hub = cast(Any, object.__new__(SolaXModbusHub))
+    hub.computedSensors = computed(second=["first"], first=["raw"])
+    hub.sensorDescriptions = {"raw": SimpleNamespace(), "first": SimpleNamespace()}
+
+    order = hub._computed_sensor_order()
+    assert hub._computed_sensor_order() is order
+    assert [node.key for node in order] == ["first", "second"]
+    assert order[1].dependencies == frozenset({"first"})
+
+    hub.sensorDescriptions["second"] = SimpleNamespace()
+    hub.computedSensors.update(computed(third=["second"]))
+
+    assert [node.key for node in hub._computed_sensor_order()] == ["first", "second", "third"]
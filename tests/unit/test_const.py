@@ -1,7 +1,11 @@
 from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 from custom_components.solax_modbus.const import (
     BaseModbusSensorEntityDescription,
+    SerialPrefixTable,
+    applicable_descriptions,
     value_function_battery_input,
     value_function_battery_output,
     value_function_firmware,
@@ -127,3 +131,32 @@ def test_entity_description_instantiation() -> None:
     assert desc.key == "test_sensor"
     assert desc.register == -1  # Default value
     assert desc.allowedtypes == 0  # Default value
+
+
+def test_serial_prefix_table_matches_like_an_elif_chain() -> None:
+    table = SerialPrefixTable({"H3BC15L": 2, "H3BC15": 1, "H3": 3, "H34": 4, "MPT": 5})
+
+    assert table.match("H3BC15L0123") == 2
+    assert table.match("H3BC150123") == 1
+    assert table.match("H340123") == 3  # "H3" is declared first
+    assert table.match("MPT") == 5
+    assert table.match("MP") is None
+    assert table.match("") is None
+    assert table.match(None) is None
+    assert len(table) == 5
+    assert list(table) == ["H3BC15L", "H3BC15", "H3", "H34", "MPT"]
+
+
+def test_applicable_descriptions_match_each_mask_once() -> None:
+    plugin = SimpleNamespace(matchInverterWithMask=Mock(side_effect=lambda inverter, mask, serial, blacklist: mask & inverter != 0))
+    hub = SimpleNamespace(plugin=plugin, _invertertype=0b01, seriesnumber="H4501234567", modbus_protocol_version=None, data={})
+    descriptions = [
+        BaseModbusSensorEntityDescription(key="a", allowedtypes=0b01),
+        BaseModbusSensorEntityDescription(key="b", allowedtypes=0b10),
+        BaseModbusSensorEntityDescription(key="c", allowedtypes=0b01),
+        BaseModbusSensorEntityDescription(key="d", allowedtypes=0b01, blacklist=["H45"]),
+        BaseModbusSensorEntityDescription(key="e", allowedtypes=0b01, modbus_min=100),
+    ]
+
+    assert [descr.key for descr in applicable_descriptions(hub, descriptions)] == ["a", "c", "d"]
+    assert plugin.matchInverterWithMask.call_count == 3
@@ -0,0 +1,291 @@
+"""Tests for precompiled register decode plans."""
+
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pymodbus.exceptions import ModbusIOException
+
+from custom_components.solax_modbus import SolaXModbusHub, block
+from custom_components.solax_modbus.const import (
+    REG_HOLDING,
+    REGISTER_F32,
+    REGISTER_S16,
+    REGISTER_S32,
+    REGISTER_STR,
+    REGISTER_U8H,
+    REGISTER_U8L,
+    REGISTER_U16,
+    REGISTER_U32,
+    REGISTER_ULSB16MSB16,
+    REGISTER_WORDS,
+    SLEEPMODE_LASTAWAKE,
+    BaseModbusSensorEntityDescription,
+)
+from custom_components.solax_modbus.decode_plan import compile_block_decode_plan, compile_decode_plan
+
+
+def make_descr(**kwargs: Any) -> BaseModbusSensorEntityDescription:
+    """Build a holding register sensor description."""
+    kwargs.setdefault("key", "value")
+    kwargs.setdefault("register", 0x10)
+    kwargs.setdefault("register_type", REG_HOLDING)
+    return BaseModbusSensorEntityDescription(**kwargs)
+
+
+def make_hub(order32: str | None = "big") -> Any:
+    """Build the minimal hub state required by treat_address."""
+    hub = cast(Any, object.__new__(SolaXModbusHub))
+    hub._name = "test"
+    hub.cyclecount = 100
+    hub.inverterPowerKw = 10
+    hub.tmpdata_expiry = {}
+    hub.localsLoaded = True
+    hub._validate_register_func = None
+    hub._decode_plans = {}
+    hub.plugin = SimpleNamespace(order32=order32, batch_decode=True, isAwake=Mock(return_value=True))
+    return hub
+
+
+@pytest.mark.parametrize(
+    ("register_data_type", "order32", "regs", "expected", "words"),
+    [
+        (REGISTER_U16, None, [0xFFFE], 0xFFFE, 1),
+        (REGISTER_S16, None, [0xFFFE], -2, 1),
+        (REGISTER_U32, "big", [0x0001, 0x0002], 0x00010002, 2),
+        (REGISTER_U32, "little", [0x0001, 0x0002], 0x00020001, 2),
+        (REGISTER_S32, "big", [0xFFFF, 0xFFFF], -1, 2),
+        (REGISTER_F32, "big", [0x3FC0, 0x0000], 1.5, 2),
+        (REGISTER_F32, "little", [0x0000, 0x3FC0], 1.5, 2),
+        (REGISTER_ULSB16MSB16, "big", [0x0001, 0x0002], 0x00010002, 2),
+        (REGISTER_ULSB16MSB16, "little", [0x0001, 0x0002], 0x00020001, 2),
+        (REGISTER_U8L, None, [0x1234], 0x34, 1),
+        (REGISTER_U8H, None, [0x1234], 0x12, 1),
+    ],
+)
+def test_decoder_matches_register_data_type(register_data_type: str, order32: str | None, regs: list[int], expected: Any, words: int) -> None:
+    plan = compile_decode_plan("test", make_descr(register_data_type=register_data_type), order32, 10)
+
+    assert plan.decode(regs, 0, 0, True) == (expected, words)
+
+
+def test_sensor_word_order_overrides_plugin_default() -> None:
+    plan = compile_decode_plan("test", make_descr(register_data_type=REGISTER_U32, order32="little"), "big", 10)
+
+    assert plan.decode([0x0001, 0x0002], 0, 0, True) == (0x00020001, 2)
+
+
+def test_byte_entity_without_advance_uses_initial_value() -> None:
+    plan = compile_decode_plan("test", make_descr(register_data_type=REGISTER_U8H), None, 10)
+
+    assert plan.decode([], 0, 0xAB12, False) == (0xAB, 0)
+
+
+def test_short_register_slice_raises() -> None:
+    plan = compile_decode_plan("test", make_descr(register_data_type=REGISTER_WORDS, wordcount=3), None, 10)
+
+    with pytest.raises(IndexError):
+        plan.decode([1, 2], 0, 0, True)
+
+
+def test_treat_address_scales_rounds_and_advances() -> None:
+    hub = make_hub()
+    descr = make_descr(register_data_type=REGISTER_S16, scale=0.1, read_scale=2, rounding=2)
+    data: dict[str, Any] = {}
+    fresh_keys: set[str] = set()
+
+    idx = hub.treat_address(data, [0xFFF6, 0], 0, descr, fresh_keys=fresh_keys)
+
+    assert idx == 1
+    assert data["value"] == -2.0
+    assert fresh_keys == {"value"}
+
+
+def test_treat_address_translates_dict_and_callable_scales() -> None:
+    hub = make_hub()
+    data: dict[str, Any] = {"offset": 5}
+    mode = make_descr(key="mode", register_data_type=REGISTER_U16, scale={1: "On"})
+    total = make_descr(key="total", register_data_type=REGISTER_U16, scale=lambda val, descr, datadict: val + datadict["offset"])
+
+    hub.treat_address(data, [2], 0, mode)
+    hub.treat_address(data, [2], 0, total)
+
+    assert data["mode"] == "Unknown"
+    assert data["total"] == 7
+
+
+def test_memoized_callable_scale_runs_only_when_its_inputs_change() -> None:
+    hub = make_hub()
+    scale = Mock(side_effect=lambda val, descr, datadict: f"{val} {datadict['unit']}")
+    descr = make_descr(key="fault", register_data_type=REGISTER_U16, scale=scale, depends_on=["unit"], memoize=True)
+    data: dict[str, Any] = {"unit": "A"}
+
+    for regs in ([2], [2], [3]):
+        hub.treat_address(data, regs, 0, descr)
+    assert scale.call_count == 2
+
+    data["unit"] = "B"
+    hub.treat_address(data, [3], 0, descr)
+
+    assert scale.call_count == 3
+    assert data["fault"] == "3 B"
+
+
+def test_treat_address_rejects_values_outside_declared_range() -> None:
+    hub = make_hub()
+    descr = make_descr(register_data_type=REGISTER_U16, max_value=100)
+
+    with pytest.raises(ModbusIOException):
+        hub.treat_address({}, [101], 0, descr)
+
+
+def test_treat_address_keeps_read_failure_as_none() -> None:
+    hub = make_hub()
+    descr = make_descr(register_data_type=REGISTER_U32)
+    data: dict[str, Any] = {}
+
+    idx = hub.treat_address(data, [1], 0, descr)
+
+    assert idx == 0
+    assert data["value"] is None
+
+
+def test_treat_address_skips_lastawake_values_while_asleep() -> None:
+    hub = make_hub()
+    hub.plugin.isAwake.return_value = False
+    descr = make_descr(register_data_type=REGISTER_U16, sleepmode=SLEEPMODE_LASTAWAKE)
+    data: dict[str, Any] = {"value": 3}
+
+    hub.treat_address(data, [9], 0, descr)
+
+    assert data["value"] == 3
+
+
+def test_replaced_description_gets_a_fresh_plan() -> None:
+    hub = make_hub()
+    descr = make_descr(register_data_type=REGISTER_U16, scale=2)
+    first = hub._decode_plan(descr)
+    replaced = make_descr(register_data_type=REGISTER_U16, scale=3)
+    hub._decode_plans[id(replaced)] = first
+
+    second = hub._decode_plan(replaced)
+
+    assert hub._decode_plan(descr) is first
+    assert second is not first
+    assert second.descr is replaced
+
+
+def test_plans_are_compiled_for_all_block_descriptions() -> None:
+    hub = make_hub()
+    low = make_descr(key="low", register_data_type=REGISTER_U8L)
+    high = make_descr(key="high", register_data_type=REGISTER_U8H)
+    word = make_descr(key="word", register=0x11, register_data_type=REGISTER_U16)
+    descriptions = {0x10: {REGISTER_U8L: low, REGISTER_U8H: high}, 0x11: word}
+
+    hub._compile_decode_plans([block(start=0x10, end=0x12, descriptions=descriptions, regs=[0x10, 0x11])])
+
+    assert {plan.key for plan in hub._decode_plans.values()} == {"low", "high", "word"}
+
+
+def make_mixed_block() -> Any:
+    """Build a block with a gap, byte entities and both 32-bit word orders."""
+    descriptions: dict[int, Any] = {
+        0x10: make_descr(key="s16", register=0x10, register_data_type=REGISTER_S16, scale=0.1),
+        0x11: make_descr(key="u32", register=0x11, register_data_type=REGISTER_U32),
+        0x14: make_descr(key="f32", register=0x14, register_data_type=REGISTER_F32, order32="little"),
+        0x16: {
+            REGISTER_U8L: make_descr(key="low", register=0x16, register_data_type=REGISTER_U8L),
+            REGISTER_U8H: make_descr(key="high", register=0x16, register_data_type=REGISTER_U8H),
+        },
+    }
+    return block(start=0x10, end=0x17, descriptions=descriptions, regs=sorted(descriptions))
+
+
+def test_block_plan_matches_per_register_decoding() -> None:
+    hub = make_hub()
+    blk = make_mixed_block()
+    regs = [0xFFF6, 0x0001, 0x0002, 0xDEAD, 0x0000, 0x3FC0, 0x1234]
+    batch = compile_block_decode_plan(blk, hub._decode_plan)
+    assert batch is not None
+    batch_data: dict[str, Any] = {}
+    batch_fresh: set[str] = set()
+    loop_data: dict[str, Any] = {}
+
+    hub._treat_block(batch_data, regs, batch, batch_fresh)
+    idx = 0
+    for reg in blk.regs:
+        idx = max(idx, reg - blk.start)
+        descr = blk.descriptions[reg]
+        if isinstance(descr, dict):
+            for sub in descr.values():
+                hub.treat_address(loop_data, regs, idx, sub, initval=regs[idx], advance=False)
+            idx += 1
+        else:
+            idx = hub.treat_address(loop_data, regs, idx, descr)
+
+    assert batch_data == loop_data == {"s16": -1.0, "u32": 0x00010002, "f32": 1.5, "low": 0x34, "high": 0x12}
+    assert batch.count == 7
+    assert batch_fresh == set(batch_data)
+
+
+def test_block_with_string_entity_has_no_batch_plan() -> None:
+    hub = make_hub()
+    blk = make_mixed_block()
+    blk.descriptions[0x17] = make_descr(key="serial", register=0x17, register_data_type=REGISTER_STR, wordcount=2)
+    blk.regs.append(0x17)
+
+    assert compile_block_decode_plan(blk, hub._decode_plan) is None
+
+
+@pytest.mark.asyncio
+async def test_block_read_uses_batch_plan_after_startup_cycles() -> None:
+    hub = make_hub()
+    hub._modbus_addr = 1
+    hub._record_block_result = Mock()
+    blk = make_mixed_block()
+    hub._compile_decode_plans([blk])
+    regs = [0xFFF6, 0x0001, 0x0002, 0xDEAD, 0x0000, 0x3FC0, 0x1234]
+    hub.async_read_holding_registers = AsyncMock(return_value=SimpleNamespace(registers=regs, isError=lambda: False))
+    hub.treat_address = Mock(side_effect=AssertionError("per-register decoding used"))
+    data: dict[str, Any] = {}
+
+    result = await hub.async_read_modbus_block(data, blk, "holding")
+
+    assert result.data_succeeded is True
+    assert result.fresh_keys == frozenset({"s16", "u32", "f32", "low", "high"})
+    assert data["f32"] == 1.5
+
+
+@pytest.mark.asyncio
+async def test_short_response_falls_back_to_per_register_decoding() -> None:
+    hub = make_hub()
+    hub._modbus_addr = 1
+    hub._record_block_result = Mock()
+    blk = make_mixed_block()
+    del blk.descriptions[0x16]
+    blk.regs.remove(0x16)
+    hub._compile_decode_plans([blk])
+    hub.async_read_holding_registers = AsyncMock(return_value=SimpleNamespace(registers=[0xFFF6, 0x0001, 0x0002], isError=lambda: False))
+    data: dict[str, Any] = {}
+
+    await hub.async_read_modbus_block(data, blk, "holding")
+
+    assert data["s16"] == -1.0
+    assert data["u32"] == 0x00010002
+    assert data["f32"] is None
+
+
+@pytest.mark.asyncio
+async def test_exception_code_of_a_failed_read_is_reported() -> None:
+    hub = make_hub()
+    hub._modbus_addr = 1
+    hub.slowdown = 1
+    hub._record_block_result = Mock()
+    blk = make_mixed_block()
+    hub.async_read_holding_registers = AsyncMock(return_value=SimpleNamespace(isError=lambda: True, exception_code=0x02))
+
+    result = await hub.async_read_modbus_block({}, blk, "holding")
+
+    assert result.data_succeeded is False
+    hub._record_block_result.assert_called_once_with(blk, "holding", False, "read_error ", 0x02)
@@ -1,5 +1,6 @@
 """Tests for duplicate inverter warnings during polling."""
 
+import asyncio
 import logging
 from types import SimpleNamespace
 from typing import Any, cast
@@ -110,15 +111,17 @@ async def test_scheduled_poll_checks_warning_on_every_cycle(monkeypatch: Any) ->
     """Call duplicate detection for each invocation of the slow poll callback."""
     scheduled: dict[str, Any] = {}
 
-    def _track_interval(_hass: Any, callback: Any, _interval: Any) -> Any:
+    def _call_at(_hass: Any, callback: Any, _loop_time: float) -> Any:
         scheduled["callback"] = callback
         return Mock()
 
-    monkeypatch.setattr(solax_modbus, "async_track_time_interval", _track_interval)
+    monkeypatch.setattr(solax_modbus, "async_call_at", _call_at)
 
     hub = object.__new__(SolaXModbusHub)
-    object.__setattr__(hub, "_hass", SimpleNamespace())
+    object.__setattr__(hub, "_hass", SimpleNamespace(loop=asyncio.get_running_loop()))
     hub._name = "SolaX"
+    hub._poll_anchor = None
+    hub._unsub_poll_timer = None
     hub.groups = {}
     hub.cyclecount = 0
     hub.slowdown = 1
@@ -144,7 +147,10 @@ async def test_scheduled_poll_checks_warning_on_every_cycle(monkeypatch: Any) ->
     )
 
     await hub.async_add_solax_modbus_sensor(sensor)
-    await scheduled["callback"]()
-    await scheduled["callback"]()
+    interval_group = hub.groups[15]
+    for _ in range(2):
+        interval_group.deadline = 0.0  # due now
+        scheduled["callback"](None)
+        await interval_group.poll_task
 
     assert warn_duplicate.call_args_list == [call(15), call(15)]
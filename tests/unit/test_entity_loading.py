@@ -18,7 +18,7 @@ def test_descriptor_without_internal_is_loaded_by_default(
     registry = SimpleNamespace(async_get_entity_id=lambda *_args: None)
     fake_hass: Any = object()
     monkeypatch.setattr(
-        "custom_components.solax_modbus.er.async_get",
+        "custom_components.solax_modbus.registry_cache.er.async_get",
         lambda _hass: registry,
     )
 
@@ -124,3 +124,18 @@ async def test_existing_firmware_fallback_is_preserved_without_probe_warnings(
     assert not [
         record for record in caplog.records if record.name == "custom_components.solax_modbus.plugin_growatt" and record.levelno >= logging.WARNING
     ]
+
+
+@pytest.mark.asyncio
+async def test_cached_detection_is_confirmed_by_the_serial_number() -> None:
+    hub = GrowattHub({3001: "NOTAMODEL1", 209: "XTD1234567"})
+    await growatt_plugin.async_determineInverterType(hub, CONFIG)
+    assert growatt_plugin.serial_address == 209
+
+    hub = GrowattHub({3001: "NOTAMODEL1", 209: "XTD1234567"})
+    assert await growatt_plugin.async_confirmInverterType(hub, CONFIG, GEN4 | X1, "XTD1234567", 209)
+    assert hub.read_addresses == [209]
+    assert hub.seriesnumber == "XTD1234567"
+
+    assert not await growatt_plugin.async_confirmInverterType(GrowattHub({209: "XTD7654321"}), CONFIG, GEN4 | X1, "XTD1234567", 209)
+    assert not await growatt_plugin.async_confirmInverterType(GrowattHub({209: "XTD1234567"}), CONFIG, GEN4 | X1, "XTD1234567", None)
@@ -0,0 +1,191 @@
+"""Tests for the device state (quarantine map, block layouts) kept across restarts."""
+
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import ANY, AsyncMock, Mock
+
+import pytest
+
+import custom_components.solax_modbus as solax_modbus
+import custom_components.solax_modbus.learned_store as learned_store
+from custom_components.solax_modbus import SolaXModbusHub
+from custom_components.solax_modbus.block_planner import BlockLimits
+from custom_components.solax_modbus.const import CONF_PLUGIN
+from custom_components.solax_modbus.learned_store import LearnedDeviceStore
+
+
+def make_hub(stored: dict[str, Any] | None, firmware: str = "1.0") -> Any:
+    hub = cast(Any, object.__new__(SolaXModbusHub))
+    hub._name = "test"
+    hub._seriesnumber = "SN1"
+    hub._invertertype = 3
+    hub.config = {CONF_PLUGIN: "solax"}
+    hub.data = {}
+    hub.plugin = SimpleNamespace(getSoftwareVersion=lambda data: firmware)
+    hub.bad_regs = {"holding": set(), "input": {0x20}}
+    hub._restored_bad_regs = {"holding": set(), "input": set()}
+    hub._restored_firmware = None
+    hub._block_layouts = {"5/inverter/holding": [[0x0, 0x1], [0x40]]}
+    hub._restored_block_layouts = {}
+    hub.block_limits = {}
+    hub._restored_block_limits = {}
+    hub._detection = None
+    hub._learned_store = SimpleNamespace(async_load=AsyncMock(return_value=stored), schedule_save=Mock())
+    hub._ensure_quarantine_recheck_task = Mock()
+    hub._invalidate_blocks = Mock()
+    return hub
+
+
+@pytest.mark.asyncio
+async def test_store_only_returns_state_of_the_same_device() -> None:
+    store = object.__new__(LearnedDeviceStore)
+    store._store = SimpleNamespace(async_load=AsyncMock(return_value={"serial": "SN1", "bad_regs": {}, "detection": {"invertertype": 3}}))
+
+    assert await store.async_load("SN1") == {"serial": "SN1", "bad_regs": {}, "detection": {"invertertype": 3}}
+    assert await store.async_load("SN2") is None
+    assert await store.async_load_detection() == {"invertertype": 3, "serial": "SN1"}
+
+
+@pytest.mark.asyncio
+async def test_restored_registers_are_quarantined_and_saved_again() -> None:
+    hub = make_hub({"serial": "SN1", "firmware": "1.0", "bad_regs": {"holding": [0x10], "input": [0x20, 0x30]}})
+
+    await hub._async_restore_learned_state()
+
+    assert hub.bad_regs == {"holding": {0x10}, "input": {0x20, 0x30}}
+    assert hub._restored_bad_regs == {"holding": {0x10}, "input": {0x30}}
+    hub._ensure_quarantine_recheck_task.assert_called_once_with()
+
+    hub._confirm_learned_state()
+    assert hub.bad_regs == {"holding": {0x10}, "input": {0x20, 0x30}}
+    hub._save_learned_state()
+    state = hub._learned_store.schedule_save.call_args.args[0]()
+    assert state == {
+        "serial": "SN1",
+        "firmware": "1.0",
+        "bad_regs": {"holding": [0x10], "input": [0x20, 0x30]},
+        "block_plans": {"plugin": "solax", "invertertype": 3, "layouts": {"5/inverter/holding": [[0x0, 0x1], [0x40]]}, "limits": {}},
+        "detection": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_restored_registers_are_dropped_after_a_firmware_change() -> None:
+    hub = make_hub({"serial": "SN1", "firmware": "1.0", "bad_regs": {"holding": [0x10], "input": [0x30]}}, firmware="1.1")
+
+    await hub._async_restore_learned_state()
+    hub._confirm_learned_state()
+
+    assert hub.bad_regs == {"holding": set(), "input": {0x20}}
+    hub._invalidate_blocks.assert_called_once_with()
+    hub._learned_store.schedule_save.assert_called_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("plugin", "invertertype", "restored"), [("solax", 3, True), ("solax", 5, False), ("growatt", 3, False)])
+async def test_block_layouts_are_restored_for_the_same_plugin_and_inverter_type(plugin: str, invertertype: int, restored: bool) -> None:
+    layouts = {"5/inverter/holding": [[0x0, 0x1], [0x40]]}
+    hub = make_hub({"serial": "SN1", "firmware": "1.0", "block_plans": {"plugin": plugin, "invertertype": invertertype, "layouts": layouts}})
+
+    await hub._async_restore_learned_state()
+
+    assert hub._restored_block_layouts == (layouts if restored else {})
+
+
+@pytest.mark.asyncio
+async def test_block_layouts_are_dropped_after_a_firmware_change() -> None:
+    layouts = {"5/inverter/holding": [[0x0, 0x1], [0x40]]}
+    hub = make_hub({"serial": "SN1", "firmware": "1.0", "block_plans": {"plugin": "solax", "invertertype": 3, "layouts": layouts}}, firmware="1.1")
+
+    await hub._async_restore_learned_state()
+    hub._confirm_learned_state()
+
+    assert hub._restored_block_layouts == {}
+    hub._invalidate_blocks.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_discovered_block_limits_are_saved_and_restored() -> None:
+    hub = make_hub(None)
+    hub.block_limits = {"holding": BlockLimits(max_registers=40, holes=(0x30, 0x31))}
+    hub._save_learned_state()
+    state = hub._learned_store.schedule_save.call_args.args[0]()
+    assert state["block_plans"]["limits"] == {"holding": {"max_registers": 40, "holes": [0x30, 0x31]}}
+
+    restarted = make_hub({**state, "serial": "SN1"})
+    await restarted._async_restore_learned_state()
+
+    assert restarted.block_limits == {"holding": BlockLimits(max_registers=40, holes=(0x30, 0x31))}
+
+
+@pytest.mark.asyncio
+async def test_restored_block_limits_are_dropped_after_a_firmware_change() -> None:
+    limits = {"holding": {"max_registers": 40, "holes": [0x30]}, "input": {"max_registers": 20, "holes": []}}
+    hub = make_hub(
+        {"serial": "SN1", "firmware": "1.0", "block_plans": {"plugin": "solax", "invertertype": 3, "layouts": {}, "limits": limits}}, firmware="1.1"
+    )
+
+    await hub._async_restore_learned_state()
+    assert hub.block_limits == {"holding": BlockLimits(max_registers=40, holes=(0x30,)), "input": BlockLimits(max_registers=20)}
+    hub.block_limits["input"] = BlockLimits(max_registers=60)  # discovered again on the new firmware
+    hub._confirm_learned_state()
+
+    assert hub.block_limits == {"input": BlockLimits(max_registers=60)}
+    hub._invalidate_blocks.assert_called_once_with()
+
+
+def make_detection_hub(confirmed: bool, detected_config: dict[str, Any] | None = None) -> Any:
+    hub = make_hub(None)
+    hub._invertertype = None
+    hub._has_local_inverter_model = False
+    hub.inverter_model = None
+    hub.async_connect = AsyncMock()
+    hub._check_connection = AsyncMock(return_value=True)
+    hub.plugin = SimpleNamespace(inverter_model=None, async_confirmInverterType=AsyncMock(return_value=confirmed))
+    current_config, hub.config = hub.config, detected_config or hub.config
+    fingerprint = hub._config_fingerprint()
+    hub.config = current_config
+    detection = {
+        "plugin": "solax",
+        "config": fingerprint,
+        "invertertype": 3,
+        "inverter_model": "X1-Hybrid",
+        "local_model": True,
+        "serial_address": 0x300,
+        "serial": "SN1",
+    }
+    hub._learned_store.async_load_detection = AsyncMock(return_value=detection)
+    return hub
+
+
+@pytest.mark.asyncio
+async def test_confirmed_detection_of_an_earlier_run_is_used() -> None:
+    hub = make_detection_hub(confirmed=True)
+
+    assert await hub._async_restore_detection()
+
+    hub.plugin.async_confirmInverterType.assert_awaited_once_with(hub, hub.config, 3, "SN1", 0x300)
+    assert (hub._invertertype, hub.seriesnumber, hub._get_inverter_model()) == (3, "SN1", "X1-Hybrid")
+    assert (hub._detection["invertertype"], hub._detection["serial_address"]) == (3, 0x300)
+
+
+@pytest.mark.asyncio
+async def test_detection_of_an_earlier_run_needs_confirmation_and_the_same_options() -> None:
+    hub = make_detection_hub(confirmed=False)
+    assert not await hub._async_restore_detection()
+    assert hub._invertertype is None
+
+    hub = make_detection_hub(confirmed=True, detected_config={CONF_PLUGIN: "solax", "read_eps": True})
+    assert not await hub._async_restore_detection()
+    hub.plugin.async_confirmInverterType.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_learned_state_is_removed_with_the_config_entry(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = SimpleNamespace(async_remove=AsyncMock())
+    monkeypatch.setattr(learned_store, "Store", Mock(return_value=store))
+
+    await solax_modbus.async_remove_entry(cast(Any, SimpleNamespace()), cast(Any, SimpleNamespace(entry_id="abc", title="SolaX")))
+
+    learned_store.Store.assert_called_once_with(ANY, learned_store.STORAGE_VERSION, "solax_modbus.abc.learned")
+    store.async_remove.assert_awaited_once_with()
@@ -116,7 +116,9 @@ def make_quarantine_hub(core_hub: FakeCoreHub) -> Any:
     hub.bad_regs = {"holding": set(), "input": set()}
     hub.initial_groups = {}
     hub.groups = {}
+    hub._register_index = {}
     hub.blocks_changed = False
+    hub._comm_block_successes = {}
     hub._comm_last_quarantined_register = None
     hub._comm_last_recovered_register = None
     hub._ensure_quarantine_recheck_task = Mock()
@@ -275,6 +277,52 @@ async def test_runtime_quarantine_operates_through_core_transport() -> None:
     hub._publish_communication_diagnostics.assert_called_once_with()
 
 
+@pytest.mark.asyncio
+async def test_bisect_infers_failing_halves_and_skips_recently_read_entities() -> None:
+    hub = make_quarantine_hub(FakeCoreHub())
+    probes: list[tuple[int, int]] = []
+
+    async def probe(block_obj: Any, typ: str, timeout: float | None = None) -> bool:
+        probes.append((block_obj.start, block_obj.end))
+        return not block_obj.start <= 15 < block_obj.end
+
+    hub._probe_block = probe
+    failing_block = block(start=10, end=18, descriptions={}, regs=list(range(10, 18)))
+    candidates: set[int] = set()
+
+    await hub._find_bad_regs_in_block(failing_block, "holding", candidates)
+
+    assert candidates == {15}
+    assert probes == [(10, 18), (10, 14), (14, 16), (14, 15), (16, 18)]  # 14-18 and 15-16 are known to fail
+
+    hub._comm_block_failures = {}
+    hub._record_block_result(block(start=10, end=14, descriptions={}, regs=[10, 11, 12, 13]), "holding", True)
+    probes.clear()
+    candidates.clear()
+
+    await hub._find_bad_regs_in_block(failing_block, "holding", candidates)
+
+    assert candidates == {15}
+    assert probes == [(10, 18), (14, 18), (14, 16), (14, 15), (16, 18)]
+
+
+@pytest.mark.parametrize(("exception_code", "definitive"), [(0x02, True), (0x06, False), (None, False)])
+def test_illegal_data_address_starts_the_bisect_after_one_failure(exception_code: int | None, definitive: bool) -> None:
+    hub = make_quarantine_hub(FakeCoreHub())
+    hub._comm_block_failures = {}
+    hub._comm_block_successes = {}
+    hub._comm_last_block_success_time = None
+    hub._comm_recent_outcomes = []
+    hub._runtime_bisect_tasks = {}
+    hub._hass = SimpleNamespace(loop=SimpleNamespace(create_task=Mock(side_effect=lambda coro, context: coro.close() or Mock())))
+    failing_block = block(start=10, end=12, descriptions={}, regs=[10, 11])
+
+    hub._record_block_result(failing_block, "holding", False, "read_error ", exception_code)
+
+    assert hub._hass.loop.create_task.called is definitive
+    assert list(hub._runtime_bisect_tasks) == (["holding:0xa-0xc"] if definitive else [])
+
+
 @pytest.mark.asyncio
 async def test_quarantined_register_is_rechecked_through_core_transport() -> None:
     core_hub = FakeCoreHub()
@@ -0,0 +1,191 @@
+"""Tests for the pipelined Modbus TCP client."""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import AsyncMock
+
+import pytest
+from pymodbus.exceptions import ConnectionException, ModbusIOException
+
+from custom_components.solax_modbus import SolaXModbusHub
+from custom_components.solax_modbus.const import PollOutcome
+from custom_components.solax_modbus.pipelined_tcp import AsyncPipelinedTcpClient
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeModbusServer:
+    """Modbus TCP server that collects a batch of requests and answers them in reverse order."""
+
+    def __init__(self, batch: int) -> None:
+        self.batch = batch
+        self.requests: list[tuple[int, int, int, int]] = []  # (unit, function code, address, count)
+        self.max_outstanding = 0
+        self.header: dict[str, int] = {}  # MBAP fields of the responses to replace: protocol, length or unit
+        self.server: asyncio.Server | None = None
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        outstanding: list[tuple[int, int, bytes]] = []
+        try:
+            while True:
+                transaction_id, _protocol, length, unit = struct.unpack(">HHHB", await reader.readexactly(7))
+                pdu = await reader.readexactly(length - 1)
+                function_code, address, count = struct.unpack(">BHH", pdu[:5])
+                self.requests.append((unit, function_code, address, count))
+                outstanding.append((transaction_id, unit, self.response(function_code, address, count)))
+                self.max_outstanding = max(self.max_outstanding, len(outstanding))
+                if len(outstanding) >= self.batch:
+                    for transaction_id, unit, response in reversed(outstanding):
+                        protocol, length, unit = (
+                            self.header.get("protocol", 0),
+                            self.header.get("length", len(response) + 1),
+                            self.header.get("unit", unit),
+                        )
+                        writer.write(struct.pack(">HHHB", transaction_id, protocol, length, unit) + response)
+                    outstanding.clear()
+                    await writer.drain()
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+    @staticmethod
+    def response(function_code: int, address: int, count: int) -> bytes:
+        if address >= 0x1000:
+            return bytes([function_code | 0x80, 0x02])
+        if function_code == 0x06:
+            return struct.pack(">BHH", function_code, address, count)
+        return struct.pack(f">BB{count}H", function_code, 2 * count, *(address + i for i in range(count)))
+
+
+@pytest.fixture
+async def server() -> AsyncIterator[FakeModbusServer]:
+    fake = FakeModbusServer(batch=3)
+    fake.server = await asyncio.start_server(fake.handle, "127.0.0.1", 0)
+    yield fake
+    fake.server.close()
+    await fake.server.wait_closed()
+
+
+def make_client(fake: FakeModbusServer, max_inflight: int = 3) -> AsyncPipelinedTcpClient:
+    assert fake.server is not None
+    port = fake.server.sockets[0].getsockname()[1]
+    return AsyncPipelinedTcpClient(host="127.0.0.1", port=port, timeout=2, max_inflight=max_inflight)
+
+
+async def test_out_of_order_responses_are_matched_to_their_requests(server: FakeModbusServer) -> None:
+    client = make_client(server)
+
+    responses = await asyncio.gather(
+        client.read_holding_registers(address=10, count=2, device_id=1),
+        client.read_input_registers(address=20, count=1, device_id=1),
+        client.read_holding_registers(address=30, count=3, device_id=1),
+    )
+
+    assert [response.registers for response in responses] == [[10, 11], [20], [30, 31, 32]]
+    assert server.max_outstanding == 3
+    assert sorted(request[1] for request in server.requests) == [3, 3, 4]
+    await client.close()
+
+
+async def test_exception_response_is_an_error(server: FakeModbusServer) -> None:
+    server.batch = 1
+    client = make_client(server)
+
+    response = await client.read_holding_registers(address=0x1000, count=1, slave=1)
+    written = await client.write_register(address=5, value=7, device_id=1)
+
+    assert response.isError() is True
+    assert response.exception_code == 2
+    assert written.isError() is False
+    await client.close()
+
+
+async def test_in_flight_limit_is_respected(server: FakeModbusServer) -> None:
+    server.batch = 2
+    client = make_client(server, max_inflight=2)
+
+    responses = await asyncio.gather(*(client.read_holding_registers(address=address, count=1, device_id=1) for address in range(4)))
+
+    assert [response.registers for response in responses] == [[0], [1], [2], [3]]
+    assert server.max_outstanding == 2
+    await client.close()
+
+
+@pytest.mark.parametrize("header", [{"length": 0}, {"protocol": 1}])
+async def test_invalid_response_header_closes_the_connection(server: FakeModbusServer, header: dict[str, int]) -> None:
+    server.batch = 1
+    server.header = header
+    client = make_client(server)
+
+    with pytest.raises(ConnectionException):
+        await client.read_holding_registers(address=10, count=1, device_id=1)
+    assert client.connected is False
+
+    server.header = {}
+    response = await client.read_holding_registers(address=10, count=1, device_id=1)
+    assert response.registers == [10]
+    await client.close()
+
+
+async def test_response_of_another_unit_is_an_error(server: FakeModbusServer) -> None:
+    server.batch = 1
+    server.header = {"unit": 2}
+    client = make_client(server)
+
+    with pytest.raises(ModbusIOException):
+        await client.read_holding_registers(address=10, count=1, device_id=1)
+
+    server.header = {}
+    response = await client.read_holding_registers(address=10, count=1, device_id=1)
+    assert response.registers == [10]
+    await client.close()
+
+
+async def test_group_read_sends_all_blocks_before_decoding() -> None:
+    hub = cast(Any, object.__new__(SolaXModbusHub))
+    hub._name = "test"
+    hub._pipelined_reads = True
+    hub.data = {"_repeatUntil": {}}
+    hub.computedSensors = {}
+    hub.computedEntities = {}
+    hub.sensorDescriptions = {}
+    hub.sensorEntities = {}
+    hub.writeLocals = {}
+    hub.writequeue = {}
+    hub.localsUpdated = False
+    hub.localsLoaded = True
+    hub.plugin = SimpleNamespace(isAwake=lambda data: True, localDataCallback=lambda hub: None)
+    hub._poll_data_lock = asyncio.Lock()
+    hub._poll_side_effect_lock = asyncio.Lock()
+    hub.slowdown = 1
+    hub._compute_poll_sensors = lambda data, fresh_keys: set()
+    started: list[int] = []
+    release = asyncio.Event()
+
+    async def read(block: Any, typ: str) -> Any:
+        started.append(block.start)
+        if len(started) == 3:  # all requests are in flight before the first one is answered
+            release.set()
+        await release.wait()
+        return block.start
+
+    decoded: list[tuple[int, Any]] = []
+
+    async def read_block(data: dict[str, Any], block: Any, typ: str, pending: Any = None) -> Any:
+        decoded.append((block.start, await pending))
+        return SimpleNamespace(data_succeeded=True, communication_succeeded=True, tolerated=False, fresh_keys=frozenset())
+
+    hub._read_block_registers = read
+    hub.async_read_modbus_block = AsyncMock(side_effect=read_block)
+    blocks = [SimpleNamespace(start=start) for start in (0, 100, 200)]
+    group = SimpleNamespace(readPreparation=None, readFollowUp=None, holdingBlocks=blocks[:2], inputBlocks=blocks[2:])
+
+    result = await hub.async_read_modbus_registers_all(group)
+
+    assert result is PollOutcome.SUCCESS
+    assert started == [0, 100, 200]
+    assert decoded == [(0, 0), (100, 100), (200, 200)]
@@ -85,3 +85,21 @@ def test_solinteg_runtime_descriptions_are_isolated_per_hub() -> None:
     assert first.plugin.SELECT_TYPES[first_index].option_dict == {0: "off", 1: "mppt1"}
     assert second.plugin.SELECT_TYPES[second_index] == second_description
     assert solinteg_template.SELECT_TYPES[template_index] == template_description
+
+
+def test_hubs_share_the_frozen_descriptions_of_the_template() -> None:
+    """Description lists are copied per hub, the frozen descriptions in them are shared."""
+    first = make_hub(sofar_template, "Sofar 1")
+    second = make_hub(sofar_template, "Sofar 2")
+    first_battery = first.plugin.BATTERY_CONFIG
+    template_battery = sofar_template.BATTERY_CONFIG
+
+    assert first.plugin.SENSOR_TYPES is not sofar_template.SENSOR_TYPES
+    assert all(ours is theirs for ours, theirs in zip(first.plugin.SENSOR_TYPES, second.plugin.SENSOR_TYPES, strict=True))
+    assert all(ours is theirs for ours, theirs in zip(first.plugin.NUMBER_TYPES, sofar_template.NUMBER_TYPES, strict=True))
+    assert first_battery is not None and template_battery is not None
+    assert first_battery.battery_sensor_type is not template_battery.battery_sensor_type
+    assert first_battery.battery_sensor_type == template_battery.battery_sensor_type
+    assert all(
+        ours is theirs for ours, theirs in zip(first_battery.battery_sensor_type or [], template_battery.battery_sensor_type or [], strict=True)
+    )
@@ -1,7 +1,9 @@
 from typing import Any
+from unittest.mock import AsyncMock
 
 import pytest
 
+from custom_components.solax_modbus import plugin_solax
 from custom_components.solax_modbus.plugin_solax import (
     AC,
     EPS,
@@ -109,6 +111,26 @@ async def test_determine_inverter_type_solax(mock_hub: Any) -> None:
     assert inverter_type == expected
 
 
+@pytest.mark.asyncio
+async def test_confirm_inverter_type_solax_reads_the_serial_once(mock_hub: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    addresses: list[int] = []
+
+    async def read_serialnr(hub: Any, address: int) -> str | None:
+        addresses.append(address)
+        return "H34T10H1234567" if address == 0x300 else None
+
+    monkeypatch.setattr(plugin_solax, "async_read_serialnr", read_serialnr)
+    monkeypatch.setattr(solax_plugin, "async_read_firmware_metadata", AsyncMock())
+
+    assert await solax_plugin.async_confirmInverterType(mock_hub, {}, HYBRID | X3 | GEN4, "H34T10H1234567", 0x300)
+    assert addresses == [0x300]
+    solax_plugin.async_read_firmware_metadata.assert_awaited_once_with(mock_hub, HYBRID | X3 | GEN4)
+
+    assert not await solax_plugin.async_confirmInverterType(mock_hub, {}, HYBRID | X3 | GEN4, "H34T10H1234567", 0x0)
+    assert not await solax_plugin.async_confirmInverterType(mock_hub, {}, HYBRID | X3 | GEN4, "H34T10H1234567", None)
+    assert addresses == [0x300, 0x0]
+
+
 def test_parallel_master_scales_import_limit(mock_hub: Any) -> None:
     """
     Verify parallel Master inverters scale remotecontrol_import_limit.
@@ -0,0 +1,110 @@
+"""Tests for the phase-aligned hub poll scheduler."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import Mock
+
+import pytest
+
+import custom_components.solax_modbus as solax_modbus
+from custom_components.solax_modbus import SolaXModbusHub, empty_hub_interval_group_lambda
+from custom_components.solax_modbus.const import PollOutcome
+from custom_components.solax_modbus.poll_scheduler import next_deadline, phase_offsets
+
+
+def test_groups_never_tick_together() -> None:
+    offsets = phase_offsets([60, 5, 15])
+
+    assert offsets[5] == 0.0
+    ticks = [round(offset + k * interval, 3) for interval, offset in offsets.items() for k in range(3600 // int(interval))]
+    assert len(ticks) == len(set(ticks))
+
+
+def test_next_deadline_stays_on_the_grid() -> None:
+    assert next_deadline(100.0, 2.5, 5, 90.0) == 102.5
+    assert next_deadline(100.0, 2.5, 5, 102.5) == 107.5
+    assert next_deadline(100.0, 2.5, 5, 118.0) == 122.5
+
+
+def make_hub(loop_time: list[float], monkeypatch: Any) -> Any:
+    monkeypatch.setattr(solax_modbus, "async_call_at", Mock(return_value=Mock()))
+    hub = cast(Any, object.__new__(SolaXModbusHub))
+    loop = SimpleNamespace(time=lambda: loop_time[0], create_task=Mock(side_effect=lambda coro: coro.close() or Mock(done=Mock(return_value=False))))
+    object.__setattr__(hub, "_hass", SimpleNamespace(loop=loop))
+    hub._name = "test"
+    hub._poll_anchor = None
+    hub._unsub_poll_timer = None
+    hub.groups = {}
+    for interval in (5, 15, 60):
+        hub.groups[interval] = empty_hub_interval_group_lambda()
+        hub.groups[interval].interval = interval
+    return hub
+
+
+def test_reschedule_staggers_the_first_ticks(monkeypatch: Any) -> None:
+    loop_time = [1000.0]
+    hub = make_hub(loop_time, monkeypatch)
+
+    hub._reschedule_interval_groups()
+
+    deadlines = {interval: round(group.deadline, 3) for interval, group in hub.groups.items()}
+    assert deadlines == {5: 1005.0, 15: 1001.667, 60: 1003.333}
+    solax_modbus.async_call_at.assert_called_with(hub._hass, hub._on_poll_timer, hub.groups[15].deadline)
+
+
+def test_overrunning_group_skips_ticks_without_catch_up(monkeypatch: Any) -> None:
+    loop_time = [1000.0]
+    hub = make_hub(loop_time, monkeypatch)
+    hub._reschedule_interval_groups()
+    fast = hub.groups[5]
+
+    loop_time[0] = 1005.0  # all three groups are due, each starts a poll
+    hub._on_poll_timer(None)
+    assert hub._hass.loop.create_task.call_count == 3
+    assert fast.deadline == 1010.0
+
+    loop_time[0] = 1022.0  # the polls are still running and the timer fired late
+    hub._on_poll_timer(None)
+
+    assert hub._hass.loop.create_task.call_count == 3
+    assert fast.deadline == 1025.0
+    assert fast.missed_ticks == 3  # 1010 and 1015 passed unnoticed, the 1020 tick found the poll still running
+    assert round(hub.groups[15].deadline, 3) == 1031.667
+    assert hub.groups[15].missed_ticks == 1
+
+
+@pytest.mark.asyncio
+async def test_initial_refresh_waits_for_running_poll() -> None:
+    hub = cast(Any, object.__new__(SolaXModbusHub))
+    hub._name = "test"
+    hub._stopping = False
+    hub._initial_refresh_done = False
+    hub._initial_refresh_active = False
+    hub._probe_ready = asyncio.Event()
+    hub._probe_ready.set()
+    hub._hass = None
+    order: list[str] = []
+    release = asyncio.Event()
+
+    async def running_poll() -> None:
+        await release.wait()
+        order.append("scheduled poll")
+
+    async def refresh_once(interval_group: Any, bypass_slowdown: bool = False) -> tuple[Any, int]:
+        order.append("initial refresh")
+        return PollOutcome.SUCCESS, 0
+
+    group = empty_hub_interval_group_lambda()
+    group.interval = 5
+    group.device_groups = {"inverter": SimpleNamespace()}
+    group.poll_task = asyncio.create_task(running_poll())
+    hub.groups = {5: group}
+    hub._refresh_interval_group_once = refresh_once
+
+    initial = asyncio.create_task(hub._run_initial_refresh_when_ready())
+    await asyncio.sleep(0.3)
+    release.set()
+    await initial
+
+    assert order == ["scheduled poll", "initial refresh"]
@@ -1,14 +1,18 @@
 """Tests for atomic polling snapshots."""
 
 import asyncio
+import time
 from types import SimpleNamespace
 from typing import Any, cast
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+import custom_components.solax_modbus as solax_modbus
 from custom_components.solax_modbus import BlockReadResult, PendingWrite, SolaXModbusHub
+from custom_components.solax_modbus.bus_scheduler import PriorityBusLock, bus_priority
 from custom_components.solax_modbus.const import REGISTER_U16, PollOutcome
+from custom_components.solax_modbus.poll_snapshot import PollSnapshot
 
 
 def make_hub() -> Any:
@@ -29,6 +33,7 @@ def make_hub() -> Any:
         localDataCallback=Mock(return_value=True),
     )
     hub._poll_data_lock = asyncio.Lock()
+    hub._poll_side_effect_lock = asyncio.Lock()
     hub.slowdown = 1
     return hub
 
@@ -98,6 +103,23 @@ async def test_partial_group_commits_successful_values_and_legacy_computed_senso
     computed_sensor.modbus_data_updated.assert_called_once_with()
 
 
+@pytest.mark.asyncio
+async def test_computed_sensor_is_published_when_its_value_changes() -> None:
+    hub = make_hub()
+    group = make_group()
+    for key in ("doubled", "daily"):
+        hub.computedSensors[key] = SimpleNamespace(key=key, internal=False, value_function=lambda initval, descr, data: data["raw"] * 2)
+    hub.sensorEntities["doubled"] = Mock(publish_every_poll=False)
+    hub.sensorEntities["daily"] = Mock(publish_every_poll=True)
+    hub.async_read_modbus_block = AsyncMock(return_value=successful_block("raw"))
+
+    await hub.async_read_modbus_registers_all(group)  # raw stays 1, the computed values are new
+    await hub.async_read_modbus_registers_all(group)  # nothing changed
+
+    assert hub.sensorEntities["doubled"].modbus_data_updated.call_count == 1
+    assert hub.sensorEntities["daily"].modbus_data_updated.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_partial_group_keeps_computed_value_when_dependency_is_not_fresh() -> None:
     hub = make_hub()
@@ -307,6 +329,26 @@ async def test_successful_awake_poll_retries_queued_sleep_write() -> None:
     assert hub.writequeue == {}
 
 
+@pytest.mark.asyncio
+async def test_concurrent_groups_send_a_queued_write_once() -> None:
+    hub = make_hub()
+    request = PendingWrite(unit=2, address=36, payload=40000, register_data_type=REGISTER_U16)
+    hub.writequeue[(request.unit, request.address)] = request
+    hub.async_read_modbus_block = AsyncMock(return_value=successful_block())
+
+    async def write(**kwargs: Any) -> Any:
+        await asyncio.sleep(0)  # the other group finishes its reads meanwhile
+        return SimpleNamespace(isError=lambda: False)
+
+    hub.async_lowlevel_write_register = AsyncMock(side_effect=write)
+
+    outcomes = await asyncio.gather(hub.async_read_modbus_data(make_group()), hub.async_read_modbus_data(make_group()))
+
+    assert outcomes == [PollOutcome.SUCCESS, PollOutcome.SUCCESS]
+    hub.async_lowlevel_write_register.assert_awaited_once()
+    assert hub.writequeue == {}
+
+
 @pytest.mark.asyncio
 async def test_successful_group_commits_raw_and_computed_values_together() -> None:
     hub = make_hub()
@@ -386,19 +428,93 @@ async def test_cancelled_read_preparation_returns_skipped() -> None:
 
 def test_snapshot_commit_preserves_concurrent_local_change() -> None:
     hub = make_hub()
-    previous_data = {"_repeatUntil": {}, "raw": 1, "removed": 5}
-    new_data = {"_repeatUntil": {}, "raw": 2, "added": 7}
-    hub.data = {"_repeatUntil": {}, "raw": 99, "removed": 5}
+    hub.data = {"_repeatUntil": {}, "raw": 1, "removed": 5}
+    snapshot = PollSnapshot(hub.data)
+    snapshot.update({"raw": 2, "added": 7})
+    del snapshot["removed"]
+    hub.data["raw"] = 99  # local change while the group was read
 
-    hub._commit_poll_snapshot(previous_data, new_data)
+    changed = hub._commit_poll_snapshot(snapshot)
 
     assert hub.data["raw"] == 99
     assert hub.data["added"] == 7
     assert "removed" not in hub.data
+    assert changed == {"added", "removed"}
 
 
 @pytest.mark.asyncio
-async def test_group_reads_are_serialized() -> None:
+async def test_only_entities_with_changed_values_are_published() -> None:
+    hub = make_hub()
+    hub.data.update({"static": 5, "voltage": 230})
+    hub.blocks_changed = False
+    hub.cyclecount = 1
+    hub.sleepnone = []
+    hub.sleepzero = []
+    static, voltage, riemann = (
+        SimpleNamespace(entity_description=SimpleNamespace(key=key), modbus_data_updated=Mock(), **extra)
+        for key, extra in (("static", {}), ("voltage", {}), ("riemann", {"publish_every_poll": True}))
+    )
+    group = make_group()
+    group.sensors = [static, voltage, riemann]
+    interval_group = SimpleNamespace(interval=5, device_groups={"test": group})
+
+    async def read_block(data: dict[str, Any], block: Any, typ: str) -> BlockReadResult:
+        data["voltage"] += 1
+        return successful_block("static", "voltage")
+
+    hub.async_read_modbus_block = read_block
+    await hub._refresh_interval_group_once(interval_group)  # first poll publishes everything
+    outcome, updated_sensors = await hub._refresh_interval_group_once(interval_group)
+
+    assert outcome is PollOutcome.SUCCESS
+    assert updated_sensors == 2
+    assert group.changed_keys == {"voltage"}
+    assert static.modbus_data_updated.call_count == 1
+    assert voltage.modbus_data_updated.call_count == 2
+    assert riemann.modbus_data_updated.call_count == 2
+
+    group.last_full_publish -= solax_modbus.FULL_PUBLISH_INTERVAL
+    _outcome, updated_sensors = await hub._refresh_interval_group_once(interval_group)
+
+    assert updated_sensors == 3
+    assert static.modbus_data_updated.call_count == 2
+
+
+def test_prevent_update_number_is_published_once_its_written_value_expires() -> None:
+    hub = make_hub()
+    hub.tmpdata_expiry = {"export_limit": time.time() + 60}
+    number = SimpleNamespace(entity_description=SimpleNamespace(key="export_limit"))
+    group = make_group()
+    group.sensors = [number]
+    group.changed_keys = set()
+    group.last_full_publish = time.monotonic()
+
+    assert hub._sensors_to_publish(group) == []
+
+    hub.tmpdata_expiry["export_limit"] = time.time() - 1
+    assert hub._sensors_to_publish(group) == [number]
+
+    hub.tmpdata_expiry["export_limit"] = 0  # reset by native_value when it falls back to the polled value
+    assert hub._sensors_to_publish(group) == []
+
+
+def test_snapshot_reads_through_and_records_only_written_keys() -> None:
+    base = {"raw": 1, "static": 5, "gone": 3}
+    snapshot = PollSnapshot(base)
+
+    snapshot["raw"] = 2
+    snapshot.pop("gone")
+    snapshot["raw"] = 3
+
+    assert base == {"raw": 1, "static": 5, "gone": 3}
+    assert dict(snapshot) == {"raw": 3, "static": 5}
+    assert "gone" not in snapshot and snapshot.get("gone", 0) == 0
+    assert snapshot.written.keys() == {"raw", "gone"}
+    assert dict(snapshot.previous_view()) == base
+
+
+@pytest.mark.asyncio
+async def test_groups_with_read_preparation_are_serialized() -> None:
     hub = make_hub()
     active_reads = 0
     maximum_active_reads = 0
@@ -415,6 +531,7 @@ async def test_group_reads_are_serialized() -> None:
     hub.async_read_modbus_registers_all = read_group
     first_group = make_group()
     second_group = make_group()
+    first_group.readPreparation = second_group.readPreparation = AsyncMock(return_value=True)
 
     first_result, second_result = await asyncio.gather(
         hub.async_read_modbus_data(first_group),
@@ -426,13 +543,45 @@ async def test_group_reads_are_serialized() -> None:
     assert maximum_active_reads == 1
 
 
+@pytest.mark.asyncio
+async def test_fast_group_reads_between_the_blocks_of_a_slow_group() -> None:
+    hub = make_hub()
+    hub._lock = PriorityBusLock()
+    reads: list[int] = []
+
+    async def read_block(data: dict[str, Any], block: Any, typ: str) -> BlockReadResult:
+        async with hub._lock:
+            reads.append(block.start)
+            await asyncio.sleep(0)
+        data[f"reg{block.start}"] = block.start
+        return successful_block(f"reg{block.start}")
+
+    hub.async_read_modbus_block = read_block
+    slow_group = make_group()
+    slow_group.holdingBlocks.append(SimpleNamespace(start=3))
+    fast_group = make_group()
+    fast_group.holdingBlocks = [SimpleNamespace(start=10)]
+
+    async def poll(group: Any, interval: int) -> PollOutcome:
+        with bus_priority(interval):
+            return await hub.async_read_modbus_data(group)
+
+    outcomes = await asyncio.gather(poll(slow_group, 60), poll(fast_group, 5))
+
+    assert outcomes == [PollOutcome.SUCCESS, PollOutcome.SUCCESS]
+    assert reads == [1, 10, 2, 3]
+    assert slow_group.changed_keys == {"reg1", "reg2", "reg3"}
+    assert fast_group.changed_keys == {"reg10"}
+    assert {key: hub.data[key] for key in ("reg1", "reg2", "reg3", "reg10")} == {"reg1": 1, "reg2": 2, "reg3": 3, "reg10": 10}
+
+
 @pytest.mark.asyncio
 async def test_successful_but_discarded_snapshot_does_not_publish_group() -> None:
     hub = make_hub()
     sensor = Mock()
     group = make_group()
     group.sensors = [sensor]
-    interval_group = SimpleNamespace(device_groups={"test": group})
+    interval_group = SimpleNamespace(interval=5, device_groups={"test": group})
     hub.blocks_changed = False
     hub.cyclecount = 1
     hub.sleepnone = []
@@ -460,7 +609,7 @@ async def test_slowdown_skip_does_not_read_or_change_slowdown() -> None:
     hub.sleepnone = []
     hub.sleepzero = []
     hub.async_read_modbus_data = AsyncMock(return_value=PollOutcome.SUCCESS)
-    interval_group = SimpleNamespace(device_groups={"test": make_group()})
+    interval_group = SimpleNamespace(interval=5, device_groups={"test": make_group()})
 
     outcome, updated_sensors = await hub._refresh_interval_group_once(interval_group)
 
@@ -482,7 +631,7 @@ async def test_partial_poll_publishes_updates_without_enabling_slowdown() -> Non
     hub.sleepnone = []
     hub.sleepzero = []
     hub.async_read_modbus_data = AsyncMock(return_value=PollOutcome.PARTIAL)
-    interval_group = SimpleNamespace(device_groups={"test": group})
+    interval_group = SimpleNamespace(interval=5, device_groups={"test": group})
 
     outcome, updated_sensors = await hub._refresh_interval_group_once(interval_group)
 
@@ -508,10 +657,11 @@ async def test_any_failed_device_group_enables_slowdown_regardless_of_order(grou
     hub.sleepzero = []
     hub.async_read_modbus_data = AsyncMock(side_effect=group_outcomes)
     interval_group = SimpleNamespace(
+        interval=5,
         device_groups={
             "first": make_group(),
             "second": make_group(),
-        }
+        },
     )
 
     outcome, _updated_sensors = await hub._refresh_interval_group_once(interval_group)
@@ -530,10 +680,11 @@ async def test_successful_aggregate_restores_normal_polling_after_all_groups() -
     hub.sleepzero = []
     hub.async_read_modbus_data = AsyncMock(side_effect=[PollOutcome.DISCARDED, PollOutcome.SUCCESS])
     interval_group = SimpleNamespace(
+        interval=5,
         device_groups={
             "discarded": make_group(),
             "success": make_group(),
-        }
+        },
     )
 
     outcome, _updated_sensors = await hub._refresh_interval_group_once(interval_group, bypass_slowdown=True)
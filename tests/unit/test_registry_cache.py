@@ -0,0 +1,53 @@
+"""Tests for the per-hub entity registry cache."""
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from custom_components.solax_modbus import should_register_be_loaded
+from custom_components.solax_modbus.const import BaseModbusSensorEntityDescription
+from custom_components.solax_modbus.registry_cache import EntityRegistryCache
+
+
+def fake_registry(monkeypatch: pytest.MonkeyPatch, entries: dict[tuple[str, str], bool]) -> Mock:
+    """Patch the entity registry with entries mapping (platform, unique_id) to disabled."""
+    registry = Mock()
+    registry.async_get_entity_id.side_effect = lambda platform, domain, unique_id: (
+        f"{platform}.{unique_id}" if (platform, unique_id) in entries else None
+    )
+    registry.async_get.side_effect = lambda entity_id: SimpleNamespace(disabled=entries[tuple(entity_id.split(".", 1))])
+    monkeypatch.setattr("custom_components.solax_modbus.registry_cache.er.async_get", lambda _hass: registry)
+    return registry
+
+
+def test_answers_are_cached_until_the_registry_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    entries = {("sensor", "hub_pv_power"): False, ("sensor", "hub_grid_power"): True}
+    registry = fake_registry(monkeypatch, entries)
+    listeners: list[Any] = []
+    hass: Any = SimpleNamespace(bus=SimpleNamespace(async_listen=lambda event, listener: listeners.append(listener) or Mock()))
+    cache = EntityRegistryCache()
+    cache.listen(hass)
+
+    for _ in range(3):
+        assert cache.enabled(hass, "sensor", "hub_pv_power") is True
+        assert cache.enabled(hass, "sensor", "hub_grid_power") is False
+        assert cache.enabled(hass, "sensor", "hub_unknown") is None
+    assert registry.async_get_entity_id.call_count == 3
+
+    entries[("sensor", "hub_grid_power")] = False
+    listeners[0](SimpleNamespace(data={"action": "update", "entity_id": "sensor.hub_grid_power"}))
+
+    assert cache.enabled(hass, "sensor", "hub_grid_power") is True
+
+
+def test_should_register_be_loaded_uses_the_hub_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    registry = fake_registry(monkeypatch, {("number", "hub_export_limit"): True, ("sensor", "hub_export_limit"): False})
+    hub = SimpleNamespace(name="hub", _name="hub", _registry_cache=EntityRegistryCache())
+    descriptor = BaseModbusSensorEntityDescription(key="export_limit", register=0x10)
+
+    assert should_register_be_loaded(Mock(), hub, descriptor)
+    calls = registry.async_get_entity_id.call_count
+    assert should_register_be_loaded(Mock(), hub, descriptor)
+    assert registry.async_get_entity_id.call_count == calls
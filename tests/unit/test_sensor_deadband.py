@@ -0,0 +1,92 @@
+import time
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import Mock
+
+import pytest
+
+import custom_components.solax_modbus.sensor as sensor_module
+from custom_components.solax_modbus import SolaXModbusHub
+from custom_components.solax_modbus.const import BaseModbusSensorEntityDescription
+from custom_components.solax_modbus.sensor import SolaXModbusSensor
+
+
+def _make_sensor(monkeypatch: pytest.MonkeyPatch, clock: list[float], **policy: Any) -> tuple[SolaXModbusSensor, Any, Mock]:
+    monkeypatch.setattr(sensor_module, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    hub = SimpleNamespace(data={"grid_voltage": 230.0})
+    description = BaseModbusSensorEntityDescription(name="Grid Voltage", key="grid_voltage", **policy)
+    sensor = SolaXModbusSensor("SolaX", hub, cast(Any, None), description)
+    write = Mock()
+    cast(Any, sensor).async_write_ha_state = write
+    return sensor, hub, write
+
+
+def test_values_inside_the_deadband_are_held_back_until_max_silence(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [100.0]
+    sensor, hub, write = _make_sensor(monkeypatch, clock, deadband=0.5, max_silence=60)
+
+    sensor.modbus_data_updated()
+    for voltage in (230.2, 229.6, 230.5):
+        clock[0] += 5
+        hub.data["grid_voltage"] = voltage
+        sensor.modbus_data_updated()
+    assert write.call_count == 1
+
+    hub.data["grid_voltage"] = 231.0
+    sensor.modbus_data_updated()
+    assert write.call_count == 2
+
+    clock[0] += 60
+    hub.data["grid_voltage"] = 231.1
+    sensor.modbus_data_updated()
+    assert write.call_count == 3
+
+
+def test_relative_deadband_scales_with_the_last_published_value(monkeypatch: pytest.MonkeyPatch) -> None:
+    sensor, hub, write = _make_sensor(monkeypatch, [0.0], deadband_relative=0.01)
+
+    sensor.modbus_data_updated()
+    hub.data["grid_voltage"] = 232.0  # within 1 % of 230
+    sensor.modbus_data_updated()
+    hub.data["grid_voltage"] = 233.0
+    sensor.modbus_data_updated()
+
+    assert write.call_count == 2
+
+
+def test_without_deadband_and_for_non_numeric_values_every_update_is_published(monkeypatch: pytest.MonkeyPatch) -> None:
+    sensor, hub, write = _make_sensor(monkeypatch, [0.0])
+    sensor.modbus_data_updated()
+    sensor.modbus_data_updated()
+    assert write.call_count == 2
+
+    sensor, hub, write = _make_sensor(monkeypatch, [0.0], deadband=5)
+    sensor.modbus_data_updated()
+    hub.data["grid_voltage"] = None
+    sensor.modbus_data_updated()
+    hub.data["grid_voltage"] = 230.0
+    sensor.modbus_data_updated()
+    assert write.call_count == 3
+
+
+def test_hub_publishes_a_held_back_value_once_max_silence_has_passed(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [100.0]
+    sensor, hub, write = _make_sensor(monkeypatch, clock, deadband=0.5, max_silence=60)
+
+    sensor.modbus_data_updated()
+    hub.data["grid_voltage"] = 230.2
+    sensor.modbus_data_updated()  # held back, the key does not change in later polls
+    assert write.call_count == 1
+    assert sensor.held_back_until == 160.0
+
+    clock[0] = 160.0
+    sensor.modbus_data_updated()
+    assert write.call_count == 2
+    assert sensor.held_back_until is None
+
+    solax_hub = cast(Any, object.__new__(SolaXModbusHub))
+    held_back = SimpleNamespace(entity_description=SimpleNamespace(key="grid_voltage"), held_back_until=time.monotonic() + 1)
+    group = SimpleNamespace(sensors=[held_back], changed_keys=set(), last_full_publish=time.monotonic())
+    assert solax_hub._sensors_to_publish(group) == []
+    held_back.held_back_until = time.monotonic() - 1
+    assert solax_hub._sensors_to_publish(group) == [held_back]
@@ -0,0 +1,28 @@
+"""Tests for the preparation of the sensor descriptions of a plugin."""
+
+from types import SimpleNamespace
+from typing import Any
+
+from custom_components.solax_modbus import sensor
+from custom_components.solax_modbus.plugin_solax import GEN4, HYBRID, X1, X3
+from custom_components.solax_modbus.plugin_solax import plugin_instance as solax_plugin
+from custom_components.solax_modbus.sensor import prepare_sensor_descriptions
+
+
+def make_hub(invertertype: int) -> Any:
+    return SimpleNamespace(plugin=solax_plugin, _invertertype=invertertype, seriesnumber="H4501234567", modbus_protocol_version=None, data={})
+
+
+def test_prepared_descriptions_are_reused_for_the_same_inverter() -> None:
+    hub = make_hub(HYBRID | GEN4 | X1)
+
+    first = prepare_sensor_descriptions(hub, solax_plugin.SENSOR_TYPES, "", "", "SENSOR_TYPES")
+    again = prepare_sensor_descriptions(make_hub(HYBRID | GEN4 | X1), solax_plugin.SENSOR_TYPES, "", "", "SENSOR_TYPES")
+    uncached = prepare_sensor_descriptions(hub, solax_plugin.SENSOR_TYPES, "", "")
+    other_type = prepare_sensor_descriptions(make_hub(HYBRID | GEN4 | X3), solax_plugin.SENSOR_TYPES, "", "", "SENSOR_TYPES")
+
+    assert again is first
+    assert uncached == first and uncached is not first
+    assert other_type != first
+    assert len(sensor._prepared_descriptions) == 1  # the other inverter type replaced the entry of the same device
+    assert all("{}" not in descr.key for descr in first)